@@ -50,7 +50,7 @@ from pymatviz.cluster.composition import cluster_compositions
 from pymatviz.coordination import coordination_hist, coordination_vs_cutoff_line
 from pymatviz.enums import Key, angstrom_per_atom, cubic_angstrom, eV
 from pymatviz.histogram import elements_hist, histogram
-from pymatviz.io import df_to_html, df_to_pdf, df_to_svg, save_fig
+from pymatviz.io import df_to_html, df_to_pdf, df_to_svg, save_fig, save_figs
 from pymatviz.notebook import notebook_mode
 from pymatviz.phonons import phonon_bands, phonon_bands_and_dos, phonon_dos
 from pymatviz.process_data import (
@@ -67,7 +67,7 @@ from pymatviz.ptable import (
     ptable_scatter_plotly,
 )
 from pymatviz.rainclouds import rainclouds
-from pymatviz.rdf.figures import element_pair_rdfs, full_rdf
+from pymatviz.rdf.figures import element_pair_rdfs, full_rdf, trajectory_rdfs
 from pymatviz.sankey import sankey_from_2_df_cols
 from pymatviz.scatter import (
     density_hexbin,
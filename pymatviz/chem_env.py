@@ -6,10 +6,28 @@ using pymatgen's ChemEnv and local environment modules.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import time
+import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache, partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from concurrent.futures import Future
+    from typing import Any
+
+    from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import (  # noqa: E501
+        LocalGeometryFinder,
+    )
+    from pymatgen.analysis.local_env import CrystalNN, LocalStructOrderParams
     from pymatgen.core import IStructure, Structure
 
 
@@ -41,8 +59,92 @@ def get_cn_from_symbol(ce_symbol: str, symbol_cn_mapping: dict[str, int]) -> int
     return 0
 
 
+@cache
+def _get_crystal_nn() -> CrystalNN:
+    """Shared CrystalNN instance (construction loads element radii tables)."""
+    from pymatgen.analysis.local_env import CrystalNN
+
+    return CrystalNN()
+
+
+# max number of structures whose CrystalNN neighbor info is kept in memory
+NN_INFO_CACHE_SIZE = 256
+_nn_info_cache: OrderedDict[str, dict[int, list[dict[str, Any]]]] = OrderedDict()
+
+
+def _structure_key(structure: Structure | IStructure) -> str:
+    """Hash of everything CrystalNN neighbors depend on (lattice, sites, species)."""
+    digest = hashlib.sha256(structure.lattice.matrix.tobytes())
+    digest.update(str(structure.lattice.pbc).encode())
+    digest.update(structure.frac_coords.tobytes())
+    digest.update("\0".join(site.species_string for site in structure).encode())
+    return digest.hexdigest()
+
+
+def get_crystal_nn_info(
+    structure: Structure | IStructure, site_idx: int
+) -> list[dict[str, Any]]:
+    """CrystalNN.get_nn_info() for a site, cached per structure and site.
+
+    Shared by classify_local_env_with_order_params and the CrystalNN-based
+    chem_env_sunburst and chem_env_treemap so neighbors of a site are only computed
+    once. Structures are keyed by content, so equal copies share cache entries and
+    modified structures don't return stale neighbors. The least recently used
+    structures are evicted beyond NN_INFO_CACHE_SIZE.
+
+    Args:
+        structure (Structure | IStructure): The crystal structure.
+        site_idx (int): Index of the site to get neighbors for.
+
+    Returns:
+        list[dict[str, Any]]: Neighbor info dicts with keys site, image, weight and
+            site_index.
+    """
+    key = _structure_key(structure)
+    site_nn_infos = _nn_info_cache.pop(key, {})
+    _nn_info_cache[key] = site_nn_infos  # (re-)insert as most recently used
+    while len(_nn_info_cache) > NN_INFO_CACHE_SIZE:
+        _nn_info_cache.popitem(last=False)
+
+    if site_idx not in site_nn_infos:
+        site_nn_infos[site_idx] = _get_crystal_nn().get_nn_info(
+            structure,  # type: ignore[arg-type]
+            site_idx,
+        )
+    return site_nn_infos[site_idx]
+
+
+@cache
+def _get_local_struct_order_params(
+    cn_val: int,
+) -> tuple[list[str], LocalStructOrderParams]:
+    """Get order parameter names and LocalStructOrderParams instance for a CN.
+
+    Cached per CN so the CN_OPT_PARAMS parsing and order parameter setup only
+    happens once per coordination number rather than once per site.
+    """
+    from pymatgen.analysis import local_env
+
+    names = list(local_env.CN_OPT_PARAMS[cn_val])
+    types = []
+    params = []
+    for name in names:
+        types.append(local_env.CN_OPT_PARAMS[cn_val][name][0])
+        tmp = (
+            local_env.CN_OPT_PARAMS[cn_val][name][1]
+            if len(local_env.CN_OPT_PARAMS[cn_val][name]) > 1
+            else None
+        )
+        params.append(tmp)
+
+    return names, local_env.LocalStructOrderParams(types, parameters=params)
+
+
 def classify_local_env_with_order_params(
-    structure: Structure | IStructure, site_idx: int, cn_val: int
+    structure: Structure | IStructure,
+    site_idx: int,
+    cn_val: int,
+    nn_info: list[dict[str, Any]] | None = None,
 ) -> str:
     """Classify local coordination environment using LocalStructOrderParams.
 
@@ -53,6 +155,9 @@ def classify_local_env_with_order_params(
         structure (Structure | IStructure): The crystal structure
         site_idx (int): Index of the site to analyze
         cn_val (int): Coordination number of the site
+        nn_info (list[dict[str, Any]] | None): CrystalNN.get_nn_info() result for
+            this site if already computed by the caller. Defaults to None, meaning
+            use get_crystal_nn_info().
 
     Returns:
         str: String describing the coordination environment (e.g. "T:4", "O:6", "CN:8")
@@ -64,25 +169,12 @@ def classify_local_env_with_order_params(
         if cn_val not in [int(k_cn) for k_cn in local_env.CN_OPT_PARAMS]:
             return f"CN:{cn_val}"
 
-        # Get the parameter names and settings for this CN
-        names = list(local_env.CN_OPT_PARAMS[cn_val])
-        types = []
-        params = []
-        for name in names:
-            types.append(local_env.CN_OPT_PARAMS[cn_val][name][0])
-            tmp = (
-                local_env.CN_OPT_PARAMS[cn_val][name][1]
-                if len(local_env.CN_OPT_PARAMS[cn_val][name]) > 1
-                else None
-            )
-            params.append(tmp)
-
-        # Create LocalStructOrderParams instance
-        local_ops = local_env.LocalStructOrderParams(types, parameters=params)
+        # Get the parameter names and LocalStructOrderParams for this CN
+        names, local_ops = _get_local_struct_order_params(cn_val)
 
         # Get neighboring sites using CrystalNN
-        crystal_nn = local_env.CrystalNN()
-        nn_info = crystal_nn.get_nn_info(structure=structure, n=site_idx)  # type: ignore[arg-type]
+        if nn_info is None:
+            nn_info = get_crystal_nn_info(structure, site_idx)
 
         # Create sites list: central site + neighbors
         sites = [structure[site_idx]] + [info["site"] for info in nn_info]
@@ -113,3 +205,300 @@ def classify_local_env_with_order_params(
         return f"CN:{cn_val}"
     else:
         return f"CN:{cn_val}"  # Fallback to generic CN label
+
+
+def _setup_chem_env(
+    settings: dict[str, Any],
+) -> tuple[LocalGeometryFinder, dict[str, int]]:
+    """Set up ChemEnv's LocalGeometryFinder and CE symbol to CN mapping. Slow, so
+    done once per process and reused for all structures.
+    """
+    import pymatgen.analysis.chemenv.coordination_environments.coordination_geometries as coord_geoms  # noqa: E501
+    import pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder as coord_finder  # noqa: E501
+
+    lgf = coord_finder.LocalGeometryFinder()
+    lgf.setup_parameters(**settings)
+    all_coord_geoms = coord_geoms.AllCoordinationGeometries()
+    return lgf, all_coord_geoms.get_symbol_cn_mapping()
+
+
+def _coord_envs_for_structure(
+    structure: Structure | IStructure,
+    settings: dict[str, Any],
+    lgf: LocalGeometryFinder | None = None,
+    symbol_cn_mapping: dict[str, int] | None = None,
+) -> dict[tuple[int, str], int]:
+    """Count (CN, CE symbol) pairs of all sites in a structure with ChemEnv."""
+    import pymatgen.analysis.chemenv.coordination_environments.structure_environments as struct_envs  # noqa: E501
+    from pymatgen.analysis.chemenv.coordination_environments import chemenv_strategies
+
+    if lgf is None or symbol_cn_mapping is None:
+        lgf, symbol_cn_mapping = _setup_chem_env(settings)
+
+    lgf.setup_structure(structure=structure)  # type: ignore[arg-type]
+    structure_environments = lgf.compute_structure_environments()
+    lse = struct_envs.LightStructureEnvironments.from_structure_environments(
+        chemenv_strategies.SimplestChemenvStrategy(), structure_environments
+    )
+
+    coord_envs_dict: dict[tuple[int, str], int] = {}
+    for env_list in lse.coordination_environments or []:
+        for coord_env in env_list or []:
+            ce_symbol = coord_env["ce_symbol"]
+            cn_val = get_cn_from_symbol(ce_symbol, symbol_cn_mapping)
+            key = (cn_val, ce_symbol)
+            coord_envs_dict[key] = coord_envs_dict.get(key, 0) + 1
+
+    return coord_envs_dict
+
+
+def _coord_envs_cache_path(
+    cache_dir: Path, structure: Structure | IStructure, settings: dict[str, Any]
+) -> Path:
+    """Cache file for a structure's ChemEnv result, keyed by structure and settings."""
+    payload = json.dumps(
+        {"structure": structure.as_dict(), "settings": settings},
+        sort_keys=True,
+        default=str,
+    )
+    return cache_dir / f"{hashlib.sha256(payload.encode()).hexdigest()}.json"
+
+
+def compute_coord_envs(
+    structures: Iterable[Structure | IStructure],
+    chem_env_settings: dict[str, Any] | None = None,
+    *,
+    n_jobs: int | None = 1,
+    timeout: float | None = None,
+    cache_dir: str | Path | None = None,
+) -> list[dict[tuple[int, str], int] | None]:
+    """Count coordination environments (CN, CE symbol) per structure with ChemEnv.
+
+    ChemEnv can take tens of seconds per structure, so this supports running
+    structures in parallel worker processes with a per-structure timeout and
+    caching finished results on disk. Cached counts are keyed by structure and
+    ChemEnv settings (not by how they are later plotted), so re-running with e.g.
+    different max_slices reuses them.
+
+    Args:
+        structures (Iterable[Structure | IStructure]): Structures to analyze.
+        chem_env_settings (dict[str, Any] | None): Keywords for
+            LocalGeometryFinder.setup_parameters(). Defaults to None.
+        n_jobs (int | None): Number of worker processes. Set to 1 to run serially
+            in the current process (default). Set to None to use all available cores.
+        timeout (float | None): Max seconds per structure. Structures exceeding it
+            are skipped with a warning. Requires worker processes, so any timeout
+            runs structures in subprocesses even if n_jobs=1. Defaults to None.
+        cache_dir (str | Path | None): Directory for the on-disk result cache. If
+            None (default), nothing is cached.
+
+    Returns:
+        list[dict[tuple[int, str], int] | None]: For each structure, a map of
+            (CN, CE symbol) to number of sites, or None if analysis failed or
+            timed out.
+    """
+    settings = chem_env_settings or {}
+    structs = list(structures)
+    results: list[dict[tuple[int, str], int] | None] = [None] * len(structs)
+
+    cache_paths: list[Path | None] = [None] * len(structs)
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for idx, struct in enumerate(structs):
+            cache_path = _coord_envs_cache_path(cache_dir, struct, settings)
+            cache_paths[idx] = cache_path
+            if cache_path.is_file():
+                with open(cache_path) as file:
+                    results[idx] = {
+                        (cn_val, ce_symbol): count
+                        for cn_val, ce_symbol, count in json.load(file)
+                    }
+
+    todo = [idx for idx, result in enumerate(results) if result is None]
+
+    # on both paths, ChemEnv errors (ImportError, RuntimeError) and timeouts skip a
+    # structure with a warning while other errors (i.e. bugs or invalid settings)
+    # are raised
+    try:
+        if n_jobs == 1 and timeout is None:
+            lgf, symbol_cn_mapping = _setup_chem_env(settings)
+            outcomes: list[Any] = []
+            for idx in todo:
+                try:
+                    outcomes += [
+                        _coord_envs_for_structure(
+                            structs[idx], settings, lgf, symbol_cn_mapping
+                        )
+                    ]
+                except (ImportError, RuntimeError) as exc:
+                    outcomes += [exc]
+        else:
+            outcomes = _map_in_subprocesses(
+                _coord_envs_for_structure,
+                [(structs[idx], settings) for idx in todo],
+                n_jobs=n_jobs,
+                timeout=timeout,
+                initializer=partial(_setup_chem_env, settings),
+            )
+    except (ImportError, RuntimeError) as exc:
+        warnings.warn(f"ChemEnv setup failed: {exc}", UserWarning, stacklevel=3)
+        return results
+
+    for idx, outcome in zip(todo, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, (ImportError, RuntimeError, TimeoutError)):
+                raise outcome
+            action = "timed out" if isinstance(outcome, TimeoutError) else "failed"
+            warnings.warn(
+                f"ChemEnv analysis {action} for structure: {outcome}",
+                UserWarning,
+                stacklevel=3,
+            )
+            continue
+        results[idx] = outcome
+        if cache_path := cache_paths[idx]:
+            # write to temp file + rename so interrupted runs never leave partial files
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, mode="w") as file:
+                json.dump([[*key, count] for key, count in outcome.items()], file)
+            os.replace(tmp_path, cache_path)
+
+    return results
+
+
+# per worker process result (or error) of _map_in_subprocesses' initializer
+_worker_setup: tuple[Any, ...] | Exception = ()
+
+
+def _init_pool_worker(initializer: Callable[[], tuple[Any, ...]]) -> None:
+    """Run initializer once per worker process and keep its result for all tasks
+    of that worker. Errors are re-raised by each task instead of breaking the pool.
+    """
+    global _worker_setup  # noqa: PLW0603
+    try:
+        _worker_setup = initializer()
+    except Exception as exc:  # noqa: BLE001
+        _worker_setup = exc
+
+
+def _run_with_worker_setup(func: Callable[..., Any], args: tuple[Any, ...]) -> Any:
+    """Call func(*args, *initializer()) in a worker process of _map_in_subprocesses."""
+    if isinstance(_worker_setup, Exception):
+        raise _worker_setup
+    return func(*args, *_worker_setup)
+
+
+def _stop_pool(executor: ProcessPoolExecutor, *, terminate: bool) -> None:
+    """Shut down a process pool, killing its workers first if terminate is True."""
+    if terminate:
+        if hasattr(executor, "terminate_workers"):  # Python 3.14+
+            executor.terminate_workers()
+        else:
+            for proc in list((executor._processes or {}).values()):
+                proc.terminate()
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _map_in_subprocesses(
+    func: Callable[..., Any],
+    args_list: Sequence[tuple[Any, ...]],
+    *,
+    n_jobs: int | None = None,
+    timeout: float | None = None,
+    initializer: Callable[[], tuple[Any, ...]] | None = None,
+    max_startup_failures: int = 3,
+) -> list[Any]:
+    """Like ProcessPoolExecutor.map but tasks exceeding timeout are terminated
+    without stalling the remaining ones.
+
+    Each of the n_jobs worker processes calls initializer once and appends its
+    returned tuple to the args of every task it runs, so expensive setup is shared
+    across tasks. Only as many tasks as workers are submitted at a time so each
+    task's timeout starts when it starts running (incl. worker setup for the first
+    task of a worker). If a task times out or a worker dies, the pool is replaced
+    and unfinished tasks of other workers are resubmitted.
+
+    Returns:
+        list[Any]: Results in input order. Failed tasks return the raised exception,
+            timed-out tasks a TimeoutError and tasks that crash their worker process
+            a BrokenProcessPool error.
+
+    Raises:
+        BrokenProcessPool: If max_startup_failures pools in a row broke before
+            completing any task, e.g. because initializer crashes the process.
+    """
+    n_workers = min(n_jobs or os.cpu_count() or 1, len(args_list))
+    results: list[Any] = [None] * len(args_list)
+    pending = deque(range(len(args_list)))
+    suspects: set[int] = set()  # tasks that were running when a worker crashed
+    n_startup_failures = 0
+
+    while pending:
+        executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=None if initializer is None else _init_pool_worker,
+            initargs=() if initializer is None else (initializer,),
+        )
+        running: dict[Future[Any], tuple[int, float]] = {}  # -> (task idx, start)
+        n_finished, pool_broke, recycle_pool = 0, False, False
+        try:
+            while (pending or running) and not recycle_pool:
+                while pending and len(running) < n_workers:
+                    if pending[0] in suspects and running:
+                        break  # run suspects alone to find which task crashes
+                    idx = pending.popleft()
+                    future = executor.submit(
+                        _run_with_worker_setup, func, args_list[idx]
+                    )
+                    running[future] = (idx, time.monotonic())
+                    if idx in suspects:
+                        break
+
+                wait_time = None
+                if timeout is not None:
+                    first_start = min(start for _, start in running.values())
+                    wait_time = max(first_start + timeout - time.monotonic(), 0)
+                done, _ = wait(running, timeout=wait_time, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    idx, _ = running.pop(future)
+                    try:
+                        results[idx] = future.result()
+                    except BrokenProcessPool as exc:
+                        # all running tasks fail when one worker dies, so retry
+                        # them one by one and only fail the one that crashes alone
+                        pool_broke = recycle_pool = True
+                        if idx in suspects:
+                            results[idx] = exc
+                        else:
+                            suspects.add(idx)
+                            pending.appendleft(idx)
+                        continue
+                    except Exception as exc:  # noqa: BLE001
+                        results[idx] = exc
+                    n_finished += 1
+
+                if timeout is not None:
+                    now = time.monotonic()
+                    for future, (idx, start) in list(running.items()):
+                        if now - start >= timeout:
+                            del running[future]
+                            results[idx] = TimeoutError(f"exceeded {timeout=} sec")
+                            recycle_pool = True
+        finally:
+            # resubmit tasks that were still running in a pool that's replaced
+            pending.extendleft(idx for idx, _ in running.values())
+            _stop_pool(executor, terminate=recycle_pool or bool(running))
+
+        if pool_broke and not n_finished:
+            n_startup_failures += 1
+        else:
+            n_startup_failures = 0
+        if n_startup_failures >= max_startup_failures:
+            raise BrokenProcessPool(
+                f"worker processes crashed {n_startup_failures} times in a row "
+                "before completing any task"
+            )
+
+    return results
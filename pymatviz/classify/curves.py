@@ -3,12 +3,12 @@
 from typing import Any, Literal, TypeAlias
 
 import numpy as np
-import pandas as pd
 import plotly.graph_objects as go
 import sklearn.metrics as skm
 from numpy.typing import ArrayLike
 
 from pymatviz.process_data import df_to_arrays
+from pymatviz.typing import DataFrameLike
 
 
 Predictions: TypeAlias = ArrayLike | str | dict[str, ArrayLike | dict[str, Any]]
@@ -31,8 +31,8 @@ def _standardize_input(
             - Predicted probabilities for positive class, or
             - dict of form {"name": probabilities}, or
             - dict of form {"name": {"probs_positive": np.array, **trace_kwargs}}
-        df (pd.DataFrame | None): Optional DataFrame containing targets and
-            probs_positive columns
+        df (DataFrameLike | None): Optional pandas, Polars or Arrow DataFrame
+            containing targets and probs_positive columns
         strict (bool): If True, check that probabilities are in [0, 1].
 
     Returns:
@@ -83,7 +83,7 @@ def _standardize_input(
 def roc_curve_plotly(
     targets: ArrayLike | str,
     probs_positive: Predictions,
-    df: pd.DataFrame | None = None,
+    df: DataFrameLike | None = None,
     *,
     no_skill: dict[str, Any] | Literal[False] | None = None,
     **kwargs: Any,
@@ -96,8 +96,8 @@ def roc_curve_plotly(
             - Predicted probabilities for positive class, or
             - dict of form {"name": probabilities}, or
             - dict of form {"name": {"probs_positive": np.array, **trace_kwargs}}
-        df (pd.DataFrame | None): Optional DataFrame containing targets and
-            probs_positive columns
+        df (DataFrameLike | None): Optional pandas, Polars or Arrow DataFrame
+            containing targets and probs_positive columns
         no_skill (dict[str, Any] | False): Options for no-skill baseline
             or False to hide it. Commonly needed keys:
             - show_legend: bool = True
@@ -183,7 +183,7 @@ def roc_curve_plotly(
 def precision_recall_curve_plotly(
     targets: ArrayLike | str,
     probs_positive: Predictions,
-    df: pd.DataFrame | None = None,
+    df: DataFrameLike | None = None,
     *,
     no_skill: dict[str, Any] | Literal[False] | None = None,
     **kwargs: Any,
@@ -196,8 +196,8 @@ def precision_recall_curve_plotly(
             - Predicted probabilities for positive class, or
             - dict of form {"name": probabilities}, or
             - dict of form {"name": {"probs_positive": np.array, **trace_kwargs}}
-        df (pd.DataFrame | None): Optional DataFrame containing targets and
-            probs_positive columns
+        df (DataFrameLike | None): Optional pandas, Polars or Arrow DataFrame
+            containing targets and probs_positive columns
         no_skill (dict[str, Any] | False): Options for no-skill baseline
             or False to hide it. Commonly needed keys:
             - show_legend: bool = True
@@ -1,4 +1,8 @@
 """Coordination number analysis and visualization."""
 
 from pymatviz.coordination.figures import coordination_hist, coordination_vs_cutoff_line
-from pymatviz.coordination.helpers import CnSplitMode, coordination_nums_in_structure
+from pymatviz.coordination.helpers import (
+    CnSplitMode,
+    coordination_nums_in_structure,
+    site_coordination_nums,
+)
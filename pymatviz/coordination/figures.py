@@ -17,13 +17,13 @@ from pymatgen.analysis.local_env import NearNeighbors
 from pymatviz.colors import ELEM_COLORS_JMOL
 from pymatviz.coordination.helpers import (
     CnSplitMode,
-    calculate_average_cn,
+    calculate_average_cn_vs_cutoff,
     create_hover_text,
-    normalize_get_neighbors,
+    site_coordination_nums,
 )
 from pymatviz.enums import ElemColorScheme
 from pymatviz.process_data import normalize_structures
-from pymatviz.structure.helpers import get_site_elements, get_site_symbol
+from pymatviz.structure.helpers import get_site_symbol
 
 
 if TYPE_CHECKING:
@@ -105,14 +105,14 @@ def coordination_hist(
     elif not isinstance(hover_data, dict):
         raise TypeError(f"Invalid {hover_data=}")
 
-    get_neighbors = normalize_get_neighbors(strategy)
-
     for struct_key, structure in struct_dict.items():
         coord_data[struct_key] = {}
-        for idx, site in enumerate(structure):
-            cn = len(get_neighbors(site, structure))  # type: ignore[arg-type]
-            min_cn = min(min_cn, cn)
-            max_cn = max(max_cn, cn)
+        site_cns = site_coordination_nums(structure, strategy).tolist()  # type: ignore[arg-type]
+        if site_cns:
+            min_cn = min(min_cn, *site_cns)
+            max_cn = max(max_cn, *site_cns)
+        site_props = structure.site_properties if hover_data else {}
+        for idx, (site, cn) in enumerate(zip(structure, site_cns, strict=True)):
             elem_symbol = get_site_symbol(site)
             if elem_symbol not in coord_data[struct_key]:
                 coord_data[struct_key][elem_symbol] = {"cn": [], "hover_data": {}}
@@ -121,7 +121,7 @@ def coordination_hist(
                 if key not in coord_data[struct_key][elem_symbol]["hover_data"]:
                     coord_data[struct_key][elem_symbol]["hover_data"][key] = []
                 coord_data[struct_key][elem_symbol]["hover_data"][key].append(
-                    structure.site_properties.get(key, [None] * len(structure))[idx]
+                    site_props.get(key, [None] * len(structure))[idx]
                 )
 
     x_range = list(range(int(min_cn), int(max_cn) + 2))
@@ -455,21 +455,10 @@ def coordination_vs_cutoff_line(
     fig = make_subplots(**subplot_kwargs)
 
     for idx, (struct_name, structure) in enumerate(struct_dict.items(), start=1):
-        elements = sorted(
-            {
-                elem_symbol
-                for site in structure
-                for elem_symbol in get_site_elements(site)
-            }
-        )
-
-        for element in elements:
-            coord_numbers = []
-            for cutoff in cutoffs:
-                get_neighbors_fn = normalize_get_neighbors(strategy=cutoff)
-                avg_cn = calculate_average_cn(structure, element, get_neighbors_fn)  # type: ignore[arg-type]
-                coord_numbers.append(avg_cn)
+        # single neighbor search up to the max cutoff for all elements and cutoffs
+        avg_cns = calculate_average_cn_vs_cutoff(structure, cutoffs)  # type: ignore[arg-type]
 
+        for element, coord_numbers in avg_cns.items():
             color = element_colors.get(element)
             if isinstance(color, tuple) and len(color) == 3:
                 color = label_rgb(color)
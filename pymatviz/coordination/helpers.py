@@ -6,6 +6,7 @@ from collections import defaultdict
 from inspect import isclass
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 from pymatgen.analysis.local_env import NearNeighbors
 
 from pymatviz.enums import LabelEnum
@@ -13,7 +14,7 @@ from pymatviz.structure import helpers
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Hashable
+    from collections.abc import Callable, Hashable, Sequence
     from typing import Any
 
     from pymatgen.core import PeriodicSite, Structure
@@ -100,6 +101,82 @@ def calculate_average_cn(
     return cn_sum / len(element_sites) if element_sites else 0
 
 
+def calculate_average_cn_vs_cutoff(
+    structure: Structure, cutoffs: Sequence[float] | np.ndarray
+) -> dict[str, np.ndarray]:
+    """Calculate the average coordination number of each element at many cutoffs.
+
+    Runs a single neighbor search up to the largest cutoff and derives the
+    cumulative CN curves of all elements from the sorted neighbor distances,
+    instead of one neighbor search per (cutoff, element) as calculate_average_cn.
+
+    Args:
+        structure (Structure): A pymatgen Structure object.
+        cutoffs (Sequence[float] | np.ndarray): Cutoff distances in Angstroms.
+
+    Returns:
+        dict[str, np.ndarray]: Map of element symbols to arrays of average CNs (one
+            per cutoff). Disordered sites count towards every element they contain.
+    """
+    cutoffs = np.asarray(cutoffs, dtype=float)
+    site_elements = [helpers.get_site_elements(site) for site in structure]
+    elements = sorted(set().union(*site_elements))
+    if len(structure) == 0 or len(cutoffs) == 0:
+        return {elem: np.zeros(len(cutoffs)) for elem in elements}
+
+    # get_neighbors(site, r) includes neighbors up to r + numerical_tol
+    numerical_tol = 1e-8
+    center_indices, _, _, distances = structure.get_neighbor_list(
+        r=max(cutoffs.max(), 0), numerical_tol=numerical_tol
+    )
+
+    avg_cns: dict[str, np.ndarray] = {}
+    for elem in elements:
+        is_elem_site = np.array([elem in elems for elems in site_elements])
+        elem_dists = np.sort(distances[is_elem_site[center_indices]])
+        cn_sums = np.searchsorted(elem_dists, cutoffs + numerical_tol, side="right")
+        avg_cns[elem] = cn_sums / is_elem_site.sum()
+
+    return avg_cns
+
+
+def site_coordination_nums(
+    structure: Structure,
+    strategy: float | NearNeighbors | type[NearNeighbors] = 3.0,
+) -> np.ndarray:
+    """Get the coordination number of every site in a structure in one batch.
+
+    Float cutoffs use a single Structure.get_neighbor_list() call counted per site
+    with np.bincount. NearNeighbors strategies are driven by site index via
+    get_all_nn_info(), avoiding the O(N) structure.index(site) lookup per site.
+
+    Args:
+        structure (Structure): A pymatgen Structure object.
+        strategy (float | NearNeighbors | type[NearNeighbors]): Neighbor-finding
+            strategy. See coordination_nums_in_structure. Defaults to 3.0 Å cutoff.
+
+    Returns:
+        np.ndarray: Integer coordination numbers, one per site in structure order.
+    """
+    if isinstance(strategy, int | float):
+        center_indices, *_ = structure.get_neighbor_list(r=strategy)
+        return np.bincount(center_indices, minlength=len(structure))
+
+    if isclass(strategy) and issubclass(strategy, NearNeighbors):
+        strategy = strategy()
+    if isinstance(strategy, NearNeighbors):
+        if len(structure) == 0:
+            return np.zeros(0, dtype=int)
+        return np.array(
+            [len(nn_info) for nn_info in strategy.get_all_nn_info(structure)]
+        )
+
+    raise TypeError(
+        f"Invalid {strategy=}. Expected float, NearNeighbors instance, or "
+        "NearNeighbors subclass."
+    )
+
+
 def coordination_nums_in_structure(
     structure: Structure,
     strategy: float | NearNeighbors | type[NearNeighbors] = 3.0,
@@ -133,20 +210,19 @@ def coordination_nums_in_structure(
         >>> print(cns)
         {"Si": [4, 4, 4], "O": [2, 2, 2, 2, 2, 2]}
     """
-    get_neighbors = normalize_get_neighbors(strategy=strategy)
+    site_cns = site_coordination_nums(structure, strategy=strategy)
 
     # Store coordination numbers for each group
     cns: dict[str, list[int]] = defaultdict(list)
 
-    # Calculate CNs for all sites in the structure
-    for idx, site in enumerate(structure, start=1):
+    # Group CNs of all sites in the structure
+    for idx, (site, cn) in enumerate(zip(structure, site_cns, strict=True), start=1):
         site_species = helpers.get_site_species(site)
         key = {
             "element": helpers.get_site_symbol(site),
             "site": str(idx),
             "specie": str(site_species),  # Preserve oxidation state for specie mode
         }[group_by]
-        cn = len(get_neighbors(site, structure))
-        cns[key] += [cn]
+        cns[key] += [int(cn)]
 
     return cns
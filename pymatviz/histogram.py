@@ -33,7 +33,9 @@ def elements_hist(
     """Plot a histogram of elements (e.g. to show occurrence in a dataset) using Plotly.
 
     Args:
-        formulas (list[str]): compositional strings, e.g. ["Fe2O3", "Bi2Te3"].
+        formulas (list[str]): compositional strings, e.g. ["Fe2O3", "Bi2Te3"]. Can
+            also be an iterator over chunks of formulas for datasets that don't fit
+            in memory, e.g. pd.read_csv(path, usecols=["formula"], chunksize=10**5).
         count_mode ("composition" | "fractional_composition" | "reduced_composition"):
             Reduce or normalize compositions before counting. See `count_elements` for
             details. Only used when formulas is list of composition strings/objects.
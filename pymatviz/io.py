@@ -2,24 +2,32 @@
 
 from __future__ import annotations
 
-import copy
+import asyncio
+import base64
+import hashlib
+import json
 import os
 import subprocess
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from shutil import which
-from time import sleep
-from typing import TYPE_CHECKING
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, NamedTuple
 
 import numpy as np
+import plotly
 import plotly.graph_objects as go
+import plotly.io as pio
 from tqdm import tqdm
 
 import pymatviz as pmv
 from pymatviz.utils import ROOT
+from pymatviz.utils.plotting import to_typed_arrays
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Coroutine, Iterable, Sequence
     from pathlib import Path
     from typing import Any, Final, Literal
 
@@ -64,6 +72,109 @@ class TqdmDownload(tqdm):
         return self.update(n_blocks * block_size - self.n)
 
 
+def _round_floats(obj: Any, prec: int, *, in_array: bool = False) -> Any:
+    """Round all float arrays in a plotly JSON value to prec decimal places.
+
+    Handles plain (nested) lists and plotly's base64-encoded typed arrays, e.g.
+    marker.color, customdata, heatmap z or mesh vertices. Rounded arrays are returned
+    as lists so they're serialized as short decimal strings. Scalar properties
+    outside of arrays (like opacity) are left unchanged.
+    """
+    if isinstance(obj, float):
+        return round(obj, prec) if in_array else obj
+    if isinstance(obj, dict):
+        if obj.get("dtype") in ("f4", "f8") and "bdata" in obj:
+            arr = np.frombuffer(base64.b64decode(obj["bdata"]), dtype=obj["dtype"])
+            if shape := obj.get("shape"):
+                arr = arr.reshape([int(dim) for dim in str(shape).split(",")])
+            return np.round(arr.astype(float), prec).tolist()
+        return {key: _round_floats(val, prec) for key, val in obj.items()}
+    if isinstance(obj, list | tuple) and len(obj) > 0:
+        try:
+            arr = np.asarray(obj)
+        except ValueError:  # ragged nested lists
+            arr = np.asarray(obj, dtype=object)
+        if arr.dtype.kind == "f":
+            return np.round(arr, prec).tolist()
+        if arr.dtype.kind in "OUS":  # mixed types (e.g. floats and None or strings)
+            return [_round_floats(val, prec, in_array=True) for val in obj]
+    return obj
+
+
+@dataclass
+class FigCache:
+    """Content-hash cache to let save_fig() skip exports of unchanged figures.
+
+    Each output directory gets a small JSON index (named index_name) mapping file
+    names to a hash of the figure JSON, output format and export options. A file is
+    only re-exported if it's missing or its recorded hash differs.
+
+    Attributes:
+        index_name (str): File name of the per-directory sidecar index.
+        hits (int): Number of exports skipped since the file was up to date.
+        misses (int): Number of exports that had to be (re-)written.
+    """
+
+    index_name: str = ".pymatviz-fig-cache.json"
+    hits: int = 0
+    misses: int = 0
+    _indices: dict[str, dict[str, str]] = field(default_factory=dict, repr=False)
+
+    @staticmethod
+    def key(fig: go.Figure, path: str, **options: Any) -> str:
+        """Hash of the figure JSON, output format and export options."""
+        payload = json.dumps(
+            {
+                "format": os.path.splitext(path)[1].lower(),
+                "options": options,
+                "plotly": plotly.__version__,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        hasher = hashlib.sha256(fig.to_json().encode())
+        hasher.update(payload.encode())
+        return hasher.hexdigest()
+
+    def _index(self, out_dir: str) -> dict[str, str]:
+        """Load (once) and return the index of figure hashes for out_dir."""
+        if out_dir not in self._indices:
+            try:
+                with open(f"{out_dir}/{self.index_name}", encoding="utf-8") as file:
+                    self._indices[out_dir] = json.load(file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._indices[out_dir] = {}
+        return self._indices[out_dir]
+
+    def is_fresh(self, path: str, key: str) -> bool:
+        """Check if path exists and was last exported from a figure with this key.
+        Counts the outcome as cache hit or miss.
+        """
+        out_dir, filename = os.path.split(os.path.abspath(path))
+        fresh = os.path.isfile(path) and self._index(out_dir).get(filename) == key
+        if fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return fresh
+
+    def record(self, path: str, key: str) -> None:
+        """Save the key of a freshly exported file to its directory's index."""
+        out_dir, filename = os.path.split(os.path.abspath(path))
+        index = self._index(out_dir)
+        index[filename] = key
+        index_path = f"{out_dir}/{self.index_name}"
+        # write to temp file + rename so interrupted runs never leave partial files
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, mode="w", encoding="utf-8") as file:
+            json.dump(index, file, indent=2, sort_keys=True)
+        os.replace(tmp_path, index_path)
+
+
+# used by save_fig(cache=True), e.g. to check pmv.io.DEFAULT_FIG_CACHE.hits
+DEFAULT_FIG_CACHE: Final = FigCache()
+
+
 def save_fig(
     fig: go.Figure,
     path: str,
@@ -72,8 +183,10 @@ def save_fig(
     env_disable: Sequence[str] = ("CI",),
     pdf_sleep: float = 0.6,
     style: str = "",
-    prec: int | None = None,  # Added round keyword argument
+    prec: int | None = None,
     template: str | None = None,
+    typed_arrays: bool | Literal["float32"] = False,
+    cache: bool | FigCache = False,
     **kwargs: Any,
 ) -> None:
     """Write a plotly figure to disk (as HTML/PDF/SVG/...).
@@ -84,7 +197,7 @@ def save_fig(
     Args:
         fig (go.Figure): Plotly Figure object.
         path (str): Path to image file that will be created.
-        plotly_config (dict, optional): Configuration options for fig.write_html().
+        plotly_config (dict, optional): Configuration options for plotly.io.to_html().
             Defaults to dict(showTips=False, responsive=True, modeBarButtonsToRemove=
             ["lasso2d", "select2d", "autoScale2d", "toImage"]).
             See https://plotly.com/python/configuration-options.
@@ -95,38 +208,68 @@ def save_fig(
             https://github.com/plotly/plotly.py/issues/3469. Defaults to 0.6.
         style (str, optional): CSS style string to be inserted into the HTML file.
             Defaults to "". Only used if path ends with .svelte or .html.
-        prec (int, optional): Number of significant digits to keep for any float
-            in the exported file. Defaults to None (no rounding). Sensible values are
-            usually 4, 5, 6.
+        prec (int, optional): Number of decimal places to round float arrays in
+            fig.data to (x, y, z, marker.color, customdata, ...) in the exported file.
+            Defaults to None (no rounding). Sensible values are usually 4, 5, 6.
         template (str, optional): Temporary plotly to apply to the figure before
             saving. Will be reset to the original after. Defaults to "pymatviz_white" if
             path ends with .pdf or .pdfa, else None. Set to None to disable.
-        **kwargs: Keyword arguments passed to fig.write_html().
+        typed_arrays (bool | "float32", optional): Whether to embed numeric trace
+            arrays in .html/.svelte files as base64 typed arrays instead of decimal
+            text. "float32" additionally downcasts float64 arrays to float32. Makes
+            large figures several times smaller and faster to load but requires
+            plotly.js >= 2.28. Defaults to False.
+        cache (bool | FigCache, optional): Skip the export if path already holds the
+            same figure exported with the same options, as recorded in a sidecar
+            index file in the output directory. True uses DEFAULT_FIG_CACHE, pass a
+            FigCache instance for separate hit/miss stats. Defaults to False.
+        **kwargs: Keyword arguments passed to plotly.io.to_html() (.html/.svelte) or
+            fig.write_image() (other formats). fig.write_html()'s auto_open is
+            accepted but ignored for .html/.svelte files.
     """
     is_pdf = path.lower().endswith((".pdf", ".pdfa"))
     if template is None and is_pdf:
         template = "pymatviz_white"
 
-    if prec is not None:
-        # create a copy of figure and round all floats in fig.data to round significant
-        # figures
-        fig = copy.deepcopy(fig)
-        for trace in fig.data:
-            # trace is a go.Scatter or go.Bar or go.Heatmap or ...
-            if trace.x is not None:
-                trace.x = [
-                    round(x, prec) if isinstance(x, float) else x for x in trace.x
-                ]
-            if trace.y is not None:
-                trace.y = [
-                    round(y, prec) if isinstance(y, float) else y for y in trace.y
-                ]
     if any(var in os.environ for var in env_disable):
         return
 
     if not isinstance(fig, go.Figure):
         raise TypeError(f"Unsupported figure type {type(fig)}, expected plotly Figure")
-    if path.lower().endswith((".svelte", ".html")):
+
+    is_html = path.lower().endswith((".svelte", ".html"))
+    if is_html:
+        kwargs.pop("auto_open", None)  # fig.write_html() kwarg unknown to to_html()
+
+    fig_cache = DEFAULT_FIG_CACHE if cache is True else cache or None
+    if fig_cache is not None:
+        cache_key = fig_cache.key(
+            fig,
+            path,
+            plotly_config=plotly_config,
+            style=style,
+            prec=prec,
+            template=template,
+            typed_arrays=typed_arrays,
+            **kwargs,
+        )
+        if fig_cache.is_fresh(path, cache_key):
+            return
+
+    fig_dict: dict[str, Any] | None = None
+    if prec is not None:
+        # round the figure dict plotly serializes anyway instead of deep-copying and
+        # re-validating the figure, so fig itself is left untouched
+        fig_dict = fig.to_dict()
+        fig_dict["data"] = _round_floats(fig_dict["data"], prec)
+        for frame in fig_dict.get("frames", []):
+            frame["data"] = _round_floats(frame.get("data", []), prec)
+    if is_html:
+        if typed_arrays:
+            fig_dict = to_typed_arrays(
+                fig.to_dict() if fig_dict is None else fig_dict,
+                float32=typed_arrays == "float32",
+            )
         config = dict(
             showTips=False,
             modeBarButtonsToRemove=[
@@ -143,20 +286,34 @@ def save_fig(
         )
         config.update(plotly_config or {})
         fig_defaults = dict(include_plotlyjs=False, full_html=False, config=config)
-        fig.write_html(path, **fig_defaults | kwargs)
+        # build the final document in memory and write it once instead of
+        # re-reading and re-writing the file for each post-processing step
+        html = pio.to_html(
+            fig if fig_dict is None else fig_dict,
+            validate=fig_dict is None,
+            **fig_defaults | kwargs,
+        )
         if path.lower().endswith(".svelte"):
             # insert {...$$props} into top-level div to be able to post-process and
             # style plotly figures from within Svelte files
-            with open(path, encoding="utf-8") as file:
-                text = file.read().replace("<div>", "<div {...$$props}>", 1)
-            with open(path, mode="w", encoding="utf-8") as file:
-                # add trailing newline for pre-commit end-of-file commit hook
-                file.write(text + "\n")
+            html = html.replace("<div", "<div {...$$props}", 1)
+            html += "\n"  # add trailing newline for pre-commit end-of-file hook
         if style:
-            with open(path, mode="r+", encoding="utf-8") as file:
-                # replace first '<div ' with '<div {style=} '
-                file.write(file.read().replace("<div ", f"<div {style=} ", 1))
+            # replace first '<div ' with '<div {style=} '
+            html = html.replace("<div ", f"<div {style=} ", 1)
+        # write to temp file + rename so interrupted runs never leave partial files
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, mode="w", encoding="utf-8") as file:
+                file.write(html)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+            raise
     else:
+        if fig_dict is not None:
+            fig = go.Figure(fig_dict)
         orig_template = fig.layout.template
         if is_pdf and template:
             fig.layout.template = template
@@ -177,10 +334,148 @@ def save_fig(
         for trace in hidden_traces:
             trace.visible = "legendonly"
 
+    if fig_cache is not None:
+        fig_cache.record(path, cache_key)
+
+
+class FigExport(NamedTuple):
+    """Result of exporting one figure with save_figs()."""
+
+    path: str
+    duration: float  # seconds spent rendering and writing the file
+    error: Exception | None = None
+
+
+# figure with LaTeX title to make each Kaleido tab load MathJax before real exports
+MATHJAX_WARMUP_FIG: Final = {"data": [], "layout": {"title": {"text": "$x$"}}}
+IMAGE_EXTENSIONS: Final = ("png", "jpg", "jpeg", "webp", "svg", "pdf")
+
+
+def _run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run coroutine to completion, in a worker thread if an event loop is
+    already running (e.g. in Jupyter).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _write_images(
+    jobs: Sequence[tuple[dict[str, Any], str, dict[str, Any]]],
+    n_workers: int,
+    render_timeout: float | None,
+) -> list[FigExport]:
+    """Render figure dicts to image files concurrently in one warm Kaleido browser
+    with n_workers tabs.
+    """
+    import kaleido
+
+    async with kaleido.Kaleido(n=n_workers, timeout=render_timeout) as renderer:
+        # load MathJax once per tab instead of writing each PDF twice with a sleep
+        await asyncio.gather(
+            *(
+                renderer.calc_fig(MATHJAX_WARMUP_FIG, opts=dict(format="pdf"))
+                for _ in range(n_workers)
+            )
+        )
+        free_tabs = asyncio.Semaphore(n_workers)
+
+        async def write_image(
+            fig_dict: dict[str, Any], path: str, opts: dict[str, Any]
+        ) -> FigExport:
+            async with free_tabs:  # time rendering, not waiting for a free tab
+                start = perf_counter()
+                try:
+                    await renderer.write_fig(
+                        fig_dict, path=path, opts=opts, cancel_on_error=True
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    return FigExport(path, perf_counter() - start, exc)
+                return FigExport(path, perf_counter() - start)
+
+        return await asyncio.gather(*(write_image(*job) for job in jobs))
+
+
+def save_figs(
+    figs_and_paths: Iterable[tuple[go.Figure, str | Path]],
+    *,
+    n_workers: int = 4,
+    env_disable: Sequence[str] = ("CI",),
+    template: str | None = None,
+    timeout: float | None = 90,
+    **kwargs: Any,
+) -> list[FigExport]:
+    """Write many plotly figures to disk in one batch.
+
+    Image files (PNG/JPG/WEBP/SVG/PDF) are rendered concurrently by a single Kaleido
+    browser with n_workers tabs that stays alive for the whole batch, instead of
+    starting a renderer and writing each PDF twice with a sleep per save_fig() call.
+    MathJax is loaded once per tab up front. Other files (.html, .svelte) are passed
+    to save_fig(). Failures don't abort the batch but are returned per file.
+
+    Args:
+        figs_and_paths (Iterable[tuple[go.Figure, str | Path]]): Pairs of plotly
+            figures and paths to write them to. The file extension determines the
+            format.
+        n_workers (int, optional): Number of concurrent Kaleido renderers (browser
+            tabs). Defaults to 4.
+        env_disable (list[str], optional): Do nothing if any of these environment
+            variables are set. Defaults to ("CI",).
+        template (str, optional): Plotly template to apply to PDF exports (figures
+            themselves are not modified). Defaults to "pymatviz_white" like
+            save_fig().
+        timeout (float | None, optional): Max seconds to render any one image.
+            Defaults to 90.
+        **kwargs: Image options scale, width and height passed to Kaleido.
+
+    Returns:
+        list[FigExport]: Path, duration in seconds and exception (None on success)
+            for each figure, in input order.
+    """
+    if any(var in os.environ for var in env_disable):
+        return []
+
+    image_jobs: list[tuple[dict[str, Any], str, dict[str, Any]]] = []
+    results: dict[str, FigExport] = {}
+    paths: list[str] = []
+    for fig, fig_path in figs_and_paths:
+        path = str(fig_path)
+        paths.append(path)
+        ext = path.lower().rsplit(".", 1)[-1]
+        if ext not in IMAGE_EXTENSIONS:
+            start = perf_counter()
+            try:
+                save_fig(fig, path, env_disable=())
+            except Exception as exc:  # noqa: BLE001
+                results[path] = FigExport(path, perf_counter() - start, exc)
+            else:
+                results[path] = FigExport(path, perf_counter() - start)
+            continue
+
+        fig_dict = fig.to_dict()
+        if ext == "pdf":
+            pdf_template = pio.templates[template or "pymatviz_white"]
+            fig_dict["layout"]["template"] = pdf_template.to_plotly_json()
+        for trace in fig_dict["data"]:  # hide click-to-show traces like save_fig()
+            if trace.get("visible") == "legendonly":
+                trace["visible"] = False
+        image_jobs.append((fig_dict, path, dict(format=ext) | kwargs))
+
+    if image_jobs:
+        image_results = _run_coroutine(_write_images(image_jobs, n_workers, timeout))
+        results |= {result.path: result for result in image_results}
+
+    return [results[path] for path in paths]
+
 
 def save_and_compress_svg(
     fig: go.Figure,
     filename: str,
+    *,
+    cache: bool | FigCache = False,
 ) -> None:
     """Save Plotly figure as SVG and HTML to assets/ folder.
     Compresses SVG file with svgo CLI if available in PATH.
@@ -191,6 +486,9 @@ def save_and_compress_svg(
     Args:
         fig (go.Figure): Plotly Figure instance.
         filename (str): Name of SVG file (w/o extension).
+        cache (bool | FigCache, optional): Skip saving and compressing the SVG if the
+            figure is unchanged since the last export. See save_fig(). Defaults to
+            False.
 
     Raises:
         ValueError: If fig is None.
@@ -203,7 +501,11 @@ def save_and_compress_svg(
     else:
         filepath = filename
 
-    pmv.save_fig(fig, filepath)
+    fig_cache = DEFAULT_FIG_CACHE if cache is True else cache or None
+    n_hits = fig_cache.hits if fig_cache else 0
+    pmv.save_fig(fig, filepath, cache=fig_cache or False)
+    if fig_cache and fig_cache.hits > n_hits:
+        return  # unchanged figure, already compressed on a previous run
 
     # Compress SVG if svgo is available
     if (svgo := which("svgo")) is not None:
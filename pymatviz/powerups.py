@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
 from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, get_args
 
 import numpy as np
@@ -17,16 +19,173 @@ from pymatviz.utils.plotting import PRETTY_LABELS
 
 
 if TYPE_CHECKING:
+    from typing import Self
+
     from numpy.typing import ArrayLike
 
 TracePredicate = Callable[[go.Scatter], bool]
 TraceSelector = int | slice | Sequence[int] | TracePredicate
 AnnotationMode = Literal["per_trace", "combined", "none"]
+# metrics annotate_metrics() can compute from a ParityStats accumulator
+STREAMING_METRICS = ("MAE", "RMSE", "MSE", "MAPE", "R2", "R2_adj")
+
+
+@dataclass
+class ParityStats:
+    """Mergeable one-pass accumulator of parity plot statistics.
+
+    Keeps Welford-style running means and centered (co-)moments of x and y plus
+    running sums of absolute, squared and absolute percentage errors. MAE, RMSE,
+    R^2 and the least-squares fit of y on x can thus be computed from data that
+    arrives in chunks and never has to be materialized at once. Accumulators of
+    different chunks or processes are combined with merge() or +.
+
+    Example:
+        >>> stats = ParityStats()
+        >>> for chunk in pd.read_csv("preds.csv", chunksize=1_000_000):
+        ...     stats.update(chunk["dft_energy"], chunk["ml_energy"])
+        >>> fig = pmv.powerups.annotate_metrics(stats, fig=fig)
+        >>> fig = pmv.powerups.add_best_fit_line(fig, xs=stats)
+    """
+
+    n: int = 0
+    mean_x: float = 0.0
+    mean_y: float = 0.0
+    m2_x: float = 0.0  # sum of squared deviations of x from mean_x
+    m2_y: float = 0.0  # sum of squared deviations of y from mean_y
+    c_xy: float = 0.0  # sum of products of x and y deviations from their means
+    sum_abs_err: float = 0.0
+    sum_sq_err: float = 0.0
+    sum_abs_pct_err: float = 0.0  # relative to |x| like sklearn's MAPE
+    x_min: float = np.inf
+    x_max: float = -np.inf
+
+    @classmethod
+    def from_arrays(cls, xs: ArrayLike, ys: ArrayLike) -> Self:
+        """Create accumulator from x and y values (NaN pairs are skipped)."""
+        return cls().update(xs, ys)
+
+    def update(self, xs: ArrayLike, ys: ArrayLike) -> Self:
+        """Add a chunk of x and y values (NaN pairs are skipped) in place.
+
+        Args:
+            xs (array): x values (e.g. targets).
+            ys (array): y values (e.g. predictions), same shape as xs.
+
+        Returns:
+            ParityStats: self, updated with the new chunk.
+        """
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        if xs.shape != ys.shape:
+            raise ValueError(
+                f"xs and ys must have the same shape. Got {xs.shape} and {ys.shape}"
+            )
+        nan_mask = np.isnan(xs) | np.isnan(ys)
+        xs, ys = xs[~nan_mask], ys[~nan_mask]
+        if len(xs) == 0:
+            return self
+
+        mean_x, mean_y = xs.mean(), ys.mean()
+        dev_x, dev_y = xs - mean_x, ys - mean_y
+        errors = ys - xs
+        abs_errors = np.abs(errors)
+        eps = np.finfo(np.float64).eps
+        chunk = type(self)(
+            n=len(xs),
+            mean_x=float(mean_x),
+            mean_y=float(mean_y),
+            m2_x=float(dev_x @ dev_x),
+            m2_y=float(dev_y @ dev_y),
+            c_xy=float(dev_x @ dev_y),
+            sum_abs_err=float(abs_errors.sum()),
+            sum_sq_err=float(errors @ errors),
+            sum_abs_pct_err=float((abs_errors / np.maximum(np.abs(xs), eps)).sum()),
+            x_min=float(xs.min()),
+            x_max=float(xs.max()),
+        )
+        return self.merge(chunk)
+
+    def merge(self, other: ParityStats) -> Self:
+        """Merge another accumulator into this one in place (Chan et al. update).
+
+        Returns:
+            ParityStats: self, now covering the data of both accumulators.
+        """
+        if other.n == 0:
+            return self
+        n_total = self.n + other.n
+        delta_x, delta_y = other.mean_x - self.mean_x, other.mean_y - self.mean_y
+        weight = self.n * other.n / n_total
+
+        self.mean_x += delta_x * other.n / n_total
+        self.mean_y += delta_y * other.n / n_total
+        self.m2_x += other.m2_x + delta_x**2 * weight
+        self.m2_y += other.m2_y + delta_y**2 * weight
+        self.c_xy += other.c_xy + delta_x * delta_y * weight
+        self.sum_abs_err += other.sum_abs_err
+        self.sum_sq_err += other.sum_sq_err
+        self.sum_abs_pct_err += other.sum_abs_pct_err
+        self.x_min = min(self.x_min, other.x_min)
+        self.x_max = max(self.x_max, other.x_max)
+        self.n = n_total
+        return self
+
+    def __add__(self, other: ParityStats) -> ParityStats:
+        """Combine two accumulators into a new one."""
+        if not isinstance(other, ParityStats):
+            return NotImplemented
+        return dataclasses.replace(self).merge(other)
+
+    @property
+    def mae(self) -> float:
+        """Mean absolute error."""
+        return self.sum_abs_err / self.n if self.n else np.nan
+
+    @property
+    def mse(self) -> float:
+        """Mean squared error."""
+        return self.sum_sq_err / self.n if self.n else np.nan
+
+    @property
+    def rmse(self) -> float:
+        """Root mean squared error."""
+        return self.mse**0.5
+
+    @property
+    def mape(self) -> float:
+        """Mean absolute percentage error (as fraction) relative to x."""
+        return self.sum_abs_pct_err / self.n if self.n else np.nan
+
+    @property
+    def r2(self) -> float:
+        """Coefficient of determination of y as prediction of x (like r2_score)."""
+        if self.n < 2:
+            return np.nan
+        if self.m2_x == 0:  # same convention as sklearn for constant x
+            return 1.0 if self.sum_sq_err == 0 else 0.0
+        return 1 - self.sum_sq_err / self.m2_x
+
+    @property
+    def r2_adj(self) -> float:
+        """Adjusted R^2 with a single predictor."""
+        if self.n <= 2:
+            return np.nan
+        return 1 - (1 - self.r2) * (self.n - 1) / (self.n - 2)
+
+    @property
+    def slope(self) -> float:
+        """Slope of the least-squares fit of y on x."""
+        return self.c_xy / self.m2_x if self.m2_x else np.nan
+
+    @property
+    def intercept(self) -> float:
+        """Intercept of the least-squares fit of y on x."""
+        return self.mean_y - self.slope * self.mean_x
 
 
 def annotate_metrics(
-    xs: ArrayLike,
-    ys: ArrayLike,
+    xs: ArrayLike | ParityStats,
+    ys: ArrayLike | None = None,
     fig: go.Figure | None = None,
     metrics: dict[str, float] | Sequence[str] = ("MAE", "R2"),
     prefix: str = "",
@@ -39,14 +198,16 @@ def annotate_metrics(
     coefficient of determination.
 
     Args:
-        xs (array): x values.
-        ys (array): y values.
+        xs (array | ParityStats): x values or a ParityStats accumulator of x and y
+            values, e.g. collected over chunks of data too large to hold in memory.
+        ys (array | None): y values. Ignored if xs is a ParityStats accumulator.
         fig (go.Figure | None, optional): plotly Figure on which to add the annotation.
             Defaults to None.
         metrics (dict[str, float] | Sequence[str], optional): Metrics to show. Can be a
             subset of recognized keys MAE, R2, R2_adj, RMSE, MSE, MAPE or the names of
             sklearn.metrics.regression functions or any dict of metric names and values.
-            Defaults to ("MAE", "R2").
+            ParityStats input only supports the recognized keys. Defaults to
+            ("MAE", "R2").
         prefix (str, optional): Title or other string to prepend to metrics.
             Defaults to "".
         suffix (str, optional): Text to append after metrics. Defaults to "".
@@ -78,16 +239,25 @@ def annotate_metrics(
             funcs[key] = func
     if bad_keys := set(metrics) - set(funcs):
         raise ValueError(f"Unrecognized metrics: {bad_keys}")
+    if (
+        isinstance(xs, ParityStats)
+        and not isinstance(metrics, dict)
+        and (bad_keys := set(metrics) - set(STREAMING_METRICS))
+    ):
+        raise ValueError(
+            f"Metrics {bad_keys} can't be computed from ParityStats, only "
+            f"{STREAMING_METRICS}"
+        )
 
-    def calculate_metrics(xs: ArrayLike, ys: ArrayLike) -> str:
-        xs = np.asarray(xs)
-        ys = np.asarray(ys)
-        if xs.shape != ys.shape:
-            raise ValueError(
-                f"xs and ys must have the same shape. Got {xs.shape} and {ys.shape}"
-            )
-        nan_mask = np.isnan(xs) | np.isnan(ys)
-        xs, ys = xs[~nan_mask], ys[~nan_mask]
+    def calculate_metrics(xs: ArrayLike | ParityStats, ys: ArrayLike | None) -> str:
+        if not isinstance(xs, ParityStats):
+            xs, ys = np.asarray(xs), np.asarray(ys)
+            if xs.shape != ys.shape:
+                raise ValueError(
+                    f"xs and ys must have the same shape. Got {xs.shape} and {ys.shape}"
+                )
+            nan_mask = np.isnan(xs) | np.isnan(ys)
+            xs, ys = xs[~nan_mask], ys[~nan_mask]
         text = prefix
         if isinstance(metrics, dict):
             for key, val in metrics.items():
@@ -95,7 +265,10 @@ def annotate_metrics(
                 text += f"{label} = {val:{fmt}}<br>"
         else:
             for key in metrics:
-                value = funcs[key](xs, ys)
+                if isinstance(xs, ParityStats):
+                    value = getattr(xs, key.lower())
+                else:
+                    value = funcs[key](xs, ys)
                 label = str(PRETTY_LABELS.get(key, key))
                 text += f"{label} = {value:{fmt}}<br>"
         text += suffix
@@ -264,7 +437,7 @@ def _get_trace_color(trace: go.Scatter, default_color: str = "navy") -> str:
 def add_best_fit_line(
     fig: go.Figure,
     *,
-    xs: ArrayLike = (),
+    xs: ArrayLike | ParityStats = (),
     ys: ArrayLike = (),
     traces: TraceSelector = lambda _: True,
     line_kwargs: dict[str, Any] | None = None,
@@ -276,7 +449,8 @@ def add_best_fit_line(
 
     Args:
         fig (go.Figure): plotly figure to add the best fit line to.
-        xs (array, optional): x-values to use for fitting. Defaults to () which
+        xs (array | ParityStats, optional): x-values to use for fitting or a
+            ParityStats accumulator of x and y values. Defaults to () which
             means use the x-values of traces selected by the traces parameter.
         ys (array, optional): y-values to use for fitting. Defaults to () which
             means use the y-values of traces selected by the traces parameter.
@@ -338,17 +512,11 @@ def add_best_fit_line(
 
     # Function to add best fit line with annotation
     def add_fit_line(
-        data_xs: ArrayLike,
-        data_ys: ArrayLike,
-        color: str,
-        xref: str = "x",
-        yref: str = "y",
+        stats: ParityStats, color: str, xref: str = "x", yref: str = "y"
     ) -> None:
-        # Convert to numpy arrays for array operations
-        arr_xs, arr_ys = np.asarray(data_xs), np.asarray(data_ys)
-        # Calculate line parameters
-        slope, intercept = np.polyfit(arr_xs, arr_ys, 1)
-        x_min, x_max = float(arr_xs.min()), float(arr_xs.max())
+        # Line parameters from running moments, no need to refit raw data
+        slope, intercept = stats.slope, stats.intercept
+        x_min, x_max = stats.x_min, stats.x_max
         y0, y1 = slope * x_min + intercept, slope * x_max + intercept
 
         # Add line
@@ -407,9 +575,12 @@ def add_best_fit_line(
         annotate(text, fig=fig, **plotly_anno_defaults)
 
     # CASE 1: Custom data provided directly
+    if isinstance(xs, ParityStats):
+        add_fit_line(xs, line_color)
+        return fig
     xs_arr, ys_arr = np.asarray(xs), np.asarray(ys)
     if len(xs_arr) > 0 and len(ys_arr) > 0:
-        add_fit_line(xs_arr, ys_arr, line_color)
+        add_fit_line(ParityStats.from_arrays(xs_arr, ys_arr), line_color)
         return fig
 
     # Get valid traces for plotly
@@ -437,20 +608,25 @@ def add_best_fit_line(
             subplot_idx_str = subplot[1:] if len(subplot) > 1 else ""
             xref, yref = subplot, f"y{subplot_idx_str}" if subplot_idx_str else "y"
             color = _get_trace_color(trace, "navy")
-            add_fit_line(trace.x, trace.y, color, xref, yref)
+            add_fit_line(ParityStats.from_arrays(trace.x, trace.y), color, xref, yref)
 
         return fig
 
     # CASE 2B: Combined annotation mode for plotly
     if annotation_mode == "combined":
-        all_xs = np.concatenate([fig.data[idx].x for idx in valid_traces])
-        all_ys = np.concatenate([fig.data[idx].y for idx in valid_traces])
+        combined_stats = sum(
+            (
+                ParityStats.from_arrays(fig.data[idx].x, fig.data[idx].y)
+                for idx in valid_traces
+            ),
+            start=ParityStats(),
+        )
         color = (
             _get_trace_color(fig.data[valid_traces[0]], line_color)
             if valid_traces
             else line_color
         )
-        add_fit_line(all_xs, all_ys, color)
+        add_fit_line(combined_stats, color)
         return fig
 
     # CASE 2C: Per-trace annotation mode for plotly
@@ -465,14 +641,14 @@ def add_best_fit_line(
             continue
 
         color = _get_trace_color(trace, line_color)
-        add_fit_line(trace.x, trace.y, color, "x", "y")
+        add_fit_line(ParityStats.from_arrays(trace.x, trace.y), color, "x", "y")
 
     return fig
 
 
 def enhance_parity_plot(
     fig: go.Figure | None = None,
-    xs: ArrayLike = (),
+    xs: ArrayLike | ParityStats = (),
     ys: ArrayLike = (),
     *,
     identity_line: bool | dict[str, Any] = True,
@@ -485,7 +661,8 @@ def enhance_parity_plot(
     identity line (y=x), best-fit line, and pred vs ref statistics (MAE, R², ...).
 
     Args:
-        xs (array): x-values to use for fitting best-fit line and computing stats.
+        xs (array | ParityStats): x-values to use for fitting best-fit line and
+            computing stats or a ParityStats accumulator of x and y values.
         ys (array): y-values to use for fitting best-fit line and computing stats.
         fig (go.Figure | None): plotly Figure to add powerups to. Defaults to None.
         identity_line (bool | dict[str, Any], optional): Whether to add a parity line
@@ -513,7 +690,9 @@ def enhance_parity_plot(
             the data can be directly accessed.
     """
     # Convert to numpy arrays early for array operations
-    xs_arr, ys_arr = np.asarray(xs), np.asarray(ys)
+    parity_stats = xs if isinstance(xs, ParityStats) else None
+    xs_arr = np.asarray(() if parity_stats else xs)
+    ys_arr = np.asarray(() if parity_stats else ys)
 
     # Add identity line if requested
     if identity_line and fig is not None:
@@ -526,27 +705,35 @@ def enhance_parity_plot(
         and best_fit_line is not True
         and len(xs_arr) == 0
         and len(ys_arr) == 0
+        and parity_stats is None
     ):
         return fig
 
     # Case 1: Data provided directly
-    if len(xs_arr) > 0 and len(ys_arr) > 0:
+    if parity_stats is not None or (len(xs_arr) > 0 and len(ys_arr) > 0):
+        # single pass over the data for R² and the best-fit line
+        if parity_stats is None:
+            parity_stats = ParityStats.from_arrays(xs_arr, ys_arr)
+
         # If best_fit_line is None, determine whether to add it based on R²
         if best_fit_line is None:
-            r2 = r2_score(xs_arr, ys_arr)
-            best_fit_line = r2 > 0.3
+            best_fit_line = parity_stats.r2 > 0.3
 
         # Add best fit line if requested
         if best_fit_line and fig is not None:
             direct_best_fit_kwargs = (
                 {} if isinstance(best_fit_line, bool) else best_fit_line
             )
-            add_best_fit_line(fig, xs=xs_arr, ys=ys_arr, **direct_best_fit_kwargs)
+            add_best_fit_line(fig, xs=parity_stats, **direct_best_fit_kwargs)
 
         # Add stats annotation if requested
         if stats and annotation_mode != "none" and fig is not None:
             direct_stats_kwargs = {} if isinstance(stats, bool) else stats
-            annotate_metrics(xs_arr, ys_arr, fig=fig, **direct_stats_kwargs)
+            # arrays (if given) allow any sklearn metric, not just streaming ones
+            if isinstance(xs, ParityStats):
+                annotate_metrics(xs, fig=fig, **direct_stats_kwargs)
+            else:
+                annotate_metrics(xs_arr, ys_arr, fig=fig, **direct_stats_kwargs)
 
         return fig
 
@@ -566,16 +753,17 @@ def enhance_parity_plot(
         all_xs = np.concatenate([fig.data[idx].x for idx in valid_traces])
         all_ys = np.concatenate([fig.data[idx].y for idx in valid_traces])
 
+        combined_stats = ParityStats.from_arrays(all_xs, all_ys)
+
         # Add overall best-fit line if requested
         if best_fit_line is None:
-            r2 = r2_score(all_xs, all_ys)
-            best_fit_line = r2 > 0.3
+            best_fit_line = combined_stats.r2 > 0.3
 
         if best_fit_line:
             combined_best_fit_kwargs = (
                 {} if isinstance(best_fit_line, bool) else best_fit_line
             )
-            add_best_fit_line(fig, xs=all_xs, ys=all_ys, **combined_best_fit_kwargs)
+            add_best_fit_line(fig, xs=combined_stats, **combined_best_fit_kwargs)
 
         # Add combined stats annotation if requested
         if stats and annotation_mode != "none":
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Hashable, Sequence
+import re
+from collections.abc import Hashable, Iterator, Sequence
 from typing import TYPE_CHECKING, Any, Final, cast
 
 import numpy as np
 import pandas as pd
+import scipy.linalg
+import scipy.ndimage
+import scipy.signal
 import scipy.stats
 from pandas.api.types import is_numeric_dtype, is_string_dtype
 from pymatgen.core import Composition, IStructure, SiteCollection, Structure
@@ -18,13 +22,20 @@ from pymatviz.utils import df_ptable
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
+    from typing import Literal
 
     from numpy.typing import ArrayLike
     from pymatgen.core import IMolecule, Molecule
     from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
 
-    from pymatviz.typing import AnyStructure, ElemValues, FormulaGroupBy, T
+    from pymatviz.typing import (
+        AnyStructure,
+        DataFrameLike,
+        ElemValues,
+        FormulaGroupBy,
+        T,
+    )
 
 
 def count_elements(
@@ -45,9 +56,17 @@ def count_elements(
         elem_counts = count_elements(long_list_of_formulas) # slow
         ptable_heatmap_plotly(elem_counts) # fast, only rerun this line to update plot
 
+    Datasets too large to fit in memory can be passed as an iterator of chunks, e.g.
+    pd.read_csv(path, usecols=["formula"], chunksize=100_000) or a pyarrow
+    RecordBatchReader. Chunks are counted one at a time and summed, so memory use is
+    bounded by the chunk size.
+
     Args:
-        values (dict[str, int | float] | pd.Series | list[str]): Iterable of
+        values (dict[str, int | float] | pd.Series | list[str] | Iterator): Iterable of
             composition strings/objects or map from element symbols to heatmap values.
+            Can also be an iterator over formulas or over chunks of formulas (lists,
+            pd.Series, single-column or "formula"-column pd.DataFrames, or anything
+            with a to_pandas() method like pyarrow RecordBatches).
         count_mode ('(element|fractional|reduced)_composition'):
             Only used when values is a list of composition strings/objects.
             - composition (default): Count elements in each composition as is,
@@ -72,33 +91,24 @@ def count_elements(
     valid_count_modes = set(ElemCountMode)
     if count_mode not in valid_count_modes:
         raise ValueError(f"Invalid {count_mode=} must be one of {valid_count_modes}")
-    # Ensure values is Series if we got dict/list/tuple
-    srs = pd.Series(values)
+    if isinstance(values, Iterator) or hasattr(values, "read_next_batch"):
+        # stream of formulas or chunks of formulas, e.g. read_csv(chunksize=...)
+        srs = _count_elements_in_chunks(values, count_mode)
+    else:
+        # Ensure values is Series if we got dict/list/tuple
+        srs = pd.Series(values)
 
-    if is_numeric_dtype(srs):
-        pass
+        if is_numeric_dtype(srs):
+            pass
 
-    elif is_string_dtype(srs) or {*map(type, srs)} <= {str, Composition}:
-        # all items are formula strings or Composition objects
-        if count_mode == "occurrence":
-            srs = pd.Series(
-                itertools.chain.from_iterable(
-                    map(str, Composition(comp, allow_negative=True)) for comp in srs
-                )
-            ).value_counts()
+        elif is_string_dtype(srs) or {*map(type, srs)} <= {str, Composition}:
+            # all items are formula strings or Composition objects
+            srs = _count_elements_in_formulas(srs, count_mode)
         else:
-            attr = (
-                "element_composition" if count_mode == Key.composition else count_mode
+            raise ValueError(
+                "Expected values to be map from element symbols to heatmap values or "
+                f"list of compositions (strings or Pymatgen objects), got {values}"
             )
-            srs = pd.DataFrame(
-                getattr(Composition(formula, allow_negative=True), attr).as_dict()
-                for formula in srs
-            ).sum()  # sum up element occurrences
-    else:
-        raise ValueError(
-            "Expected values to be map from element symbols to heatmap values or "
-            f"list of compositions (strings or Pymatgen objects), got {values}"
-        )
 
     try:
         # If index consists entirely of strings representing integers, convert to ints
@@ -141,6 +151,152 @@ def count_elements(
     return srs
 
 
+# plain formulas like "Fe2O3", "Fe2 O3" or "Li0.5CoO2" (no brackets, charges, etc.)
+SIMPLE_FORMULA_RE: Final = re.compile(r"\s*(?:[A-Z][a-z]?(?:\d+\.?\d*|\.\d+)?\s*)+")
+ELEM_AMOUNT_RE: Final = re.compile(r"([A-Z][a-z]?)(\d+\.?\d*|\.\d+)?")
+
+
+def parse_simple_formula(formula: str) -> dict[str, float] | None:
+    """Parse a plain chemical formula into element amounts without pymatgen.
+
+    Much faster than Composition(formula) but only handles formulas made of element
+    symbols with optional (decimal) amounts, separated by optional whitespace.
+    Repeated elements are summed and amounts below Composition.amount_tolerance are
+    dropped, same as pymatgen.
+
+    Args:
+        formula (str): Chemical formula like "Fe2O3" or "Fe2 O3".
+
+    Returns:
+        dict[str, float] | None: Map of element symbols to amounts or None if the
+            formula isn't a plain formula of known elements (parse it with pymatgen).
+    """
+    if not SIMPLE_FORMULA_RE.fullmatch(formula):
+        return None
+    elem_amounts: dict[str, float] = {}
+    for symbol, amount in ELEM_AMOUNT_RE.findall(formula):
+        if symbol not in df_ptable.index:
+            return None  # e.g. D, T or invalid symbol, leave for pymatgen
+        elem_amounts[symbol] = elem_amounts.get(symbol, 0) + float(amount or 1)
+    return {
+        elem: amt
+        for elem, amt in elem_amounts.items()
+        if abs(amt) >= Composition.amount_tolerance
+    }
+
+
+def _count_elements_in_formulas(
+    formulas: pd.Series, count_mode: ElemCountMode
+) -> pd.Series:
+    """Sum element amounts (or occurrences) over formula strings or Compositions.
+
+    Each unique formula is parsed only once (datasets usually have many duplicates)
+    and plain formula strings skip pymatgen, see parse_simple_formula. Amounts are
+    accumulated into one array of all elements instead of a per-formula DataFrame.
+
+    Args:
+        formulas (pd.Series): Formula strings and/or Composition objects.
+        count_mode (ElemCountMode): How to count, see count_elements.
+
+    Returns:
+        pd.Series: Map of element symbols to counts for all elements present.
+    """
+    attr = "element_composition" if count_mode == Key.composition else count_mode
+    elem_symbols = df_ptable.index
+    symbol_to_idx = {symbol: idx for idx, symbol in enumerate(elem_symbols)}
+    elem_indices: list[int] = []
+    amounts: list[float] = []
+
+    for formula, n_occurrences in formulas.value_counts(sort=False).items():
+        elem_amounts = None
+        # reduced_composition has special cases (O2, H2O2, ...), leave to pymatgen
+        if isinstance(formula, str) and count_mode != ElemCountMode.reduced_composition:
+            elem_amounts = parse_simple_formula(formula)
+            if elem_amounts and count_mode == ElemCountMode.fractional_composition:
+                n_atoms = sum(map(abs, elem_amounts.values()))
+                elem_amounts = {el: amt / n_atoms for el, amt in elem_amounts.items()}
+        if elem_amounts is None:
+            comp = Composition(formula, allow_negative=True)
+            if count_mode != ElemCountMode.occurrence:
+                comp = getattr(comp, attr)
+            elem_amounts = comp.as_dict()
+        if count_mode == ElemCountMode.occurrence:
+            elem_amounts = dict.fromkeys(map(str, elem_amounts), 1)
+
+        for symbol, amount in elem_amounts.items():
+            if symbol in symbol_to_idx:  # skip species like Fe2+
+                elem_indices += [symbol_to_idx[symbol]]
+                amounts += [amount * n_occurrences]
+
+    is_present = np.bincount(elem_indices, minlength=len(elem_symbols)) > 0
+    counts = np.bincount(elem_indices, weights=amounts, minlength=len(elem_symbols))
+    if count_mode == ElemCountMode.occurrence:
+        counts = counts.astype(int)
+    return pd.Series(counts[is_present], index=elem_symbols[is_present])
+
+
+def _chunk_to_formulas(chunk: Any) -> pd.Series:
+    """Convert one chunk of a chunked count_elements input to a Series of formulas."""
+    if hasattr(chunk, "to_pandas"):  # pyarrow RecordBatch/Table/Array, polars, ...
+        chunk = chunk.to_pandas()
+    if isinstance(chunk, pd.DataFrame):
+        if Key.formula in chunk:
+            chunk = chunk[Key.formula]
+        elif chunk.shape[1] == 1:
+            chunk = chunk.iloc[:, 0]
+        else:
+            raise ValueError(
+                f"DataFrame chunks must have a single column or a {Key.formula!r} "
+                f"column, got columns {list(chunk)}"
+            )
+    formulas = pd.Series(chunk)
+    if len(formulas) > 0 and not (
+        is_string_dtype(formulas) or {*map(type, formulas)} <= {str, Composition}
+    ):
+        raise ValueError(
+            "Expected chunks of compositions (strings or Pymatgen objects), "
+            f"got {formulas}"
+        )
+    return formulas
+
+
+def _count_elements_in_chunks(
+    chunks: Iterable[Any], count_mode: ElemCountMode, chunk_size: int = 100_000
+) -> pd.Series:
+    """Sum element counts over an iterator of formula chunks in bounded memory.
+
+    Args:
+        chunks (Iterable): Chunks of formulas (see _chunk_to_formulas) or single
+            formulas, which are grouped into chunks of chunk_size.
+        count_mode (ElemCountMode): How to count, see count_elements.
+        chunk_size (int): Number of formulas per chunk if chunks yields single
+            formulas. Defaults to 100_000.
+
+    Returns:
+        pd.Series: Map of element symbols to counts for all elements present.
+    """
+    chunks = iter(chunks)
+    first_chunk = next(chunks, None)
+    chunks = itertools.chain([first_chunk] if first_chunk is not None else [], chunks)
+    if isinstance(first_chunk, str | Composition):  # iterator over single formulas
+        formulas = chunks
+        chunks = iter(lambda: list(itertools.islice(formulas, chunk_size)), [])
+
+    elem_symbols = df_ptable.index
+    is_occurrence = count_mode == ElemCountMode.occurrence
+    counts = np.zeros(len(elem_symbols), dtype=int if is_occurrence else float)
+    is_present = np.zeros(len(elem_symbols), dtype=bool)
+    for chunk in chunks:
+        chunk_counts = _count_elements_in_formulas(
+            _chunk_to_formulas(chunk), count_mode
+        )
+        elem_indices = elem_symbols.get_indexer(chunk_counts.index)
+        counts[elem_indices] += chunk_counts.to_numpy()
+        is_present[elem_indices] = True
+
+    return pd.Series(counts[is_present], index=elem_symbols[is_present])
+
+
 def count_formulas(
     data: Sequence[str | Composition | Structure],
     *,
@@ -186,46 +342,43 @@ def count_formulas(
         10: "denary",
     }
 
-    # Convert all inputs to chemical systems (sorted tuples of element strings)
+    # Structures are unhashable, count them by composition (same result as before)
+    items = [item.composition if isinstance(item, Structure) else item for item in data]
+    for item in items:
+        if not isinstance(item, str | Composition):
+            raise TypeError(
+                f"Expected str, Composition or Structure, got {type(item)} instead"
+            )
+    # parse each unique item only once (datasets usually have many duplicates)
+    item_codes, unique_items = pd.factorize(pd.Series(items, dtype=object))
+
+    # Convert unique inputs to chemical systems (sorted tuples of element strings)
     systems: list[tuple[str, ...]] = []
     formulas: list[str | None] = []  # store formulas if not grouping by chem_sys
-    for item in data:
-        if isinstance(item, Structure):
-            elems = sorted(item.composition.chemical_system.split("-"))
-            if group_by == "formula":
-                formula = str(item.composition)
-            elif group_by == "reduced_formula":
-                formula = item.composition.reduced_formula
-            else:  # chem_sys
-                formula = None
-        elif isinstance(item, Composition):
-            elems = sorted(item.chemical_system.split("-"))
+    for item in unique_items:
+        if isinstance(item, Composition):
+            elems = item.chemical_system.split("-")
             if group_by == "formula":
                 formula = str(item)
             elif group_by == "reduced_formula":
                 formula = item.reduced_formula
             else:  # chem_sys
                 formula = None
-        elif isinstance(item, str):
-            if "-" in item:  # already a chemical system string
-                elems = sorted(item.split("-"))
-                formula = item if group_by != Key.chem_sys else None
-            else:  # assume it's a formula string
-                try:
-                    comp = Composition(item)
-                    elems = sorted(comp.chemical_system.split("-"))
-                    if group_by == "formula":
-                        formula = item  # preserve original formula string
-                    elif group_by == "reduced_formula":
-                        formula = comp.reduced_formula
-                    else:  # chem_sys
-                        formula = None
-                except (ValueError, KeyError) as exc:
-                    raise ValueError(f"Invalid formula: {item}") from exc
-        else:
-            raise TypeError(
-                f"Expected str, Composition or Structure, got {type(item)} instead"
-            )
+        elif "-" in item:  # already a chemical system string
+            elems = item.split("-")
+            formula = item if group_by != Key.chem_sys else None
+        else:  # assume it's a formula string
+            try:
+                comp = Composition(item)
+                elems = comp.chemical_system.split("-")
+                if group_by == "formula":
+                    formula = item  # preserve original formula string
+                elif group_by == "reduced_formula":
+                    formula = comp.reduced_formula
+                else:  # chem_sys
+                    formula = None
+            except (ValueError, KeyError) as exc:
+                raise ValueError(f"Invalid formula: {item}") from exc
 
         # Remove duplicates and sort elements
         elems = sorted(set(elems))
@@ -235,10 +388,11 @@ def count_formulas(
         if group_by != Key.chem_sys:
             formulas += [formula]
 
-    # Create a DataFrame with arity and chemical system columns
+    # Create a DataFrame with arity and chemical system columns per unique item
     df_systems = pd.DataFrame({"system": systems})
     if group_by != Key.chem_sys:
         df_systems[Key.formula] = formulas
+    df_systems[Key.count] = np.bincount(item_codes, minlength=len(unique_items))
 
     df_systems[Key.arity] = df_systems["system"].map(len)
     df_systems["arity_name"] = df_systems[Key.arity].map(
@@ -251,8 +405,13 @@ def count_formulas(
     if group_by != Key.chem_sys:
         group_cols += [Key.formula]
 
-    df_counts = df_systems.value_counts(group_cols).reset_index()
-    df_counts.columns = [*group_cols, Key.count]  # preserve original column names
+    # same as df.value_counts(group_cols) on the per-item DataFrame
+    df_counts = (
+        df_systems.groupby(group_cols)[Key.count]
+        .sum()
+        .sort_values(ascending=False)
+        .reset_index()
+    )
 
     # Sort by arity and chemical system for consistent ordering
     return df_counts.sort_values(["arity_name", Key.chem_sys])
@@ -425,8 +584,66 @@ def normalize_to_dict(
     )
 
 
+POLARS_DF_CLS: Final = "polars.dataframe.frame.DataFrame"
+ARROW_TABLE_CLASSES: Final = ("pyarrow.lib.Table", "pyarrow.lib.RecordBatch")
+
+
+def is_dataframe_like(obj: Any) -> bool:
+    """Check if object is a pandas, Polars or Arrow table or implements the
+    dataframe interchange protocol, without importing polars or pyarrow.
+    """
+    cls_name = f"{type(obj).__module__}.{type(obj).__qualname__}"
+    return (
+        isinstance(obj, pd.DataFrame)
+        or cls_name in (POLARS_DF_CLS, *ARROW_TABLE_CLASSES)
+        or hasattr(obj, "__dataframe__")
+    )
+
+
+def _df_columns_as_series(
+    df: DataFrameLike, col_names: Sequence[Hashable]
+) -> dict[Hashable, pd.Series]:
+    """Get dataframe columns as pandas Series, wrapping (zero-copy where the source
+    library allows it) the NumPy data of Polars and Arrow columns. Other objects
+    implementing the interchange protocol only have the requested columns converted.
+    """
+    cls_name = f"{type(df).__module__}.{type(df).__qualname__}"
+    if isinstance(df, pd.DataFrame):
+        return {col: df[col] for col in col_names}
+
+    if cls_name == POLARS_DF_CLS:
+        available = df.columns
+
+        def column_to_numpy(col: Hashable) -> np.ndarray:
+            return df.get_column(col).to_numpy()
+
+    elif cls_name in ARROW_TABLE_CLASSES:
+        available = df.column_names
+
+        def column_to_numpy(col: Hashable) -> np.ndarray:
+            # RecordBatch columns are pa.Arrays whose to_numpy() defaults to
+            # zero_copy_only=True and raises on nulls or non-numeric dtypes
+            return df.column(col).to_numpy(zero_copy_only=False)
+
+    else:  # dataframe interchange protocol
+        df_xchg = df.__dataframe__()
+        available = list(df_xchg.column_names())
+    if missing := [col for col in col_names if col not in available]:
+        raise KeyError(f"{missing} not in dataframe columns {available}")
+
+    if cls_name in (POLARS_DF_CLS, *ARROW_TABLE_CLASSES):
+        # to_numpy() is zero-copy for numeric columns without nulls (and a single
+        # chunk for Arrow), nulls become NaN (numeric) or None (other dtypes)
+        return {col: pd.Series(column_to_numpy(col), copy=False) for col in col_names}
+    unique_names = list(dict.fromkeys(col_names))
+    df_pandas = pd.api.interchange.from_dataframe(
+        df_xchg.select_columns_by_name(unique_names)
+    )
+    return {col: df_pandas[col] for col in col_names}
+
+
 def df_to_arrays(
-    df: pd.DataFrame | None,
+    df: DataFrameLike | None,
     *args: str | ArrayLike,
     strict: bool = True,
 ) -> list[str | ArrayLike | dict[str, ArrayLike]]:
@@ -434,15 +651,22 @@ def df_to_arrays(
     dataframe, all following args are used as column names and the column data
     returned as arrays (after dropping rows with NaNs in any column).
 
+    Besides pandas, Polars DataFrames, pyarrow Tables and any object implementing
+    the dataframe interchange protocol (__dataframe__) are accepted without
+    converting the whole frame to pandas. Only the requested columns are read and
+    rows with missing values are dropped with a combined validity mask, so columns
+    without missing values are returned as zero-copy views where possible.
+
     Args:
-        df (pd.DataFrame | None): Optional pandas DataFrame.
+        df (pd.DataFrame | pl.DataFrame | pa.Table | None): Optional pandas, Polars
+            or Arrow dataframe (or any object implementing __dataframe__).
         *args (list[ArrayLike | str]): Arbitrary number of arrays or column names in df.
-        strict (bool, optional): If True, raise TypeError if df is not pd.DataFrame
+        strict (bool, optional): If True, raise TypeError if df is not a dataframe
             or None. If False, return args as-is. Defaults to True.
 
     Raises:
         ValueError: If df is not None and any of the args is not a df column name.
-        TypeError: If df is not pd.DataFrame and not None.
+        TypeError: If df is not a dataframe and not None.
 
     Returns:
         list[str | ArrayLike | dict[str, ArrayLike]]: Array data for each column name,
@@ -455,7 +679,7 @@ def df_to_arrays(
         # Convert args to numpy arrays if they are not already
         return list(map(np.asarray, args))
 
-    if not isinstance(df, pd.DataFrame):
+    if not is_dataframe_like(df):
         if not strict:
             return list(args)
         raise TypeError(f"df should be pandas DataFrame or None, got {type(df)}")
@@ -476,17 +700,161 @@ def df_to_arrays(
         else:
             flat_args.extend(col_name)  # type: ignore[arg-type]
 
-    df_no_nan = df.dropna(subset=flat_args)
+    columns = _df_columns_as_series(df, flat_args)
+    # combined validity mask instead of copying the frame with dropna()
+    is_valid = np.logical_and.reduce(
+        [col.notna().to_numpy() for col in columns.values()]
+    )
+    has_missing = not is_valid.all()
+
+    def col_to_numpy(col_name: Hashable) -> np.ndarray:
+        col = columns[col_name]
+        return (col[is_valid] if has_missing else col).to_numpy()
+
     for idx, col_name in enumerate(args):
         if isinstance(col_name, str | int):
-            args[idx] = df_no_nan[col_name].to_numpy()  # type: ignore[index]
+            args[idx] = col_to_numpy(col_name)  # type: ignore[index]
         else:
-            col_data = df_no_nan[[*col_name]].to_numpy().T  # type: ignore[misc]
-            args[idx] = dict(zip(col_name, col_data, strict=True))  # type: ignore[index,arg-type]
+            args[idx] = {name: col_to_numpy(name) for name in col_name}  # type: ignore[index]
 
     return args  # type: ignore[return-value]
 
 
+def binned_kde(
+    values: ArrayLike,
+    eval_points: ArrayLike,
+    *,
+    bw_method: str | float | None = None,
+    grid_size: int | None = None,
+) -> np.ndarray:
+    """Approximate scipy.stats.gaussian_kde(values, bw_method)(eval_points) on a grid.
+
+    The exact KDE sums one Gaussian per data point at every evaluation point, i.e.
+    O(N x M). Here, points are linearly binned onto a regular grid in whitened
+    coordinates (where the KDE kernel is a standard normal), the grid is convolved
+    with the kernel via FFT and the result is linearly interpolated back to the
+    evaluation points. Cost is O(N + M + G log G) for G grid nodes.
+
+    The bandwidth matrix is the same as gaussian_kde's. The max absolute error is
+    set by the grid spacing h in units of the kernel bandwidth, i.e. the data range
+    in bandwidths plus 8 divided by grid_size - 1, and stays below about
+    0.15 * h**2 of the peak density. So it grows with the data range relative to the
+    bandwidth and falls off as 1 / grid_size**2. For the default 2D grid, measured
+    errors are ~0.03% for normal data (h ~ 0.06) but ~1% for a bimodal sample
+    with far outliers (h ~ 0.3), where a larger grid_size helps. Evaluation points
+    more than 4 kernel widths away from all data get density 0.
+
+    Args:
+        values (ArrayLike): Data points of shape (n_dims, n_points) (or (n_points,)
+            for 1D), like the dataset of scipy.stats.gaussian_kde.
+        eval_points (ArrayLike): Points of shape (n_dims, n_eval) at which to
+            evaluate the density.
+        bw_method (str | float | None): Bandwidth rule passed to gaussian_kde.
+            Defaults to None for Scott's rule.
+        grid_size (int | None): Number of grid nodes per dimension. Defaults to
+            4096 for 1D, 512 for 2D and 64 for higher dimensions.
+
+    Returns:
+        np.ndarray: Density at each evaluation point (NaN for points with NaNs).
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    eval_points = np.atleast_2d(np.asarray(eval_points, dtype=float))
+    # only fit the bandwidth (cheap), evaluating the exact KDE is the expensive part
+    kde = scipy.stats.gaussian_kde(values, bw_method=bw_method)
+    n_dims = kde.d
+    grid_size = grid_size or {1: 4096, 2: 512}.get(n_dims, 64)
+
+    # whiten with the kernel covariance cov = L L^T, so the kernel is N(0, 1) in z
+    chol = np.linalg.cholesky(kde.covariance)
+    is_nan = np.isnan(eval_points).any(axis=0)
+    z_values = scipy.linalg.solve_triangular(chol, values, lower=True)
+    z_eval = scipy.linalg.solve_triangular(chol, eval_points[:, ~is_nan], lower=True)
+
+    # grid covering the data plus 4 kernel widths to fit the kernel tails
+    grid_min = z_values.min(axis=1) - 4
+    cell_size = (z_values.max(axis=1) + 4 - grid_min) / (grid_size - 1)
+
+    # linear binning: spread each point's weight over its 2^n_dims nearest nodes
+    grid_pos = (z_values - grid_min[:, None]) / cell_size[:, None]
+    lower_nodes = np.clip(np.floor(grid_pos).astype(np.int64), 0, grid_size - 2)
+    frac = grid_pos - lower_nodes
+    grid_shape = (grid_size,) * n_dims
+    grid = np.zeros(grid_size**n_dims)
+    for corner in itertools.product((0, 1), repeat=n_dims):
+        corner_offset = np.array(corner)[:, None]
+        node_weights = np.where(corner_offset, frac, 1 - frac).prod(axis=0)
+        node_indices = np.ravel_multi_index(lower_nodes + corner_offset, grid_shape)
+        grid += np.bincount(
+            node_indices, weights=kde.weights * node_weights, minlength=grid.size
+        )
+
+    # separable standard normal kernel truncated at 4 sigma
+    kernel = np.ones((1,) * n_dims)
+    for axis, cell in enumerate(cell_size):
+        half_width = min(int(np.ceil(4 / cell)), grid_size - 1)
+        kernel_1d = np.exp(-0.5 * (np.arange(-half_width, half_width + 1) * cell) ** 2)
+        kernel = kernel * np.expand_dims(
+            kernel_1d, [dim for dim in range(n_dims) if dim != axis]
+        )
+    density_grid = scipy.signal.fftconvolve(
+        grid.reshape(grid_shape), kernel, mode="same"
+    )
+    density_grid /= np.sqrt(np.linalg.det(2 * np.pi * kde.covariance))
+
+    density = np.full(eval_points.shape[1], np.nan)
+    eval_coords = (z_eval - grid_min[:, None]) / cell_size[:, None]
+    density[~is_nan] = scipy.ndimage.map_coordinates(
+        density_grid, eval_coords, order=1, mode="constant"
+    )
+    # FFT round-off can give tiny negative values far from the data
+    return np.clip(density, 0, None)
+
+
+def _bin_codes(values: pd.Series, n_bins: int) -> tuple[np.ndarray, pd.Index]:
+    """Get the pd.cut(values, bins=n_bins) bin index of every value without pd.cut.
+
+    Bin edges are computed like pd.cut (equal-width bins over the data range, lowest
+    edge lowered by 0.1% of the range) and bin indices with np.floor arithmetic,
+    corrected by one bin where float rounding disagrees with the right-closed edges.
+
+    Args:
+        values (pd.Series): Values to bin.
+        n_bins (int): Number of bins.
+
+    Returns:
+        tuple[np.ndarray, pd.Index]: Integer bin codes (-1 for NaN) and the interval
+            categories pd.cut would assign to them.
+    """
+    arr = None
+    if is_numeric_dtype(values):
+        arr = values.to_numpy(dtype=float, na_value=np.nan)
+    if arr is None or np.isinf(arr).any() or np.isnan(arr).all():
+        # datetimes, infinities, all NaN: leave binning (and error messages) to pd.cut
+        cut = pd.cut(values, bins=n_bins)
+        return cut.cat.codes.to_numpy(), cut.cat.categories
+
+    v_min, v_max = np.nanmin(arr), np.nanmax(arr)
+    if v_min == v_max:  # same end point adjustment as pd.cut
+        v_min -= 0.001 * abs(v_min) if v_min != 0 else 0.001
+        v_max += 0.001 * abs(v_max) if v_max != 0 else 0.001
+        edges = np.linspace(v_min, v_max, n_bins + 1)
+    else:
+        edges = np.linspace(v_min, v_max, n_bins + 1)
+        edges[0] -= (v_max - v_min) * 0.001
+
+    is_nan = np.isnan(arr)
+    bin_width = (edges[-1] - edges[0]) / n_bins
+    codes = np.floor((np.where(is_nan, edges[0], arr) - edges[0]) / bin_width)
+    codes = np.clip(codes, 0, n_bins - 1).astype(np.int64)
+    # bins are right-closed, i.e. edges[code] < value <= edges[code + 1]
+    codes -= (arr <= edges[codes]) & (codes > 0)
+    codes += (arr > edges[codes + 1]) & (codes < n_bins - 1)
+    codes[is_nan] = -1
+
+    categories = pd.cut(edges[-1:], bins=edges).categories
+    return codes, categories
+
+
 def bin_df_cols(
     df_in: pd.DataFrame,
     bin_by_cols: Sequence[str],
@@ -495,10 +863,17 @@ def bin_df_cols(
     n_bins: int | Sequence[int] = 100,
     bin_counts_col: str = "bin_counts",
     density_col: str = "",
+    density_method: Literal["kde", "binned_kde"] = "kde",
     verbose: bool = True,
 ) -> pd.DataFrame:
     """Bin columns of a DataFrame.
 
+    Returns the same result as grouping df_in by pd.cut(df_in[col], bins=n_bins) of
+    each bin_by_col (plus group_by_cols) and taking the first (non-null) values and
+    size of each group. Instead of copying df_in and adding pd.cut columns, integer
+    bin indices are combined into a single int64 key per row, so only the
+    representative rows of non-empty bins are ever copied.
+
     Args:
         df_in (pd.DataFrame): Input dataframe to bin.
         bin_by_cols (Sequence[str]): Columns to bin.
@@ -506,14 +881,15 @@ def bin_df_cols(
         n_bins (int): Number of bins to use. Defaults to 100.
         bin_counts_col (str): Column name for bin counts. Defaults to "bin_counts".
         density_col (str): Column name for density values. Defaults to "".
+        density_method ("kde" | "binned_kde"): How to compute density_col. "kde"
+            evaluates the exact scipy.stats.gaussian_kde at every bin (O(N x bins)),
+            "binned_kde" uses the much faster grid approximation binned_kde().
+            Defaults to "kde".
         verbose (bool): If True, report df length reduction. Defaults to True.
 
     Returns:
         pd.DataFrame: Binned DataFrame with original index name and values.
     """
-    # Create a copy of the input DataFrame to avoid modifying the original
-    df_in = df_in.copy()
-
     if isinstance(n_bins, int):
         # broadcast integer n_bins to all bin_by_cols
         n_bins = [n_bins] * len(bin_by_cols)
@@ -521,22 +897,71 @@ def bin_df_cols(
     if len(bin_by_cols) != len(n_bins):
         raise ValueError(f"{len(bin_by_cols)=} != {len(n_bins)=}")
 
+    # integer codes and number of distinct values of each group key (-1 for NaN)
+    key_codes: list[np.ndarray] = []
+    key_sizes: list[int] = []
     cut_cols = [f"{col}_bins" for col in bin_by_cols]
-    for col, bins, cut_col in zip(bin_by_cols, n_bins, cut_cols, strict=True):
-        df_in[cut_col] = pd.cut(df_in[col].values, bins=bins)
+    bin_categories: list[pd.Index] = []
+    for col, bins in zip(bin_by_cols, n_bins, strict=True):
+        codes, categories = _bin_codes(df_in[col], bins)
+        key_codes += [codes]
+        key_sizes += [len(categories)]
+        bin_categories += [categories]
+    for col in group_by_cols:
+        codes, uniques = pd.factorize(df_in[col], sort=True)
+        key_codes += [codes]
+        key_sizes += [len(uniques)]
+
+    # linearize all key codes into one int64 key per row (ordered like groupby keys)
+    is_valid = np.logical_and.reduce([codes >= 0 for codes in key_codes])
+    valid_rows = np.flatnonzero(is_valid)
+    keys = np.zeros(len(valid_rows), dtype=np.int64)
+    n_keys = 1
+    for codes, size in zip(key_codes, key_sizes, strict=True):
+        if n_keys * size >= np.iinfo(np.int64).max:  # compress to avoid overflow
+            uniq_keys, keys = np.unique(keys, return_inverse=True)
+            n_keys = len(uniq_keys)
+        keys = keys * size + codes[valid_rows]
+        n_keys *= size
+
+    # group codes in order of first appearance, so first rows are where codes increase
+    group_codes, uniq_keys = pd.factorize(keys)
+    running_max = np.maximum.accumulate(group_codes)
+    first_rows = np.flatnonzero(np.diff(running_max, prepend=-1) > 0)
+    group_sizes = np.bincount(group_codes, minlength=len(uniq_keys))
+    key_order = np.argsort(uniq_keys)
+    rep_rows = valid_rows[first_rows[key_order]]
 
     # Preserve the original index
     orig_index_name = df_in.index.name or "index"
-    # Reset index so it participates in groupby. If the index name is already in the
-    # columns, we it'll participate already and be set back to the index at the end.
-    if orig_index_name not in df_in:
-        df_in = df_in.reset_index()
-
-    group = df_in.groupby(by=[*cut_cols, *group_by_cols], observed=True)
+    value_cols = [col for col in df_in if col not in group_by_cols]
+    df_bin = df_in.iloc[rep_rows][value_cols]
+    # like groupby().first(), take the first non-null value of each group, which only
+    # differs from the first row's value if that is null
+    for col in df_bin.columns[df_bin.isna().any()]:
+        is_not_null = df_in[col].notna().to_numpy()[valid_rows]
+        groups_with_val, first_idx = np.unique(
+            group_codes[is_not_null], return_index=True
+        )
+        first_vals = df_in[col].iloc[valid_rows[is_not_null][first_idx]].to_numpy()
+        first_vals = pd.Series(first_vals, index=groups_with_val).reindex(key_order)
+        df_bin[col] = first_vals.to_numpy()
+    # Keep index as column. If the index name is already in the columns, it'll be
+    # set back to the index from there at the end.
+    df_bin = df_bin.reset_index(drop=orig_index_name in df_in)
+
+    # add group keys in front like groupby().first().reset_index()
+    for idx, (cut_col, categories) in enumerate(
+        zip(cut_cols, bin_categories, strict=True)
+    ):
+        bin_codes = key_codes[idx][rep_rows]
+        cut_vals = pd.Categorical.from_codes(bin_codes, categories, ordered=True)
+        df_bin.insert(idx, cut_col, cut_vals)
+    for idx, col in enumerate(group_by_cols, start=len(cut_cols)):
+        df_bin.insert(idx, col, df_in[col].iloc[rep_rows].array)
 
-    df_bin = group.first().dropna()
-    df_bin[bin_counts_col] = group.size()
-    df_bin = df_bin.reset_index()
+    df_bin = df_bin.dropna(subset=df_bin.columns[len(key_codes) :])
+    df_bin[bin_counts_col] = group_sizes[key_order][df_bin.index]
 
     if verbose:
         print(  # noqa: T201
@@ -546,11 +971,16 @@ def bin_df_cols(
 
     if density_col:
         # compute kernel density estimate for each bin
-        values = df_in[bin_by_cols].dropna().T
-        gaussian_kde = scipy.stats.gaussian_kde(values.astype(float))
-
-        xy_binned = df_bin[bin_by_cols].T
-        density = gaussian_kde(xy_binned.astype(float))
+        values = df_in[bin_by_cols].dropna().T.astype(float)
+        xy_binned = df_bin[bin_by_cols].T.astype(float)
+        if density_method == "binned_kde":
+            density = binned_kde(values, xy_binned)
+        elif density_method == "kde":
+            density = scipy.stats.gaussian_kde(values)(xy_binned)
+        else:
+            raise ValueError(
+                f"Unknown {density_method=}, must be one of 'kde', 'binned_kde'"
+            )
         df_bin[density_col] = density / density.sum() * len(values)
 
     # Set the index back to the original index name
@@ -69,7 +69,8 @@ def ptable_heatmap_plotly(
     Args:
         values (dict[str, int | float] | pd.Series | list[str]): Map from element
             symbols to heatmap values e.g. dict(Fe=2, O=3) or iterable of composition
-            strings or Pymatgen composition objects.
+            strings or Pymatgen composition objects. Iterators over chunks of formulas
+            are counted chunk by chunk, see count_elements.
         count_mode ("composition" | "fractional_composition" | "reduced_composition"):
             Reduce or normalize compositions before counting. See `count_elements` for
             details. Only used when values is list of composition strings/objects.
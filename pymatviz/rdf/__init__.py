@@ -2,5 +2,9 @@
 
 from __future__ import annotations
 
-from pymatviz.rdf.figures import element_pair_rdfs, full_rdf
-from pymatviz.rdf.helpers import calculate_rdf
+from pymatviz.rdf.figures import element_pair_rdfs, full_rdf, trajectory_rdfs
+from pymatviz.rdf.helpers import (
+    calculate_all_pair_rdfs,
+    calculate_rdf,
+    calculate_trajectory_rdfs,
+)
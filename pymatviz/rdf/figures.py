@@ -19,11 +19,11 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from pymatviz.process_data import normalize_structures
-from pymatviz.rdf.helpers import calculate_rdf
+from pymatviz.rdf.helpers import _map_pair_rdfs, calculate_trajectory_rdfs
 
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from typing import Any
 
     import numpy as np
@@ -41,6 +41,8 @@ def element_pair_rdfs(
     colors: Sequence[str] | None = None,
     line_styles: Sequence[str] | None = None,
     subplot_kwargs: dict[str, Any] | None = None,
+    *,
+    n_jobs: int | None = 1,
 ) -> go.Figure:
     """Generate a plotly figure of pairwise radial distribution functions (RDFs) for
     all (or a subset of) element pairs in one or multiple structures.
@@ -72,6 +74,9 @@ def element_pair_rdfs(
         subplot_kwargs (dict, optional): Passed to plotly.make_subplots. Use this to
             e.g. set subplot_titles, rows/cols or row/column spacing to customize the
             subplot layout.
+        n_jobs (int | None, optional): Number of worker processes to spread the
+            per-structure RDF calculations over. Set to 1 to disable
+            multiprocessing (default). Set to None to use all available cores.
 
     Returns:
         go.Figure: A plotly figure with facets for each pairwise RDF, comparing one or
@@ -129,11 +134,16 @@ def element_pair_rdfs(
     if bin_size is not None:
         n_bins = int(cutoff / bin_size)
 
+    # one neighbor search per structure covers all element pairs
+    struct_pair_rdfs = _map_pair_rdfs(
+        struct_dict.values(),
+        cutoff=cutoff,
+        n_bins=n_bins,
+        element_pairs=element_pairs,
+        n_jobs=n_jobs,
+    )
     elem_pair_rdfs: dict[tuple[str, str], list[tuple[np.ndarray, np.ndarray]]] = {
-        pair: [
-            calculate_rdf(struct, pair[0], pair[1], cutoff=cutoff, n_bins=n_bins)
-            for struct in struct_dict.values()
-        ]
+        pair: [(radii, pair_rdfs[pair]) for radii, pair_rdfs in struct_pair_rdfs]
         for pair in element_pairs
     }
 
@@ -223,6 +233,8 @@ def full_rdf(
     reference_line: dict[str, Any] | None = None,
     colors: Sequence[str] | None = None,
     line_styles: Sequence[str] | None = None,
+    *,
+    n_jobs: int | None = 1,
 ) -> go.Figure:
     """Generate a plotly figure of full radial distribution functions (RDFs) for
     one or multiple structures.
@@ -244,6 +256,9 @@ def full_rdf(
         line_styles (Sequence[str], optional): line styles for each structure's RDF
             line. Defaults to ["solid", "dot", "dash", "longdash", "dashdot",
             "longdashdot"].
+        n_jobs (int | None, optional): Number of worker processes to spread the
+            per-structure RDF calculations over. Set to 1 to disable
+            multiprocessing (default). Set to None to use all available cores.
 
     Returns:
         go.Figure: A plotly figure with full RDFs for one or multiple structures.
@@ -269,9 +284,16 @@ def full_rdf(
     if bin_size is not None:
         n_bins = int(cutoff / bin_size)
 
+    full_rdfs = _map_pair_rdfs(
+        struct_dict.values(),
+        cutoff=cutoff,
+        n_bins=n_bins,
+        by_element=False,
+        n_jobs=n_jobs,
+    )
     rdfs = {
-        label: calculate_rdf(struct, cutoff=cutoff, n_bins=n_bins)
-        for label, struct in struct_dict.items()
+        label: (radii, pair_rdfs["", ""])
+        for label, (radii, pair_rdfs) in zip(struct_dict, full_rdfs, strict=True)
     }
 
     fig = go.Figure()
@@ -316,3 +338,114 @@ def full_rdf(
         fig.layout.showlegend = False
 
     return fig
+
+
+def trajectory_rdfs(
+    frames: Iterable[AnyStructure],
+    cutoff: float = 15,
+    n_bins: int = 75,
+    bin_size: float | None = None,
+    element_pairs: list[tuple[str, str]] | None = None,
+    *,
+    show_std: bool = True,
+    reference_line: dict[str, Any] | None = None,
+    color: str | None = None,
+    subplot_kwargs: dict[str, Any] | None = None,
+) -> go.Figure:
+    """Plot frame-averaged pairwise RDFs of an MD trajectory.
+
+    Unlike element_pair_rdfs, frames are streamed through
+    calculate_trajectory_rdfs so a generator over a long trajectory is processed in
+    constant memory and yields one averaged curve per element pair (rather than one
+    trace per frame).
+
+    Args:
+        frames (Iterable[AnyStructure]): pymatgen Structures or ASE Atoms, one
+            per MD frame. Can be a generator.
+        cutoff (float, optional): Maximum distance for RDF calculation. Default is 15 Å.
+        n_bins (int, optional): Number of bins for RDF calculation. Default is 75.
+        bin_size (float, optional): Size of bins for RDF calculation. If specified, it
+            overrides n_bins. Default is None.
+        element_pairs (list[tuple[str, str]], optional): Element pairs to plot.
+            If None, all pairs present in the first frame are plotted.
+        show_std (bool, optional): Whether to draw a shaded band of ±1 standard
+            deviation of g(r) across frames around each mean curve. Default is True.
+        reference_line (dict, optional): Keywords for reference line at g(r)=1 drawn
+            with Figure.add_hline(). If None (default), no reference line is drawn.
+        color (str, optional): Line color. Defaults to the first color of
+            plotly.colors.qualitative.Plotly.
+        subplot_kwargs (dict, optional): Passed to plotly.make_subplots.
+
+    Returns:
+        go.Figure: A plotly figure with one facet per element pair.
+
+    Raises:
+        ValueError: If frames is empty or if both n_bins and bin_size are specified.
+    """
+    if n_bins != 75 and bin_size is not None:
+        raise ValueError(
+            f"Cannot specify both {n_bins=} and {bin_size=}. Pick one or the other."
+        )
+    if bin_size is not None:
+        n_bins = int(cutoff / bin_size)
+
+    radii, pair_rdfs = calculate_trajectory_rdfs(
+        frames,
+        cutoff=cutoff,
+        n_bins=n_bins,
+        element_pairs=sorted(element_pairs) if element_pairs else None,
+    )
+    pair_rdfs = dict(sorted(pair_rdfs.items()))
+
+    n_pairs = len(pair_rdfs)
+    subplot_kwargs = subplot_kwargs or {}
+    actual_cols = min(subplot_kwargs.pop("cols", 3), n_pairs)
+    n_rows = (n_pairs + actual_cols - 1) // actual_cols
+
+    subplot_defaults = dict(
+        rows=n_rows,
+        cols=actual_cols,
+        subplot_titles=[f"{el1}-{el2}" for el1, el2 in pair_rdfs],
+        vertical_spacing=0.15 / n_rows,
+        horizontal_spacing=0.15 / actual_cols,
+    )
+    fig = make_subplots(**subplot_defaults | subplot_kwargs)
+    color = color or plotly.colors.qualitative.Plotly[0]
+
+    for subplot_idx, (mean, std) in enumerate(pair_rdfs.values()):
+        row, col = divmod(subplot_idx, actual_cols)
+        if show_std:
+            fig.add_scatter(
+                x=[*radii, *radii[::-1]],
+                y=[*(mean + std), *(mean - std)[::-1]],
+                fill="toself",
+                fillcolor=color,
+                opacity=0.25,
+                line=dict(width=0),
+                hoverinfo="skip",
+                showlegend=False,
+                row=row + 1,
+                col=col + 1,
+            )
+        fig.add_scatter(
+            x=radii,
+            y=mean,
+            mode="lines",
+            line=dict(color=color),
+            customdata=std,
+            showlegend=False,
+            row=row + 1,
+            col=col + 1,
+            hovertemplate="r = %{x:.2f} Å<br>g(r) = %{y:.2f} ± %{customdata:.2f}"
+            "<extra></extra>",
+        )
+
+    fig.update_xaxes(title_text="r [Å]", title_standoff=9, row=n_rows)
+    fig.update_yaxes(title_text="g(r)", title_standoff=9, col=1)
+    fig.update_layout(height=300 * n_rows, width=450 * actual_cols)
+
+    if reference_line is not None:
+        hline_defaults = dict(line_dash="dash", line_color="gray", opacity=0.7)
+        fig.add_hline(y=1, **hline_defaults | reference_line)
+
+    return fig
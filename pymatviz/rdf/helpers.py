@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -11,8 +14,11 @@ from pymatviz.process_data import normalize_structures
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
     from typing import Literal
 
+    from pymatgen.core import IStructure, Structure
+
     from pymatviz.typing import AnyStructure
 
 
@@ -89,21 +95,19 @@ def calculate_rdf(
     if not center_indices or not neighbor_indices:
         return radii, rdf  # Return zeros if no centers or neighbors
 
-    center_neighbors = find_points_in_spheres(
-        all_coords=struct.cart_coords,
-        center_coords=struct.cart_coords[center_indices],
-        r=cutoff,
-        # Convert bools to ints (needed for cython code)
-        pbc=np.array([*map(int, pbc)]),
-        lattice=struct.lattice.matrix,
+    _centers, neighbors, bin_indices = _binned_neighbor_pairs(
+        struct.cart_coords,
+        struct.lattice.matrix,
+        cutoff=cutoff,
+        n_bins=n_bins,
+        pbc=pbc,
+        center_indices=center_indices,
     )
 
     # Filter distances for the specific neighbor species and bin them
-    neighbor_set = set(neighbor_indices)
-    for idx1, idx2, _, dist in zip(*center_neighbors, strict=True):
-        if idx2 in neighbor_set and center_indices[idx1] != idx2 and 0 < dist < cutoff:
-            bin_index = min(int(dist / bin_size), n_bins - 1)
-            rdf[bin_index] += 1
+    is_neighbor = np.zeros(len(struct), dtype=bool)
+    is_neighbor[neighbor_indices] = True
+    rdf += np.bincount(bin_indices[is_neighbor[neighbors]], minlength=n_bins)
 
     # Normalize RDF by the number of center-neighbor pairs and shell volumes
     n_center = len(center_indices)
@@ -122,3 +126,314 @@ def calculate_rdf(
     rdf /= shell_volumes / struct.volume
 
     return radii, rdf
+
+
+def calculate_all_pair_rdfs(
+    structure: AnyStructure,
+    cutoff: float = 15,
+    n_bins: int = 75,
+    pbc: tuple[Literal[0, 1], Literal[0, 1], Literal[0, 1]] = (1, 1, 1),
+    element_pairs: Sequence[tuple[str, str]] | None = None,
+) -> tuple[np.ndarray, dict[tuple[str, str], np.ndarray]]:
+    """Calculate partial RDFs for many element pairs from a single neighbor search.
+
+    Equivalent to calling calculate_rdf(structure, el1, el2, ...) for every pair but
+    runs find_points_in_spheres only once and bins all pairs at the same time with
+    np.bincount on a combined (center group, neighbor group, bin) index.
+
+    Args:
+        structure (AnyStructure): A pymatgen Structure/IStructure object or ASE Atoms
+            object.
+        cutoff (float, optional): Maximum distance for RDF calculation. Default is 15 Å.
+        n_bins (int, optional): Number of bins for RDF calculation. Default is 75.
+        pbc (tuple[int, int, int], optional): Periodic boundary conditions as any
+            3-tuple of 0s/1s. Defaults to (1, 1, 1).
+        element_pairs (Sequence[tuple[str, str]], optional): (center, neighbor)
+            element pairs to compute. Elements not present in the structure yield
+            all-zero RDFs. If None, all pairs (el1, el2) with el1 <= el2 of elements
+            in the structure are computed.
+
+    Returns:
+        tuple[np.ndarray, dict[tuple[str, str], np.ndarray]]: Radii and a dict
+            mapping each element pair to its g(r) values.
+
+    Raises:
+        ValueError: If cutoff or n_bins are not positive values.
+        TypeError: If structure is not a supported type.
+    """
+    struct = next(iter(normalize_structures(structure).values()))
+    rdf_inputs = _pair_rdf_inputs(struct)
+    elements = rdf_inputs[-1]
+    if element_pairs is None:
+        element_pairs = [
+            (el1, el2) for el1 in elements for el2 in elements if el1 <= el2
+        ]
+
+    # Handle empty structure
+    if len(struct) == 0:
+        radii = np.linspace(cutoff / n_bins, cutoff, n_bins)
+        return radii, {pair: np.zeros(n_bins) for pair in element_pairs}
+    if cutoff <= 0:
+        raise ValueError(f"{cutoff=} must be positive")
+    if n_bins <= 0:
+        raise ValueError(f"{n_bins=} must be positive")
+
+    return _pair_rdfs_from_arrays(
+        rdf_inputs, cutoff=cutoff, n_bins=n_bins, pbc=pbc, element_pairs=element_pairs
+    )
+
+
+def _pair_rdf_inputs(
+    struct: Structure | IStructure, *, by_element: bool = True
+) -> tuple[np.ndarray, np.ndarray, float, np.ndarray, np.ndarray, list[str]]:
+    """Reduce a structure to the plain arrays needed by _pair_rdfs_from_arrays.
+
+    These are cheap to send to worker processes, unlike pickled Structures.
+
+    Args:
+        struct (Structure | IStructure): The structure to convert.
+        by_element (bool): If False, put all sites into a single group with label
+            "" to get the full (species-agnostic) RDF under the key ("", "").
+
+    Returns:
+        tuple: (lattice matrix, Cartesian coords, volume, site group index per site,
+            (n_groups, n_elements) group-element membership matrix, elements).
+    """
+    # Import here to avoid circular import
+    from pymatviz.structure.helpers import get_site_elements
+
+    if not by_element:
+        site_elements = [frozenset({""})] * len(struct)
+    else:
+        site_elements = [frozenset(get_site_elements(site)) for site in struct]
+    elements = sorted(set().union(*site_elements))
+
+    # Group sites by their set of elements (one group per element for ordered
+    # structures) so disordered sites count towards every element they contain
+    groups = sorted(set(site_elements), key=sorted)
+    group_of_site = np.array([groups.index(elems) for elems in site_elements])
+    membership = np.array(
+        [[el in group for el in elements] for group in groups], dtype=np.int64
+    ).reshape(len(groups), len(elements))
+
+    return (
+        struct.lattice.matrix,
+        struct.cart_coords,
+        struct.volume,
+        group_of_site,
+        membership,
+        elements,
+    )
+
+
+def _pair_rdfs_from_arrays(
+    rdf_inputs: tuple[np.ndarray, np.ndarray, float, np.ndarray, np.ndarray, list[str]],
+    *,
+    cutoff: float,
+    n_bins: int,
+    pbc: tuple[Literal[0, 1], Literal[0, 1], Literal[0, 1]],
+    element_pairs: Sequence[tuple[str, str]],
+) -> tuple[np.ndarray, dict[tuple[str, str], np.ndarray]]:
+    """Compute partial RDFs from the arrays returned by _pair_rdf_inputs."""
+    lattice_matrix, cart_coords, volume, group_of_site, membership, elements = (
+        rdf_inputs
+    )
+    bin_size = cutoff / n_bins
+    radii = np.linspace(0, cutoff, n_bins + 1)[1:]
+
+    n_groups = len(membership)
+    n_sites_per_elem = membership.T @ np.bincount(group_of_site, minlength=n_groups)
+
+    centers, neighbors, bin_indices = _binned_neighbor_pairs(
+        cart_coords, lattice_matrix, cutoff=cutoff, n_bins=n_bins, pbc=pbc
+    )
+    combined_idx = (
+        group_of_site[centers] * n_groups + group_of_site[neighbors]
+    ) * n_bins + bin_indices
+    group_counts = np.bincount(
+        combined_idx, minlength=n_groups * n_groups * n_bins
+    ).reshape(n_groups, n_groups, n_bins)
+    elem_counts = np.einsum("ga,hb,ghk->abk", membership, membership, group_counts)
+
+    shell_volumes = 4 * np.pi * radii**2 * bin_size
+    elem_idx = {el: idx for idx, el in enumerate(elements)}
+    rdfs: dict[tuple[str, str], np.ndarray] = {}
+    for el1, el2 in element_pairs:
+        if el1 not in elem_idx or el2 not in elem_idx:
+            rdfs[el1, el2] = np.zeros_like(radii)
+            continue
+        idx1, idx2 = elem_idx[el1], elem_idx[el2]
+        n_center, n_neighbor = n_sites_per_elem[idx1], n_sites_per_elem[idx2]
+        if el1 == el2:
+            normalization = n_center * (n_neighbor - 1)  # Exclude self-interactions
+        else:
+            normalization = n_center * n_neighbor
+
+        pair_counts = elem_counts[idx1, idx2]
+        # no pairs to normalize by (e.g. single site of el1 == el2) or no neighbors
+        # within cutoff: return zero RDF instead of dividing by a zero count
+        if normalization == 0 or not pair_counts.any():
+            rdfs[el1, el2] = np.zeros_like(radii)
+            continue
+
+        rdf = pair_counts.astype(float)
+        rdf /= int(normalization)
+        rdf /= shell_volumes / volume
+        rdfs[el1, el2] = rdf
+
+    return radii, rdfs
+
+
+def _map_pair_rdfs(
+    structures: Iterable[Structure | IStructure],
+    cutoff: float,
+    n_bins: int,
+    pbc: tuple[Literal[0, 1], Literal[0, 1], Literal[0, 1]] = (1, 1, 1),
+    element_pairs: Sequence[tuple[str, str]] = (("", ""),),
+    *,
+    by_element: bool = True,
+    n_jobs: int | None = 1,
+) -> list[tuple[np.ndarray, dict[tuple[str, str], np.ndarray]]]:
+    """Compute pair RDFs for many structures, optionally in a process pool.
+
+    Only plain NumPy arrays are sent to workers and results are returned in the
+    same order as structures, so output is identical to the serial path.
+
+    Args:
+        structures (Iterable[Structure | IStructure]): Structures to process.
+        cutoff (float): Maximum distance for RDF calculation.
+        n_bins (int): Number of bins for RDF calculation.
+        pbc (tuple[int, int, int]): Periodic boundary conditions.
+        element_pairs (Sequence[tuple[str, str]]): Element pairs to compute.
+            Defaults to the full RDF key ("", "") for by_element=False.
+        by_element (bool): See _pair_rdf_inputs.
+        n_jobs (int | None): Number of worker processes. 1 (default) runs serially
+            in the current process. None uses all available cores.
+
+    Returns:
+        list[tuple[np.ndarray, dict[tuple[str, str], np.ndarray]]]: Radii and
+            pair RDFs for each structure.
+
+    Raises:
+        ValueError: If cutoff or n_bins are not positive values.
+    """
+    if cutoff <= 0:
+        raise ValueError(f"{cutoff=} must be positive")
+    if n_bins <= 0:
+        raise ValueError(f"{n_bins=} must be positive")
+
+    jobs = [_pair_rdf_inputs(struct, by_element=by_element) for struct in structures]
+    pair_rdfs = partial(
+        _pair_rdfs_from_arrays,
+        cutoff=cutoff,
+        n_bins=n_bins,
+        pbc=pbc,
+        element_pairs=element_pairs,
+    )
+    n_workers = min(n_jobs or os.cpu_count() or 1, len(jobs))
+    if n_workers <= 1:
+        return [pair_rdfs(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        # executor.map preserves input order
+        return list(executor.map(pair_rdfs, jobs))
+
+
+def _binned_neighbor_pairs(
+    cart_coords: np.ndarray,
+    lattice_matrix: np.ndarray,
+    *,
+    cutoff: float,
+    n_bins: int,
+    pbc: tuple[Literal[0, 1], Literal[0, 1], Literal[0, 1]],
+    center_indices: Sequence[int] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run one neighbor search and assign each neighbor pair to a radial bin.
+
+    Self-pairs (including periodic images of the center site) and pairs outside
+    (0, cutoff) are dropped.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Site indices of centers and
+            neighbors and the bin index of each pair.
+    """
+    center_idx_arr = (
+        np.arange(len(cart_coords))
+        if center_indices is None
+        else np.asarray(center_indices, dtype=int)
+    )
+    idx1, idx2, _, dists = find_points_in_spheres(
+        all_coords=cart_coords,
+        center_coords=cart_coords[center_idx_arr],
+        r=cutoff,
+        # Convert bools to ints (needed for cython code)
+        pbc=np.array([*map(int, pbc)]),
+        lattice=lattice_matrix,
+    )
+    centers = center_idx_arr[idx1]
+    mask = (centers != idx2) & (dists > 0) & (dists < cutoff)
+    bin_size = cutoff / n_bins
+    bin_indices = np.minimum((dists[mask] / bin_size).astype(int), n_bins - 1)
+
+    return centers[mask], idx2[mask], bin_indices
+
+
+def calculate_trajectory_rdfs(
+    frames: Iterable[AnyStructure],
+    cutoff: float = 15,
+    n_bins: int = 75,
+    element_pairs: Sequence[tuple[str, str]] | None = None,
+    pbc: tuple[Literal[0, 1], Literal[0, 1], Literal[0, 1]] = (1, 1, 1),
+) -> tuple[np.ndarray, dict[tuple[str, str], tuple[np.ndarray, np.ndarray]]]:
+    """Calculate frame-averaged partial RDFs over an MD trajectory.
+
+    Frames are consumed one at a time (e.g. from a generator reading a trajectory
+    file) and only running sums are kept, so memory use is independent of the
+    number of frames. Each frame's RDFs are normalized by its own volume before
+    averaging, so NPT trajectories with fluctuating cells are handled correctly.
+
+    Args:
+        frames (Iterable[AnyStructure]): pymatgen Structures or ASE Atoms, one
+            per MD frame.
+        cutoff (float, optional): Maximum distance for RDF calculation. Default is 15 Å.
+        n_bins (int, optional): Number of bins for RDF calculation. Default is 75.
+        element_pairs (Sequence[tuple[str, str]], optional): Element pairs to
+            compute. If None, all pairs (el1, el2) with el1 <= el2 of elements in
+            the first frame are used.
+        pbc (tuple[int, int, int], optional): Periodic boundary conditions as any
+            3-tuple of 0s/1s. Defaults to (1, 1, 1).
+
+    Returns:
+        tuple[np.ndarray, dict[tuple[str, str], tuple[np.ndarray, np.ndarray]]]:
+            Radii and a dict mapping each element pair to (mean, std) of g(r)
+            across frames.
+
+    Raises:
+        ValueError: If frames is empty.
+    """
+    radii = np.linspace(0, cutoff, n_bins + 1)[1:]
+    n_frames = 0
+    # Welford's online algorithm for numerically stable running mean and variance
+    means: dict[tuple[str, str], np.ndarray] = {}
+    sq_dev_sums: dict[tuple[str, str], np.ndarray] = {}
+
+    for frame in frames:
+        radii, pair_rdfs = calculate_all_pair_rdfs(
+            frame, cutoff=cutoff, n_bins=n_bins, pbc=pbc, element_pairs=element_pairs
+        )
+        if n_frames == 0:
+            element_pairs = list(pair_rdfs)  # fix pairs based on first frame
+            means = {pair: np.zeros(n_bins) for pair in element_pairs}
+            sq_dev_sums = {pair: np.zeros(n_bins) for pair in element_pairs}
+        n_frames += 1
+        for pair, rdf in pair_rdfs.items():
+            delta = rdf - means[pair]
+            means[pair] += delta / n_frames
+            sq_dev_sums[pair] += delta * (rdf - means[pair])
+
+    if n_frames == 0:
+        raise ValueError("frames must contain at least one structure")
+
+    return radii, {
+        pair: (means[pair], np.sqrt(sq_dev_sums[pair] / n_frames)) for pair in means
+    }
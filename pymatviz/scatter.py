@@ -13,7 +13,7 @@ import scipy.stats
 from plotly.subplots import make_subplots
 
 import pymatviz as pmv
-from pymatviz.process_data import bin_df_cols, df_to_arrays
+from pymatviz.process_data import _bin_codes, bin_df_cols, binned_kde, df_to_arrays
 
 
 if TYPE_CHECKING:
@@ -21,15 +21,19 @@ if TYPE_CHECKING:
 
     from numpy.typing import ArrayLike
 
+    from pymatviz.typing import DataFrameLike, HexReduceFunc
+
 
 def _get_axis_labels(
-    x: ArrayLike | str, y: ArrayLike | str, df: pd.DataFrame | None = None
+    x: ArrayLike | str, y: ArrayLike | str, df: DataFrameLike | None = None
 ) -> tuple[str, str]:
     """Extract axis labels from data or column names."""
-    if df is not None:
+    if isinstance(df, pd.DataFrame):
         # x, y are column names (str) when df is provided
         xlabel: str = getattr(df[x], "name", x)  # type: ignore[arg-type]
         ylabel: str = getattr(df[y], "name", y)  # type: ignore[arg-type]
+    elif df is not None:  # Polars, Arrow, ... columns are labeled by their names
+        xlabel, ylabel = str(x), str(y)
     else:
         xlabel = getattr(x, "name", x if isinstance(x, str) else "Actual")
         ylabel = getattr(y, "name", y if isinstance(y, str) else "Predicted")
@@ -62,13 +66,19 @@ def _add_marginal_histograms(
     xlabel: str,
     ylabel: str,
 ) -> None:
-    """Add marginal histograms to subplot figure."""
+    """Add marginal histograms to subplot figure.
+
+    Marginals are binned here with np.histogram (ignoring non-finite values) and
+    added as bar traces so figure size is independent of the number of points.
+    """
     # Top histogram (x-axis marginal)
-    hist_x, bin_edges_x = np.histogram(xs, bins=bins)
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    hist_x, bin_edges_x = np.histogram(xs[np.isfinite(xs)], bins=bins)
     bin_centers_x = (bin_edges_x[:-1] + bin_edges_x[1:]) / 2
     subplot_fig.add_bar(
         x=bin_centers_x,
         y=hist_x,
+        width=np.diff(bin_edges_x),
         opacity=0.7,
         marker_line_width=0,
         showlegend=False,
@@ -77,11 +87,12 @@ def _add_marginal_histograms(
     )
 
     # Right histogram (y-axis marginal)
-    hist_y, bin_edges_y = np.histogram(ys, bins=bins)
+    hist_y, bin_edges_y = np.histogram(ys[np.isfinite(ys)], bins=bins)
     bin_centers_y = (bin_edges_y[:-1] + bin_edges_y[1:]) / 2
     subplot_fig.add_bar(
         x=hist_y,
         y=bin_centers_y,
+        width=np.diff(bin_edges_y),
         opacity=0.7,
         marker_line_width=0,
         orientation="h",
@@ -93,6 +104,7 @@ def _add_marginal_histograms(
     # Remove lines from all axes
     subplot_fig.update_layout(
         showlegend=False,
+        bargap=0,
         xaxis=dict(showline=False, title=xlabel, showticklabels=False),
         yaxis=dict(showline=False, showticklabels=True),
         xaxis2=dict(showline=False, showticklabels=True),
@@ -108,10 +120,11 @@ def density_scatter(
     x: ArrayLike | str,
     y: ArrayLike | str,
     *,
-    df: pd.DataFrame | None = None,
-    density: Literal["kde", "empirical"] | None = None,
+    df: DataFrameLike | None = None,
+    density: Literal["kde", "binned_kde", "empirical"] | None = None,
     log_density: bool | None = None,
     n_bins: int | None | Literal[False] = None,
+    raster: bool = False,
     bin_counts_col: str | None = None,
     xlabel: str | None = None,
     ylabel: str | None = None,
@@ -131,15 +144,25 @@ def density_scatter(
     Args:
         x (array | str): x-values or dataframe column name.
         y (array | str): y-values or dataframe column name.
-        df (pd.DataFrame, optional): DataFrame with x and y columns. Defaults to None.
-        density ('kde' | 'empirical'): Determines the method for calculating and
-            displaying density. Default is 'empirical' when n_bins is provided,
-            else 'kde' for kernel density estimation.
+        df (DataFrameLike, optional): pandas, Polars or Arrow DataFrame with x and y
+            columns. Defaults to None.
+        density ('kde' | 'binned_kde' | 'empirical'): Determines the method for
+            calculating and displaying density. Default is 'empirical' when n_bins is
+            provided, else 'kde' for kernel density estimation. 'binned_kde' is a
+            fast grid approximation of 'kde' for large datasets (see
+            pymatviz.process_data.binned_kde for accuracy).
         log_density (bool | None): Whether to apply logarithmic scaling to density.
             If None, automatically set based on density range.
         n_bins (int | None | False, optional): Number of bins for histogram.
             If None, automatically enables binning mode if the number of datapoints
             exceeds 1000, else defaults to False (no binning).
+        raster (bool, optional): If True, aggregate points into an n_bins x n_bins
+            density image (same bins as binning mode, 200 x 200 if n_bins is None or
+            False) rendered as a single go.Heatmap trace instead of one marker per
+            occupied bin. Figure size and render time then stay constant no matter
+            the number of points. Not supported with facet_col. **kwargs are passed
+            to go.Heatmap() instead of px.scatter() (except color_continuous_scale).
+            Defaults to False.
         bin_counts_col (str, optional): Column name for bin counts. Defaults to
             "Point<br>Density". Will be used as color bar title.
         xlabel (str, optional): x-axis label. Auto-detected from data if None.
@@ -175,9 +198,14 @@ def density_scatter(
         x = xlabel if isinstance(xlabel, str) else "x"
         y = ylabel if isinstance(ylabel, str) else "y"
         df_data = pd.DataFrame({x: xs, y: ys})
-    else:
+    elif isinstance(df, pd.DataFrame):
         df_data = df
         x, y = str(x), str(y)  # x and y are column names when df is provided
+    else:  # only convert the needed columns of Polars, Arrow, ... dataframes
+        col_names = [x, y, *([facet_col] if facet_col else [])]
+        col_arrays = df_to_arrays(df, *col_names)
+        df_data = pd.DataFrame(dict(zip(col_names, col_arrays, strict=True)))
+        x, y = str(x), str(y)
     if xlabel is None or ylabel is None:
         auto_xlabel, auto_ylabel = _get_axis_labels(x, y, df)
         xlabel = xlabel or auto_xlabel
@@ -185,12 +213,22 @@ def density_scatter(
 
     bin_counts_col = bin_counts_col or "Point<br>Density"
 
+    if raster:
+        if facet_col:
+            raise ValueError("raster=True is not supported with facet_col")
+        n_bins = n_bins or 200
+
     if n_bins is None:  # auto-enable binning depending on data size
         n_bins = 200 if len(df_data) > 1000 else False
 
     density = density or ("empirical" if n_bins else "kde")
 
-    if facet_col:  # Group the dataframe based on the facet column
+    if raster:
+        x_centers, y_centers, density_image = _raster_density(
+            df_data[x], df_data[y], n_bins, density
+        )
+        color_vals = density_image[~np.isnan(density_image)]
+    elif facet_col:  # Group the dataframe based on the facet column
         grouped = df_data.groupby(facet_col)
         binned_dfs = []
 
@@ -207,8 +245,8 @@ def density_scatter(
         df_plot = _bin_and_calculate_density(
             df_data, x, y, density, n_bins, bin_counts_col
         )
-
-    color_vals = df_plot[bin_counts_col]
+    if not raster:
+        color_vals = df_plot[bin_counts_col]
 
     if log_density is None:
         positive = color_vals[color_vals > 0]
@@ -224,15 +262,35 @@ def density_scatter(
 
     kwargs = dict(color_continuous_scale="Viridis") | kwargs
 
-    fig = px.scatter(
-        df_plot,
-        x=x,
-        y=y,
-        color=color_vals,
-        facet_col=facet_col,
-        custom_data=[bin_counts_col],
-        **kwargs,
-    )
+    if raster:
+        colorscale = kwargs.pop("color_continuous_scale")
+        image_vals = np.log10(density_image + 1) if log_density else density_image
+        fig = go.Figure(
+            go.Heatmap(
+                x=x_centers,
+                y=y_centers,
+                # float32 halves the (base64-encoded) image size in the figure JSON
+                z=image_vals.astype(np.float32),
+                customdata=density_image[..., None].astype(np.float32),
+                coloraxis="coloraxis",
+                hoverongaps=False,
+                **kwargs,
+            )
+        )
+        fig.layout.coloraxis.colorscale = colorscale
+        fig.layout.coloraxis.colorbar.title = bin_counts_col
+        fig.layout.xaxis.title = x
+        fig.layout.yaxis.title = y
+    else:
+        fig = px.scatter(
+            df_plot,
+            x=x,
+            y=y,
+            color=color_vals,
+            facet_col=facet_col,
+            custom_data=[bin_counts_col],
+            **kwargs,
+        )
 
     colorbar_defaults = dict(thickness=15)
     fig.layout.coloraxis.colorbar.update(colorbar_defaults | (colorbar_kwargs or {}))
@@ -270,9 +328,63 @@ def density_scatter(
         best_fit_line=best_fit_line,
         stats=stats,
     )
+    if raster:  # identity line is drawn below traces, i.e. hidden by the image
+        fig.update_shapes(layer="above")
     return fig
 
 
+def _raster_density(
+    xs: pd.Series, ys: pd.Series, n_bins: int, density: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Aggregate points into an n_bins x n_bins density image.
+
+    Uses the same bins as bin_df_cols, so pixel values are the bin counts (or KDE
+    densities) density_scatter shows in binning mode.
+
+    Args:
+        xs (pd.Series): x-values.
+        ys (pd.Series): y-values.
+        n_bins (int): Number of pixels along each axis.
+        density ("kde" | "binned_kde" | "empirical"): How to compute pixel values.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: x and y pixel centers and the
+            density image of shape (n_y_pixels, n_x_pixels), NaN for empty pixels.
+    """
+    is_valid = (xs.notna() & ys.notna()).to_numpy()
+    if not is_valid.any():
+        return np.array([]), np.array([]), np.empty((0, 0))
+
+    x_codes, x_bins = _bin_codes(xs, n_bins)
+    y_codes, y_bins = _bin_codes(ys, n_bins)
+    pixel_indices = y_codes[is_valid] * len(x_bins) + x_codes[is_valid]
+    counts = np.bincount(pixel_indices, minlength=len(x_bins) * len(y_bins))
+    image = counts.reshape(len(y_bins), len(x_bins)).astype(float)
+    image[image == 0] = np.nan
+    x_centers, y_centers = x_bins.mid.to_numpy(), y_bins.mid.to_numpy()
+
+    if density in ("kde", "binned_kde"):
+        if is_valid.sum() <= 1:
+            warnings.warn(
+                "Not enough data points for KDE, using empirical density",
+                stacklevel=3,
+            )
+            return x_centers, y_centers, image
+        values = np.stack([xs[is_valid], ys[is_valid]]).astype(float)
+        y_pixels, x_pixels = np.nonzero(~np.isnan(image))
+        pixel_centers = np.stack([x_centers[x_pixels], y_centers[y_pixels]])
+        if density == "binned_kde":
+            kde_vals = binned_kde(values, pixel_centers)
+        else:
+            kde_vals = scipy.stats.gaussian_kde(values)(pixel_centers)
+        # same normalization as bin_df_cols' density_col
+        image[y_pixels, x_pixels] = kde_vals / kde_vals.sum() * len(values[0])
+    elif density != "empirical":
+        raise ValueError(f"Unknown {density=}")
+
+    return x_centers, y_centers, image
+
+
 def _bin_and_calculate_density(
     df: pd.DataFrame,
     x: str,
@@ -289,13 +401,14 @@ def _bin_and_calculate_density(
         return df_empty
 
     if n_bins:
-        density_col = "bin_counts_kde" if density == "kde" else None
+        density_col = "bin_counts_kde" if density in ("kde", "binned_kde") else None
         df_plot = bin_df_cols(
             df,
             bin_by_cols=[x, y],
             n_bins=n_bins,
             bin_counts_col=bin_counts_col,
             density_col=density_col or "",
+            density_method="binned_kde" if density == "binned_kde" else "kde",
         ).sort_values(bin_counts_col)
         # sort by counts so densest points are plotted last
 
@@ -306,11 +419,13 @@ def _bin_and_calculate_density(
     else:
         df_plot = df.copy()
         values = df[[x, y]].dropna().T
-        if density == "kde" and len(values.columns) > 1:
+        if density == "binned_kde" and len(values.columns) > 1:
+            df_plot[bin_counts_col] = binned_kde(values, df_plot[[x, y]].T)
+        elif density == "kde" and len(values.columns) > 1:
             model_kde = scipy.stats.gaussian_kde(values)
             df_plot[bin_counts_col] = model_kde(df_plot[[x, y]].T)
         else:
-            if density == "kde" and len(values.columns) <= 1:
+            if density in ("kde", "binned_kde") and len(values.columns) <= 1:
                 warnings.warn(
                     "Not enough data points for KDE, using empirical density",
                     stacklevel=2,
@@ -425,12 +540,123 @@ def _update_colorbar_for_log_density(
     colorbar.title = bin_counts_col.replace(" ", "<br>")
 
 
+def hex_bin(
+    xs: ArrayLike,
+    ys: ArrayLike,
+    *,
+    gridsize: int = 75,
+    weights: ArrayLike | None = None,
+    reduce_func: HexReduceFunc = "sum",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bin points into a hexagonal grid, vectorized like matplotlib's hexbin.
+
+    Hexagon centers form two interleaved rectangular lattices. Each point is
+    rounded to the nearest center of both lattices and assigned to the closer one
+    (in units where hexagons are regular). Values are aggregated with np.bincount
+    (sum, mean) or a sort by hexagon (median, min, max, callables).
+
+    Args:
+        xs (ArrayLike): x-values.
+        ys (ArrayLike): y-values.
+        gridsize (int): Number of hexagons in x direction. Defaults to 75.
+        weights (ArrayLike, optional): Value of each point. Defaults to 1 per point.
+        reduce_func ("sum" | "mean" | "median" | "min" | "max" | Callable): How to
+            reduce the weights in each hexagon. Defaults to "sum".
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: x and y coordinates of the
+            centers of all non-empty hexagons and their reduced values.
+    """
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    weights = np.ones(len(xs)) if weights is None else np.asarray(weights, dtype=float)
+    if not len(xs) == len(ys) == len(weights):
+        raise ValueError(f"{len(xs)=}, {len(ys)=} and {len(weights)=} must be equal")
+    is_finite = np.isfinite(xs) & np.isfinite(ys)
+    xs, ys, weights = xs[is_finite], ys[is_finite], weights[is_finite]
+    if len(xs) == 0:
+        return np.array([]), np.array([]), np.array([])
+
+    n_x = gridsize
+    n_y = max(int(n_x / np.sqrt(3)), 1)
+    x_min, x_max, y_min, y_max = xs.min(), xs.max(), ys.min(), ys.max()
+    # same range padding as np.histogram2d for zero-width data
+    if x_min == x_max:
+        x_min, x_max = x_min - 0.5, x_max + 0.5
+    if y_min == y_max:
+        y_min, y_max = y_min - 0.5, y_max + 0.5
+    # pad x like matplotlib so points on x_max fall into the last column of lattice
+    # 2 instead of one past it (y_max always rounds to a lattice 1 node)
+    x_pad = 1e-9 * (x_max - x_min)
+    x_min, x_max = x_min - x_pad, x_max + x_pad
+    x_step, y_step = (x_max - x_min) / n_x, (y_max - y_min) / n_y
+
+    # fractional lattice coordinates, hexagons are regular if y is scaled by sqrt(3)
+    x_pos, y_pos = (xs - x_min) / x_step, (ys - y_min) / y_step
+    x_idx1, y_idx1 = np.round(x_pos), np.round(y_pos)  # lattice 1: integer nodes
+    x_idx2, y_idx2 = np.floor(x_pos), np.floor(y_pos)  # lattice 2: (i + 1/2, j + 1/2)
+    dist1 = (x_pos - x_idx1) ** 2 + 3 * (y_pos - y_idx1) ** 2
+    dist2 = (x_pos - x_idx2 - 0.5) ** 2 + 3 * (y_pos - y_idx2 - 0.5) ** 2
+    in_lattice1 = dist1 < dist2
+
+    n_nodes1 = (n_x + 1) * (n_y + 1)
+    hex_indices = np.where(
+        in_lattice1,
+        x_idx1 * (n_y + 1) + y_idx1,
+        n_nodes1 + np.clip(x_idx2, 0, n_x - 1) * n_y + np.clip(y_idx2, 0, n_y - 1),
+    ).astype(np.int64)
+    n_hexagons = n_nodes1 + n_x * n_y
+
+    counts = np.bincount(hex_indices, minlength=n_hexagons)
+    non_empty = np.flatnonzero(counts)
+    if reduce_func == "sum":
+        values = np.bincount(hex_indices, weights=weights, minlength=n_hexagons)
+        values = values[non_empty]
+    elif reduce_func == "mean":
+        values = np.bincount(hex_indices, weights=weights, minlength=n_hexagons)
+        values = values[non_empty] / counts[non_empty]
+    else:
+        # sort points by hexagon (and weight for median) to reduce contiguous groups
+        order = np.lexsort((weights, hex_indices))
+        sorted_weights = weights[order]
+        group_starts = np.r_[0, np.cumsum(counts[non_empty])[:-1]]
+        if reduce_func == "min":
+            values = np.minimum.reduceat(sorted_weights, group_starts)
+        elif reduce_func == "max":
+            values = np.maximum.reduceat(sorted_weights, group_starts)
+        elif reduce_func == "median":
+            group_counts = counts[non_empty]
+            lower = sorted_weights[group_starts + (group_counts - 1) // 2]
+            upper = sorted_weights[group_starts + group_counts // 2]
+            values = (lower + upper) / 2
+        elif callable(reduce_func):
+            values = np.array(
+                [
+                    reduce_func(group)
+                    for group in np.split(sorted_weights, group_starts[1:])
+                ]
+            )
+        else:
+            raise ValueError(
+                f"Unknown {reduce_func=}, must be one of sum, mean, median, min, max "
+                "or a callable"
+            )
+
+    in_lattice2 = non_empty >= n_nodes1
+    lattice_idx = np.where(in_lattice2, non_empty - n_nodes1, non_empty)
+    n_cols = np.where(in_lattice2, n_y, n_y + 1)
+    offset = np.where(in_lattice2, 0.5, 0)
+    hex_x = x_min + (lattice_idx // n_cols + offset) * x_step
+    hex_y = y_min + (lattice_idx % n_cols + offset) * y_step
+    return hex_x, hex_y, values
+
+
 def density_hexbin(
     x: ArrayLike | str,
     y: ArrayLike | str,
     *,
-    df: pd.DataFrame | None = None,
+    df: DataFrameLike | None = None,
     weights: ArrayLike | None = None,
+    reduce_func: HexReduceFunc = "sum",
     gridsize: int = 75,
     identity_line: bool | dict[str, Any] = True,
     best_fit_line: bool | dict[str, Any] = True,
@@ -445,10 +671,16 @@ def density_hexbin(
     Args:
         x (array | str): x-values or dataframe column name.
         y (array | str): y-values or dataframe column name.
-        df (pd.DataFrame, optional): DataFrame with x and y columns. Defaults to None.
+        df (DataFrameLike, optional): pandas, Polars or Arrow DataFrame with x and y
+            columns. Defaults to None.
         weights (array, optional): If given, these values are accumulated in the bins.
             Otherwise, every point has value 1. Must be of the same length as x and y.
-        gridsize (int, optional): Number of hexagons in the x and y directions.
+        reduce_func ("sum" | "mean" | "median" | "min" | "max" | Callable): How to
+            reduce the weights of all points in a hexagon to its color value (like
+            reduce_C_function of matplotlib's hexbin). Callables receive a 1D array
+            of weights per hexagon. Defaults to "sum".
+        gridsize (int, optional): Number of hexagons in the x direction. The number
+            in y direction is chosen to make hexagons regular (in axes units).
             Defaults to 75.
         identity_line (bool | dict[str, Any], optional): Whether to add a parity line
             (y = x). Defaults to True. Pass a dict to customize line properties.
@@ -470,31 +702,10 @@ def density_hexbin(
     xs, ys = df_to_arrays(df, x, y)
     xlabel, ylabel = _get_axis_labels(x, y, df)
 
-    # Use numpy's histogram2d for initial binning, then convert to hex coordinates
-    hist, x_edges, y_edges = np.histogram2d(  # type: ignore[no-matching-overload]
-        xs, ys, bins=gridsize, weights=weights
+    x_plot, y_plot, z_plot = hex_bin(
+        xs, ys, gridsize=gridsize, weights=weights, reduce_func=reduce_func
     )
 
-    # Create hexagonal grid from rectangular bins
-    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
-    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
-
-    # Convert to hexagonal tessellation pattern
-    hex_x, hex_y, hex_counts = [], [], []
-    hex_width = x_edges[1] - x_edges[0]
-
-    for ii, x_center in enumerate(x_centers):
-        for jj, y_center in enumerate(y_centers):
-            count = hist[ii, jj]
-            if count > 0:
-                # Apply hexagonal offset for alternating rows
-                x_offset = hex_width / 2 if jj % 2 == 1 else 0
-                hex_x.append(x_center + x_offset)
-                hex_y.append(y_center)
-                hex_counts.append(count)
-
-    x_plot, y_plot, z_plot = np.array(hex_x), np.array(hex_y), np.array(hex_counts)
-
     # Create the scatter plot with hexagon markers
     fig = go.Figure()
 
@@ -542,9 +753,9 @@ def density_scatter_with_hist(
     x: ArrayLike | str,
     y: ArrayLike | str,
     *,
-    df: pd.DataFrame | None = None,
+    df: DataFrameLike | None = None,
     bins: int = 100,
-    density: Literal["kde", "empirical"] | None = None,
+    density: Literal["kde", "binned_kde", "empirical"] | None = None,
     log_density: bool | None = None,
     n_bins: int | None | Literal[False] = None,
     **kwargs: Any,
@@ -554,9 +765,11 @@ def density_scatter_with_hist(
     Args:
         x (array | str): x-values or dataframe column name.
         y (array | str): y-values or dataframe column name.
-        df (pd.DataFrame, optional): DataFrame with x and y columns. Defaults to None.
+        df (DataFrameLike, optional): pandas, Polars or Arrow DataFrame with x and y
+            columns. Defaults to None.
         bins (int, optional): Number of bins for marginal histograms. Defaults to 100.
-        density ("kde" | "empirical" | None): Method for density calculation.
+        density ("kde" | "binned_kde" | "empirical" | None): Method for density
+            calculation.
         log_density (bool | None): Whether to log-scale the density colors.
         n_bins (int | None | False): Number of bins for empirical density calculation.
         **kwargs: Additional arguments passed to the main density scatter plot.
@@ -611,7 +824,7 @@ def density_hexbin_with_hist(
     x: ArrayLike | str,
     y: ArrayLike | str,
     *,
-    df: pd.DataFrame | None = None,
+    df: DataFrameLike | None = None,
     bins: int = 100,
     gridsize: int = 75,
     **kwargs: Any,
@@ -622,7 +835,8 @@ def density_hexbin_with_hist(
     Args:
         x (array | str): x-values or dataframe column name.
         y (array | str): y-values or dataframe column name.
-        df (pd.DataFrame, optional): DataFrame with x and y columns. Defaults to None.
+        df (DataFrameLike, optional): pandas, Polars or Arrow DataFrame with x and y
+            columns. Defaults to None.
         bins (int, optional): Number of bins for marginal histograms. Defaults to 100.
         gridsize (int, optional): Number of hexagons in the x and y directions.
             Defaults to 75.
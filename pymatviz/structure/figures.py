@@ -51,6 +51,8 @@ def structure_2d(
     | Callable[[PeriodicSite], str] = SiteCoords.cartesian_fractional,
     hover_float_fmt: str | Callable[[float], str] = ".4",
     bond_kwargs: dict[str, Any] | None = None,
+    batch_sites: bool | None = None,
+    batch_bonds: bool | None = None,
 ) -> go.Figure:
     """Plot pymatgen structures in 2D with Plotly.
 
@@ -123,6 +125,16 @@ def structure_2d(
         bond_kwargs (dict[str, Any], optional): For customizing bond lines. Keys are
             line properties (e.g., "color", "width"), values are the corresponding
             values. Defaults to None.
+        batch_sites (bool | None, optional): Whether to draw all ordered sites of the
+            same element as a single trace (much faster to build and render for
+            large structures) instead of one trace per site. Legend entries are
+            unchanged. Defaults to None, meaning batch if a structure has more than
+            200 sites (incl. image sites).
+        batch_bonds (bool | None, optional): Whether to draw all bonds of the same
+            color as a single trace of NaN-separated lines instead of one trace per
+            bond segment. Per-bond traces can be individually restyled after
+            plotting. Defaults to None, meaning batch if a structure has more than
+            200 sites (incl. image sites).
 
     Returns:
         go.Figure: Plotly figure showing the 2D structure(s).
@@ -234,6 +246,28 @@ def structure_2d(
             plotted_sites_coords = {
                 tuple(np.round(site.coords, 5)) for site in augmented_structure
             }
+            legend_name = f"legend{idx}" if idx > 1 and n_structs > 1 else "legend"
+            batch_sites_i = (
+                len(augmented_structure) > helpers.BATCH_SITES_MIN_SITES
+                if batch_sites is None
+                else batch_sites
+            )
+            # (site, coords, site_idx, is_image, legendgroup, showlegend) to batch-draw
+            sites_to_draw: list[
+                tuple[PeriodicSite, np.ndarray, int, bool, str | None, bool]
+            ] = []
+
+            if show_image_sites:  # get image sites of all primary sites at once
+                image_site_indices, image_cart_coords = helpers._image_site_coords(
+                    struct_i.frac_coords,
+                    struct_i.lattice,
+                    cell_boundary_tol=cell_boundary_tol_i,
+                )
+                # split into per-site arrays (image_site_indices are sorted)
+                image_coords_per_site = np.split(
+                    image_cart_coords,
+                    np.searchsorted(image_site_indices, range(1, len(struct_i))),
+                )
 
             for site_idx_loop, (site, rotated_site_coords_3d) in enumerate(
                 zip(struct_i, rotated_coords_all_sites, strict=False)
@@ -248,27 +282,41 @@ def structure_2d(
                         showlegend = True
                         seen_elements_per_subplot[idx].add(symbol)
 
-                helpers.draw_site(  # Draw primary site
-                    fig=fig,
-                    site=site,
-                    coords=rotated_site_coords_3d,  # Pass 3D rotated coords
-                    site_idx=site_idx_loop,
-                    site_labels=site_labels,
-                    elem_colors=_elem_colors,
-                    atomic_radii=_atomic_radii,
-                    atom_size=atom_size_i,
-                    scale=scale_i,
-                    site_kwargs={} if show_sites is True else show_sites,
-                    is_3d=False,  # helpers.draw_site will project to 2D
-                    row=row,
-                    col=col,
-                    name=symbol if showlegend else f"site-{struct_key}-{site_idx_loop}",
-                    hover_text=hover_text,
-                    float_fmt=hover_float_fmt,
-                    legendgroup=legendgroup,
-                    showlegend=showlegend,
-                    legend=f"legend{idx}" if idx > 1 and n_structs > 1 else "legend",
-                )
+                if batch_sites_i:  # collect sites to draw in one trace per element
+                    sites_to_draw += [
+                        (
+                            site,
+                            rotated_site_coords_3d,
+                            site_idx_loop,
+                            False,
+                            legendgroup,
+                            showlegend,
+                        )
+                    ]
+                else:
+                    helpers.draw_site(  # Draw primary site
+                        fig=fig,
+                        site=site,
+                        coords=rotated_site_coords_3d,  # Pass 3D rotated coords
+                        site_idx=site_idx_loop,
+                        site_labels=site_labels,
+                        elem_colors=_elem_colors,
+                        atomic_radii=_atomic_radii,
+                        atom_size=atom_size_i,
+                        scale=scale_i,
+                        site_kwargs={} if show_sites is True else show_sites,
+                        is_3d=False,  # helpers.draw_site will project to 2D
+                        row=row,
+                        col=col,
+                        name=symbol
+                        if showlegend
+                        else f"site-{struct_key}-{site_idx_loop}",
+                        hover_text=hover_text,
+                        float_fmt=hover_float_fmt,
+                        legendgroup=legendgroup,
+                        showlegend=showlegend,
+                        legend=legend_name,
+                    )
 
                 if vector_prop:  # Add vector arrows for the primary site
                     vector = None
@@ -297,11 +345,7 @@ def structure_2d(
                 # Add image sites for the current primary site
                 # This uses the global show_image_sites argument.
                 if show_image_sites:
-                    image_cart_coords_arrays = helpers.get_image_sites(
-                        site,
-                        struct_i.lattice,
-                        cell_boundary_tol=cell_boundary_tol_i,
-                    )
+                    image_cart_coords_arrays = image_coords_per_site[site_idx_loop]
                     if len(image_cart_coords_arrays) > 0:
                         rotated_image_atoms_coords_3d_list = np.dot(
                             image_cart_coords_arrays, rotation_matrix
@@ -309,6 +353,18 @@ def structure_2d(
                         for image_idx, current_rotated_image_coords_3d in enumerate(
                             rotated_image_atoms_coords_3d_list
                         ):
+                            if batch_sites_i:
+                                sites_to_draw += [
+                                    (
+                                        site,
+                                        current_rotated_image_coords_3d,
+                                        site_idx_loop,
+                                        True,
+                                        legendgroup,
+                                        False,
+                                    )
+                                ]
+                                continue
                             helpers.draw_site(
                                 fig=fig,
                                 site=site,
@@ -330,10 +386,37 @@ def structure_2d(
                                 float_fmt=hover_float_fmt,
                                 legendgroup=legendgroup,  # Same as primary site
                                 showlegend=False,  # Only primary sites show in legend
-                                legend=f"legend{idx}"
-                                if idx > 1 and n_structs > 1
-                                else "legend",
+                                legend=legend_name,
                             )
+
+            if sites_to_draw:
+                sites, coords, site_indices, is_image, legendgroups, show_legend = zip(
+                    *sites_to_draw, strict=True
+                )
+                helpers.draw_sites(
+                    fig=fig,
+                    sites=sites,
+                    coords=np.array(coords),
+                    site_indices=site_indices,
+                    site_labels=site_labels,
+                    elem_colors=_elem_colors,
+                    atomic_radii=_atomic_radii,
+                    atom_size=atom_size_i,
+                    scale=scale_i,
+                    site_kwargs={} if show_sites is True else show_sites,
+                    is_image=is_image,
+                    image_site_kwargs={}
+                    if show_image_sites is True
+                    else show_image_sites,
+                    is_3d=False,
+                    row=row,
+                    col=col,
+                    hover_text=hover_text,
+                    float_fmt=hover_float_fmt,
+                    legendgroups=legendgroups,
+                    showlegend=show_legend,
+                    legend=legend_name,
+                )
         else:
             # If no sites are being rendered, set empty set to filter out all bonds
             plotted_sites_coords = set()
@@ -369,6 +452,7 @@ def structure_2d(
                     rotation_matrix=rotation_matrix,
                     elem_colors=_elem_colors,
                     plotted_sites_coords=plotted_sites_coords,
+                    batch=batch_bonds,
                 )
 
         if show_cell:
@@ -447,6 +531,8 @@ def structure_3d(
     | Callable[[PeriodicSite], str] = SiteCoords.cartesian_fractional,
     hover_float_fmt: str | Callable[[float], str] = ".4",
     bond_kwargs: dict[str, Any] | None = None,
+    batch_sites: bool | None = None,
+    batch_bonds: bool | None = None,
 ) -> go.Figure:
     """Plot pymatgen structures in 3D with Plotly.
 
@@ -516,6 +602,16 @@ def structure_3d(
         bond_kwargs (dict[str, Any], optional): For customizing bond lines. Keys are
             line properties (e.g., "color", "width"), values are the corresponding
             values. Defaults to None.
+        batch_sites (bool | None, optional): Whether to draw all ordered sites of the
+            same element as a single trace (much faster to build and render for
+            large structures) instead of one trace per site. Legend entries are
+            unchanged. Defaults to None, meaning batch if a structure has more than
+            200 sites (incl. image sites).
+        batch_bonds (bool | None, optional): Whether to draw all bonds of the same
+            color as a single trace of NaN-separated lines instead of one trace per
+            bond segment. Per-bond traces can be individually restyled after
+            plotting. Defaults to None, meaning batch if a structure has more than
+            200 sites (incl. image sites).
 
     Returns:
         go.Figure: Plotly figure showing the 3D structure(s).
@@ -615,8 +711,17 @@ def structure_3d(
 
         # Plot atoms and vectors
         if show_sites:
-            # For 3D, need to handle disordered sites properly by drawing each site
-            # individually instead of grouping by element symbol
+            legend_name = f"legend{idx}" if idx > 1 and n_structs > 1 else "legend"
+            batch_sites_i = (
+                len(augmented_structure) > helpers.BATCH_SITES_MIN_SITES
+                if batch_sites is None
+                else batch_sites
+            )
+            legendgroups: list[str | None] = []
+            show_legend: list[bool] = []
+
+            # Unless batching, draw each site individually (draw_sites still does so
+            # for disordered sites)
             for site_idx_loop, site in enumerate(augmented_structure):
                 # Determine if this is primary site (from orig structure) or image site
                 is_image_site = site_idx_loop >= len(struct_i)
@@ -639,6 +744,11 @@ def structure_3d(
                         showlegend = True
                         seen_elements_per_subplot[idx].add(symbol)
 
+                if batch_sites_i:
+                    legendgroups += [legendgroup]
+                    show_legend += [showlegend]
+                    continue
+
                 # Use the new draw_site helper which handles disordered sites
                 helpers.draw_site(
                     fig=fig,
@@ -658,10 +768,39 @@ def structure_3d(
                     float_fmt=hover_float_fmt,
                     legendgroup=legendgroup,
                     showlegend=showlegend,
-                    legend=f"legend{idx}" if idx > 1 and n_structs > 1 else "legend",
+                    legend=legend_name,
                     name=f"Image of {symbol}" if is_image_site else symbol,
                 )
 
+            if batch_sites_i:
+                n_primary = len(struct_i)
+                helpers.draw_sites(
+                    fig=fig,
+                    sites=augmented_structure.sites,
+                    coords=augmented_structure.cart_coords,
+                    site_indices=[
+                        site_idx % n_primary
+                        for site_idx in range(len(augmented_structure))
+                    ],
+                    site_labels=site_labels,
+                    elem_colors=_elem_colors,
+                    atomic_radii=_atomic_radii,
+                    atom_size=atom_size_i,
+                    scale=scale_i,
+                    site_kwargs={} if show_sites is True else show_sites,
+                    is_image=[
+                        site_idx >= n_primary
+                        for site_idx in range(len(augmented_structure))
+                    ],
+                    is_3d=True,
+                    scene=scene_name,
+                    hover_text=hover_text,
+                    float_fmt=hover_float_fmt,
+                    legendgroups=legendgroups,
+                    showlegend=show_legend,
+                    legend=legend_name,
+                )
+
             # Add vectors for primary sites only
             for site_idx_loop, site_in_original_struct in enumerate(struct_i):
                 if vector_prop:
@@ -727,6 +866,7 @@ def structure_3d(
                     scene=scene_name,
                     elem_colors=_elem_colors,
                     plotted_sites_coords=plotted_sites_coords,
+                    batch=batch_bonds,
                 )
 
         if show_cell:
@@ -88,6 +88,13 @@ covalent_radii: pd.Series = df_ptable[Key.covalent_radius].fillna(
     missing_covalent_radius
 )
 NO_SYM_MSG = "Symmetry could not be determined, skipping standardization"
+# structure_(2|3)d draw sites with one trace per element instead of one per site
+# (see draw_sites) above this many sites (incl. image sites) if batch_sites=None
+BATCH_SITES_MIN_SITES = 200
+# draw_bonds draws bonds with one trace per color instead of one per bond segment
+# (10 per gradient colored bond) above this many sites (incl. image sites) if
+# batch=None
+BATCH_BONDS_MIN_SITES = 200
 CELL_EDGES = (
     (0, 1),
     (0, 2),
@@ -206,32 +213,55 @@ def get_image_sites(
     Returns:
         np.ndarray: Coordinates of all image sites.
     """
-    coords_image_atoms: list[np.ndarray] = []
-
-    # Generate all possible combinations of lattice vector offsets (except zero offset)
-    offsets = set(itertools.product([-1, 0, 1], repeat=3)) - {(0, 0, 0)}
-
-    for offset in offsets:
-        new_frac = site.frac_coords + offset
-        new_cart = lattice.get_cartesian_coords(new_frac)
+    _, image_cart_coords = _image_site_coords(
+        site.frac_coords[None],
+        lattice,
+        cell_boundary_tol=cell_boundary_tol,
+        min_dist_dedup=min_dist_dedup,
+    )
+    return image_cart_coords
 
-        # Check if the new fractional coordinates are within cell bounds
-        # Use cell_boundary_tol to control how far outside the cell atoms can be
-        is_within_extended_cell = all(
-            0 - cell_boundary_tol <= coord <= 1 + cell_boundary_tol
-            for coord in new_frac
-        )
 
-        # filter sites that are too close to the original to avoid duplicates
-        if is_within_extended_cell:
-            distance_from_original = np.linalg.norm(
-                new_cart - lattice.get_cartesian_coords(site.frac_coords)
-            )
+def _image_site_coords(
+    frac_coords: np.ndarray,
+    lattice: Lattice,
+    *,
+    cell_boundary_tol: float = 0.0,
+    min_dist_dedup: float = 0.1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get images of many sites at once. Vectorized version of get_image_sites that
+    checks all 26 neighboring-cell translations of all sites as one (N, 26, 3) array.
 
-            if distance_from_original > min_dist_dedup:
-                coords_image_atoms += [new_cart]
+    Args:
+        frac_coords (np.ndarray): (N, 3) fractional coordinates of the sites.
+        lattice (Lattice): The lattice to get images for.
+        cell_boundary_tol (float): See get_image_sites.
+        min_dist_dedup (float): See get_image_sites.
 
-    return np.array(coords_image_atoms)
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Index of the original site of each image (in
+            ascending order) and (M, 3) Cartesian coordinates of all images.
+    """
+    frac_coords = np.asarray(frac_coords, dtype=float).reshape(-1, 3)
+    # translations to all 26 neighboring cells (excluding zero offset)
+    offsets = np.array(
+        [off for off in itertools.product([-1, 0, 1], repeat=3) if any(off)]
+    )
+    # filter translations too short to avoid duplicates of the original site
+    is_long_offset = np.linalg.norm(offsets @ lattice.matrix, axis=1) > min_dist_dedup
+
+    image_frac_coords = frac_coords[:, None, :] + offsets[None, :, :]  # (N, 26, 3)
+    # Use cell_boundary_tol to control how far outside the cell atoms can be
+    is_in_cell = np.all(
+        (image_frac_coords >= -cell_boundary_tol)
+        & (image_frac_coords <= 1 + cell_boundary_tol),
+        axis=-1,
+    )
+    site_indices, offset_indices = np.nonzero(is_in_cell & is_long_offset)
+    image_cart_coords = lattice.get_cartesian_coords(
+        image_frac_coords[site_indices, offset_indices]
+    ).reshape(-1, 3)
+    return site_indices, image_cart_coords
 
 
 def cell_to_lines(
@@ -597,6 +627,163 @@ def draw_site(
         fig.add_scatter(**scatter_kwargs, row=row, col=col)
 
 
+def draw_sites(
+    fig: go.Figure,
+    sites: Sequence[PeriodicSite],
+    coords: np.ndarray,
+    *,
+    site_indices: Sequence[int],
+    site_labels: Any,
+    elem_colors: dict[str, ColorType],
+    atomic_radii: dict[str, float],
+    atom_size: float,
+    scale: float,
+    site_kwargs: dict[str, Any],
+    is_image: Sequence[bool] | None = None,
+    image_site_kwargs: dict[str, Any] | None = None,
+    is_3d: bool = False,
+    row: int | None = None,
+    col: int | None = None,
+    scene: str | None = None,
+    hover_text: SiteCoords
+    | Callable[[PeriodicSite], str] = SiteCoords.cartesian_fractional,
+    float_fmt: str | Callable[[float], str] = ".4",
+    legendgroups: Sequence[str | None] | None = None,
+    showlegend: Sequence[bool] | None = None,
+    legend: str = "legend",
+) -> None:
+    """Add many sites to the plot with one trace per element, image flag and legend
+    group instead of one trace per site as in draw_site. Per-site marker sizes, label
+    text, label font sizes and hover texts are passed as arrays. Disordered sites are
+    still drawn individually with draw_disordered_site.
+
+    Args:
+        fig (go.Figure): The plotly figure to add the sites to.
+        sites (Sequence[PeriodicSite]): The periodic sites to draw.
+        coords (np.ndarray): (N, 3) array of site coordinates to plot at.
+        site_indices (Sequence[int]): Index of each site in its structure (used for
+            sequence site_labels).
+        site_labels (str | dict | list): How to label the sites.
+        elem_colors (dict[str, ColorType]): Element color mapping.
+        atomic_radii (dict[str, float]): Atomic radii mapping.
+        atom_size (float): Scaling factor for atom sizes.
+        scale (float): Overall scaling factor.
+        site_kwargs (dict[str, Any]): Additional marker styling for primary sites.
+        is_image (Sequence[bool] | None): Whether each site is an image site.
+            Defaults to None meaning no image sites.
+        image_site_kwargs (dict[str, Any] | None): Additional marker styling for image
+            sites. Defaults to site_kwargs.
+        is_3d (bool): Whether this is a 3D plot.
+        row (int | None): Row for subplot.
+        col (int | None): Column for subplot.
+        scene (str | None): Scene name for 3D plots.
+        hover_text (SiteCoords | Callable[[PeriodicSite], str]): Hover text template.
+        float_fmt (str | Callable[[float], str]): Float formatting for hover
+            coordinates.
+        legendgroups (Sequence[str | None] | None): Legend group of each site.
+        showlegend (Sequence[bool] | None): Whether each site would show in the
+            legend. A batched trace shows in the legend if any of its sites does.
+        legend (str): The legend to add the sites to.
+    """
+    n_sites = len(sites)
+    is_image = is_image if is_image is not None else [False] * n_sites
+    legendgroups = legendgroups if legendgroups is not None else [None] * n_sites
+    showlegend = showlegend if showlegend is not None else [False] * n_sites
+    image_site_kwargs = site_kwargs if image_site_kwargs is None else image_site_kwargs
+
+    # (symbol, is_image, legendgroup) -> per-site values of that trace
+    groups: dict[tuple[str, bool, str | None], dict[str, list[Any]]] = {}
+    for site, site_coords, site_idx, is_img, legendgroup, show_in_legend in zip(
+        sites, coords, site_indices, is_image, legendgroups, showlegend, strict=True
+    ):
+        species = get_site_species(site)
+        if isinstance(species, Composition) and len(species) > 1:
+            symbol = get_site_symbol(site)
+            draw_site(
+                fig=fig,
+                site=site,
+                coords=site_coords,
+                site_idx=site_idx,
+                site_labels=site_labels,
+                elem_colors=elem_colors,
+                atomic_radii=atomic_radii,
+                atom_size=atom_size,
+                scale=scale,
+                site_kwargs=image_site_kwargs if is_img else site_kwargs,
+                is_image=is_img,
+                is_3d=is_3d,
+                row=row,
+                col=col,
+                scene=scene,
+                hover_text=hover_text,
+                float_fmt=float_fmt,
+                legendgroup=legendgroup,
+                showlegend=show_in_legend,
+                legend=legend,
+                name=f"Image of {symbol}" if is_img else symbol,
+            )
+            continue
+
+        majority_species = (
+            max(species, key=species.get)  # type: ignore[arg-type]
+            if isinstance(species, Composition)
+            else species
+        )
+        if not isinstance(majority_species, Species):
+            majority_species = Species(str(majority_species))
+
+        group = groups.setdefault(
+            (majority_species.symbol, is_img, legendgroup),
+            dict(coords=[], radius=[], text=[], hovertext=[], showlegend=[]),
+        )
+        group["coords"] += [site_coords]
+        group["radius"] += [atomic_radii[majority_species.symbol] * scale]
+        group["text"] += [generate_site_label(site_labels, site_idx, site)]
+        group["hovertext"] += [
+            get_site_hover_text(site, hover_text, majority_species, float_fmt)
+        ]
+        group["showlegend"] += [show_in_legend]
+
+    for (symbol, is_img, legendgroup), group in groups.items():
+        atom_color = normalize_elem_color(elem_colors.get(symbol, "gray"))
+        xyz = np.array(group["coords"])
+        radii = np.array(group["radius"])
+
+        marker_kwargs = dict(
+            size=radii * atom_size,
+            color=atom_color,
+            opacity=0.8 if is_img else 1,
+            line=dict(width=1, color="rgba(0,0,0,0.4)"),  # Dark border
+        )
+        marker_kwargs.update(image_site_kwargs if is_img else site_kwargs)
+
+        has_text = any(group["text"])
+        scatter_kwargs = dict(
+            x=xyz[:, 0],
+            y=xyz[:, 1],
+            mode="markers+text" if has_text else "markers",
+            marker=marker_kwargs,
+            text=[txt or "" for txt in group["text"]] if has_text else None,
+            textposition="middle center",
+            textfont=dict(
+                color=pick_max_contrast_color(atom_color),
+                size=np.clip(atom_size * radii * (0.8 if is_img else 1), 10, 18),
+            ),
+            hoverinfo="text" if hover_text else None,
+            hovertext=group["hovertext"],
+            hoverlabel=dict(namelength=-1),
+            name=f"Image of {symbol}" if is_img else symbol,
+            showlegend=any(group["showlegend"]),
+            legendgroup=legendgroup,
+            legend=legend,
+        )
+
+        if is_3d:
+            fig.add_scatter3d(**scatter_kwargs, z=xyz[:, 2], scene=scene)
+        else:
+            fig.add_scatter(**scatter_kwargs, row=row, col=col)
+
+
 def get_disordered_site_legend_name(
     sorted_species: list[tuple[Species | Element, float]], *, is_image: bool = False
 ) -> str:
@@ -1439,6 +1626,7 @@ def draw_bonds(
     rotation_matrix: np.ndarray | None = None,
     elem_colors: dict[str, ColorType] | None = None,
     plotted_sites_coords: set[Xyz] | None = None,
+    batch: bool | None = None,
 ) -> None:
     """Draw bonds between atoms in the structure.
 
@@ -1461,6 +1649,11 @@ def draw_bonds(
         plotted_sites_coords (set[Xyz] | None): Optional set of (x, y, z) tuples for
             sites that are actually plotted. If provided, bonds will only be drawn if
             both end points are in this set. Coordinates are expected to be rounded.
+        batch (bool | None): If True, draw all bond segments of the same color as a
+            single trace of NaN-separated lines. If False, add a separate trace for
+            every bond segment (slow and memory-heavy for large structures since
+            gradient colored bonds use 10 segments each). Defaults to None, meaning
+            batch if structure has more than BATCH_BONDS_MIN_SITES sites.
     """
     default_bond_color: ColorType | tuple[ColorType, ColorType] | bool = True
     if bond_kwargs and bond_kwargs.get("color") is False:
@@ -1482,6 +1675,9 @@ def draw_bonds(
         except (ValueError, IndexError):
             return "rgb(128,128,128)"  # Fallback to gray if parsing fails
 
+    # (site_idx, neighbor_idx, start coords, end coords, color or gradient colors)
+    bonds: list[tuple[int, int, np.ndarray, np.ndarray, str | tuple[str, str]]] = []
+
     for site_idx, site1 in enumerate(structure):
         try:
             connections = nn.get_nn_info(structure, n=site_idx)  # type: ignore[arg-type]
@@ -1538,11 +1734,43 @@ def draw_bonds(
             else:  # Solid color
                 color_for_segment_calc = parse_color(current_bond_color_setting)
 
-            n_segments = 1
-            if isinstance(color_for_segment_calc, tuple):
-                n_segments = 10  # Use more segments for gradients
+            bonds += [
+                (
+                    site_idx,
+                    con_dict["site_index"],
+                    coords_from,
+                    cart_coords_to,
+                    color_for_segment_calc,
+                )
+            ]
 
-            for segment_idx in range(n_segments):
+    line_kwargs = dict(
+        width=effective_bond_kwargs.get("width", 2),
+        dash=effective_bond_kwargs.get("dash"),
+    )
+    trace_kwargs = dict(mode="lines", showlegend=False, hoverinfo="skip")
+
+    def segment_colors(color_for_segment_calc: str | tuple[str, str]) -> list[str]:
+        """Colors of the 10 gradient segments of a bond or its single solid color."""
+        if isinstance(color_for_segment_calc, str):
+            return [parse_color(color_for_segment_calc)]
+        n_segments = 10  # Use more segments for gradients
+        return [
+            pcolors.find_intermediate_color(
+                *color_for_segment_calc,
+                (segment_idx / n_segments + (segment_idx + 1) / n_segments) / 2,
+                colortype="rgb",
+            )
+            for segment_idx in range(n_segments)
+        ]
+
+    if batch is None:
+        batch = len(structure) > BATCH_BONDS_MIN_SITES
+    if not batch:
+        for site_idx, nbr_idx, coords_from, cart_coords_to, bond_color in bonds:
+            colors = segment_colors(bond_color)
+            n_segments = len(colors)
+            for segment_idx, segment_color_str in enumerate(colors):
                 frac_start, frac_end = (
                     segment_idx / n_segments,
                     (segment_idx + 1) / n_segments,
@@ -1553,31 +1781,8 @@ def draw_bonds(
                 current_segment_end = coords_from + frac_end * (
                     cart_coords_to - coords_from
                 )
-
-                segment_color_str: str
-                if isinstance(color_for_segment_calc, tuple):
-                    # Gradient calculation
-                    segment_color_str = pcolors.find_intermediate_color(
-                        color_for_segment_calc[0],
-                        color_for_segment_calc[1],
-                        (frac_start + frac_end) / 2,
-                        colortype="rgb",
-                    )
-                else:  # Solid color
-                    segment_color_str = parse_color(color_for_segment_calc)
-
-                name = f"bond {site_idx}-{con_dict['site_index']} segment {segment_idx}"
-                trace_kwargs = dict(
-                    mode="lines",
-                    line=dict(
-                        width=effective_bond_kwargs.get("width", 2),
-                        color=segment_color_str,
-                        dash=effective_bond_kwargs.get("dash"),
-                    ),
-                    showlegend=False,
-                    hoverinfo="skip",
-                    name=name,
-                )
+                name = f"bond {site_idx}-{nbr_idx} segment {segment_idx}"
+                line = line_kwargs | dict(color=segment_color_str)
 
                 if is_3d:
                     fig.add_scatter3d(
@@ -1585,6 +1790,8 @@ def draw_bonds(
                         y=[current_segment_start[1], current_segment_end[1]],
                         z=[current_segment_start[2], current_segment_end[2]],
                         scene=scene,
+                        line=line,
+                        name=name,
                         **trace_kwargs,
                     )
                 else:
@@ -1601,8 +1808,62 @@ def draw_bonds(
                         y=[plot_segment_start[1], plot_segment_end[1]],
                         row=row,
                         col=col,
+                        line=line,
+                        name=name,
                         **trace_kwargs,
                     )
+        return
+
+    if not bonds:
+        return
+
+    # Batched: split every bond into its colored segments, then draw all segments of
+    # the same color as one trace of NaN-separated line pieces (Plotly serializes
+    # NaN as null which breaks the line). Gradient bonds thus add one trace per
+    # distinct segment color instead of 10 traces per bond.
+    colors_by_setting: dict[str | tuple[str, str], list[str]] = {}
+    seg_starts, seg_ends, seg_colors = [], [], []
+    for *_, coords_from, cart_coords_to, bond_color in bonds:
+        if bond_color not in colors_by_setting:
+            colors_by_setting[bond_color] = segment_colors(bond_color)
+        colors = colors_by_setting[bond_color]
+        fracs = np.arange(len(colors) + 1)[:, None] / len(colors)
+        points = coords_from + fracs * (cart_coords_to - coords_from)
+        seg_starts += [points[:-1]]
+        seg_ends += [points[1:]]
+        seg_colors += colors
+
+    starts, ends = np.concatenate(seg_starts), np.concatenate(seg_ends)
+    if not is_3d and rotation_matrix is not None:
+        starts, ends = np.dot(starts, rotation_matrix), np.dot(ends, rotation_matrix)
+    seg_colors_arr = np.array(seg_colors)
+
+    for color in dict.fromkeys(seg_colors):  # unique colors in order of appearance
+        color_mask = seg_colors_arr == color
+        gaps = np.full((color_mask.sum(), 3), np.nan)
+        # interleave to rows of segment start, segment end, gap
+        xyz = np.hstack([starts[color_mask], ends[color_mask], gaps]).reshape(-1, 3)
+        line = line_kwargs | dict(color=color)
+        if is_3d:
+            fig.add_scatter3d(
+                x=xyz[:, 0],
+                y=xyz[:, 1],
+                z=xyz[:, 2],
+                scene=scene,
+                line=line,
+                name=f"bonds {color}",
+                **trace_kwargs,
+            )
+        else:
+            fig.add_scatter(
+                x=xyz[:, 0],
+                y=xyz[:, 1],
+                row=row,
+                col=col,
+                line=line,
+                name=f"bonds {color}",
+                **trace_kwargs,
+            )
 
 
 def _standardize_struct(
@@ -1647,28 +1908,32 @@ def _prep_augmented_structure_for_bonding(
     ]
 
     if show_image_sites:  # True or a dict implies true for this purpose
-        processed_image_coords: set[Xyz] = set()
-        for site_in_cell in struct_i:
-            image_cart_coords_arrays = get_image_sites(
-                site_in_cell,
+        image_site_indices, image_cart_coords = _image_site_coords(
+            struct_i.frac_coords,
+            struct_i.lattice,
+            cell_boundary_tol=cell_boundary_tol,
+        )
+        # keep only the first image at any (rounded) position. + 0.0 turns -0.0 into
+        # 0.0 so both count as the same position
+        rounded_coords = np.round(image_cart_coords, 5) + 0.0
+        _, first_indices = np.unique(rounded_coords, axis=0, return_index=True)
+        first_indices.sort()  # restore order of sites and offsets
+
+        image_frac_coords = struct_i.lattice.get_fractional_coords(
+            image_cart_coords[first_indices]
+        ).reshape(-1, 3)
+        for site_idx, image_frac in zip(
+            image_site_indices[first_indices], image_frac_coords, strict=True
+        ):
+            site_in_cell = struct_i[site_idx]
+            image_periodic_site = PeriodicSite(
+                site_in_cell.species,
+                image_frac,
                 struct_i.lattice,
-                cell_boundary_tol=cell_boundary_tol,
+                properties=site_in_cell.properties.copy() | dict(is_image=True),
+                coords_are_cartesian=False,
             )
-            for image_cart_coords_arr in image_cart_coords_arrays:
-                coord_tuple_key = tuple(np.round(image_cart_coords_arr, 5))
-                if coord_tuple_key not in processed_image_coords:
-                    image_frac_coords = struct_i.lattice.get_fractional_coords(
-                        image_cart_coords_arr
-                    )
-                    image_periodic_site = PeriodicSite(
-                        site_in_cell.species,
-                        image_frac_coords,
-                        struct_i.lattice,
-                        properties=site_in_cell.properties.copy() | dict(is_image=True),
-                        coords_are_cartesian=False,
-                    )
-                    all_sites_for_bonding.append(image_periodic_site)
-                    processed_image_coords.add(coord_tuple_key)
+            all_sites_for_bonding.append(image_periodic_site)
 
     return Structure.from_sites(
         all_sites_for_bonding, validate_proximity=False, to_unit_cell=False
@@ -18,6 +18,7 @@ from pymatviz.typing import AnyStructure, ShowCounts
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from pathlib import Path
     from typing import Any
 
 
@@ -56,6 +57,9 @@ def chem_env_treemap(
     normalize: bool = False,
     show_counts: ShowCounts = "value",
     cn_formatter: CnFormatter = None,
+    n_jobs: int | None = 1,
+    timeout: float | None = None,
+    cache_dir: str | Path | None = None,
     **kwargs: Any,
 ) -> go.Figure:
     """Create treemap plot of coordination numbers and chemical environments.
@@ -89,6 +93,14 @@ def chem_env_treemap(
             counts. Defaults to "value".
         cn_formatter (CnFormatter): Custom formatter for CN labels. Defaults to None.
             Can be False to disable formatting.
+        n_jobs (int | None): Number of processes to run ChemEnv analysis in
+            ("chemenv" or dict settings only). None uses all cores. Defaults to 1.
+        timeout (float | None): Max seconds of ChemEnv analysis per structure.
+            Structures that exceed it are skipped with a warning. Defaults to None.
+        cache_dir (str | Path | None): Directory to cache ChemEnv results per
+            structure and settings in, so re-plotting (e.g. with different
+            max_cells) or resuming an interrupted run skips finished structures.
+            Defaults to None (no caching).
         **kwargs: Additional keyword arguments passed to plotly.express.treemap.
 
     Returns:
@@ -121,6 +133,14 @@ def chem_env_treemap(
         >>> fig3 = pmv.chem_env_treemap(structures, normalize=True)
         >>> # Use faster CrystalNN analysis
         >>> fig4 = pmv.chem_env_treemap(structures, chem_env_settings="crystal_nn")
+        >>> # Run ChemEnv on 8 cores, skip structures taking >60s, cache results
+        >>> fig5 = pmv.chem_env_treemap(
+        ...     structures,
+        ...     chem_env_settings="chemenv",
+        ...     n_jobs=8,
+        ...     timeout=60,
+        ...     cache_dir="chemenv-cache",
+        ... )
     """
     if chem_env_settings == "crystal_nn":
         return _chem_env_treemap_crystal_nn(
@@ -145,6 +165,9 @@ def chem_env_treemap(
         normalize=normalize,
         show_counts=show_counts,
         cn_formatter=cn_formatter,
+        n_jobs=n_jobs,
+        timeout=timeout,
+        cache_dir=cache_dir,
         **kwargs,
     )
 
@@ -158,72 +181,39 @@ def _chem_env_treemap_chem_env(
     normalize: bool = False,
     show_counts: ShowCounts = "value",
     cn_formatter: CnFormatter = None,
+    n_jobs: int | None = 1,
+    timeout: float | None = None,
+    cache_dir: str | Path | None = None,
     **kwargs: Any,
 ) -> go.Figure:
     """ChemEnv-based implementation of chem_env_treemap."""
-    import pymatgen.analysis.chemenv.coordination_environments.coordination_geometries as coord_geoms  # noqa: E501
-    import pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder as coord_finder  # noqa: E501
-    import pymatgen.analysis.chemenv.coordination_environments.structure_environments as struct_envs  # noqa: E501
-    from pymatgen.analysis.chemenv.coordination_environments import chemenv_strategies
-
     structs = normalize_structures(structures).values()
 
     if show_counts not in get_args(ShowCounts):
         raise ValueError(f"Invalid {show_counts=}")
 
-    settings = chem_env_settings or {}
     chem_env_data: list[dict[str, Any]] = []
+    all_coord_envs = chem_env.compute_coord_envs(
+        structs,
+        chem_env_settings,
+        n_jobs=n_jobs,
+        timeout=timeout,
+        cache_dir=cache_dir,
+    )
 
-    try:
-        lgf = coord_finder.LocalGeometryFinder()
-        lgf.setup_parameters(**settings)
-        strategy = chemenv_strategies.SimplestChemenvStrategy()
-        all_coord_geoms = coord_geoms.AllCoordinationGeometries()
-        symbol_cn_mapping = all_coord_geoms.get_symbol_cn_mapping()
-
-        for structure in structs:
-            try:
-                lgf.setup_structure(structure=structure)  # type: ignore[arg-type]
-                structure_environments = lgf.compute_structure_environments()
-                lse = (
-                    struct_envs.LightStructureEnvironments.from_structure_environments(
-                        strategy, structure_environments
-                    )
-                )
-
-                coord_envs_dict: dict[tuple[int, str], float] = {}
-
-                for coord_envs in lse.coordination_environments or []:
-                    for coord_env in coord_envs or []:
-                        ce_symbol = coord_env["ce_symbol"]
-                        cn_val = chem_env.get_cn_from_symbol(
-                            ce_symbol, symbol_cn_mapping
-                        )
-                        key = (cn_val, ce_symbol)
-                        coord_envs_dict[key] = coord_envs_dict.get(key, 0) + 1
-
-                for (cn_val, ce_symbol), env_count in coord_envs_dict.items():
-                    final_count = env_count
-                    if normalize:
-                        total = sum(coord_envs_dict.values())
-                        if total > 0:
-                            final_count = env_count / total
-
-                    chem_env_dict = dict(
-                        coord_num=cn_val, chem_env_symbol=ce_symbol, count=final_count
-                    )
-                    chem_env_data.append(chem_env_dict)
-
-            except (ImportError, RuntimeError) as exc:
-                warnings.warn(
-                    f"ChemEnv analysis failed for structure: {exc}",
-                    UserWarning,
-                    stacklevel=2,
-                )
-                continue
+    for coord_envs_dict in all_coord_envs:
+        if coord_envs_dict is None:
+            continue
+        total = sum(coord_envs_dict.values())
+        for (cn_val, ce_symbol), env_count in coord_envs_dict.items():
+            final_count: float = env_count
+            if normalize and total > 0:
+                final_count = env_count / total
 
-    except (ImportError, RuntimeError) as exc:
-        warnings.warn(f"ChemEnv setup failed: {exc}", UserWarning, stacklevel=2)
+            chem_env_dict = dict(
+                coord_num=cn_val, chem_env_symbol=ce_symbol, count=final_count
+            )
+            chem_env_data.append(chem_env_dict)
 
     return _process_chem_env_data_treemap(
         chem_env_data=chem_env_data,
@@ -248,23 +238,20 @@ def _chem_env_treemap_crystal_nn(
     """CrystalNN-based implementation of chem_env_treemap (faster but may be less
     accurate, not benchmarked so unclear).
     """
-    from pymatgen.analysis.local_env import CrystalNN
-
     structs = normalize_structures(structures).values()
 
     if show_counts not in get_args(ShowCounts):
         raise ValueError(f"Invalid {show_counts=}")
 
     chem_env_data: list[dict[str, Any]] = []
-    crystal_nn = CrystalNN()
-
     try:
+        chem_env._get_crystal_nn()  # fail early if CrystalNN can't be set up
         for structure in structs:
             try:
                 # Get coordination info for each site
                 for site_idx in range(len(structure)):
-                    # Get coordination number
-                    nn_info = crystal_nn.get_nn_info(structure, site_idx)  # type: ignore[arg-type]
+                    # Get coordination number (neighbors cached for the classifier)
+                    nn_info = chem_env.get_crystal_nn_info(structure, site_idx)  # type: ignore[arg-type]
                     cn_val = len(nn_info)
 
                     # Get best matching coordination environment using order parameters
@@ -272,6 +259,7 @@ def _chem_env_treemap_crystal_nn(
                         structure,  # type: ignore[arg-type]
                         site_idx,
                         cn_val,
+                        nn_info=nn_info,
                     )
 
                     # Add to data
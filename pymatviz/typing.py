@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Literal, ParamSpec, TypeVar, Union, get_args
 
 import pandas as pd
@@ -15,6 +15,8 @@ from pymatgen.phonon.dos import PhononDos
 if TYPE_CHECKING:
     from typing import TypeAlias
 
+    import polars as pl
+    import pyarrow as pa
     from ase.atoms import Atoms as AseAtoms
     from phonopy.phonon.dos import TotalDos
 
@@ -43,6 +45,14 @@ ElemValues: TypeAlias = (
     | pd.Series
     | Sequence[str]
     | Sequence["Composition"]
+    | Iterator[str | Composition | Sequence[str] | pd.Series | pd.DataFrame]
+)
+
+# pandas, Polars or Arrow tables (or any object implementing __dataframe__)
+DataFrameLike: TypeAlias = Union[pd.DataFrame, "pl.DataFrame", "pa.Table"]
+
+HexReduceFunc: TypeAlias = (
+    Literal["sum", "mean", "median", "min", "max"] | Callable[..., float]
 )
 
 T = TypeVar("T")  # generic type for input validation
@@ -18,13 +18,15 @@ if TYPE_CHECKING:
 
     from numpy.typing import ArrayLike
 
+    from pymatviz.typing import DataFrameLike
+
 
 def qq_gaussian(
     y_true: ArrayLike | str,
     y_pred: ArrayLike | str,
     y_std: ArrayLike | dict[str, ArrayLike] | str | Sequence[str],
     *,
-    df: pd.DataFrame | None = None,
+    df: DataFrameLike | None = None,
     fig: go.Figure | None = None,
     identity_line: bool | dict[str, Any] = True,
 ) -> go.Figure:
@@ -34,7 +36,7 @@ def qq_gaussian(
         y_true: Ground truth targets
         y_pred: Model predictions
         y_std: Uncertainties (single array or dict for multiple)
-        df: DataFrame containing data columns
+        df: pandas, Polars or Arrow DataFrame containing data columns
         fig: Existing plotly figure to add to
         identity_line: Show perfect calibration line
 
@@ -121,7 +123,7 @@ def error_decay_with_uncert(
     y_pred: ArrayLike | str,
     y_std: ArrayLike | dict[str, ArrayLike] | str | Sequence[str],
     *,
-    df: pd.DataFrame | None = None,
+    df: DataFrameLike | None = None,
     n_rand: int = 100,
     percentiles: bool = True,
     fig: go.Figure | None = None,
@@ -132,7 +134,7 @@ def error_decay_with_uncert(
         y_true: Ground truth targets
         y_pred: Model predictions
         y_std: Uncertainties (single array or dict for multiple)
-        df: DataFrame containing data columns
+        df: pandas, Polars or Arrow DataFrame containing data columns
         n_rand: Random shuffles for baseline
         percentiles: Use percentiles vs sample count on x-axis
         fig: Existing plotly figure to add to
@@ -13,6 +13,7 @@ from pymatviz.utils.plotting import (
     get_font_color,
     luminance,
     pick_max_contrast_color,
+    to_typed_arrays,
 )
 
 
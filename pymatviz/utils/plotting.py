@@ -6,12 +6,15 @@ Available functions:
     - get_fig_xy_range: Get the x and y range of a plotly figure.
     - luminance: Compute the luminance of a color.
     - pick_max_contrast_color: Choose black or white text color for contrast.
+    - to_typed_arrays: Encode numeric arrays in a figure dict as base64 typed arrays.
 """
 
 from __future__ import annotations
 
+import base64
 from typing import TYPE_CHECKING, Final
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
@@ -29,6 +32,26 @@ PRETTY_LABELS: Final[dict[str, str]] = {
     "R2_adj": "R<sup>2</sup><sub>adj</sub>",
 }
 
+# trace keys holding fixed-length info arrays (like [min, max]) or geo data which
+# plotly.js expects as plain JSON lists, never as typed arrays
+INFO_ARRAY_KEYS: Final = frozenset(
+    {
+        "constraintrange",
+        "domain",
+        "dtickrange",
+        "geojson",
+        "groups",
+        "layer",
+        "layers",
+        "range",
+        "span",
+        "xaxes",
+        "yaxes",
+        "zmax",
+        "zmin",
+    }
+)
+
 
 def annotate(text: str | Sequence[str], fig: go.Figure, **kwargs: Any) -> go.Figure:
     """Annotate a plotly figure. Supports faceted plots plotly figure with
@@ -313,17 +336,109 @@ def get_fig_xy_range(
                     break
 
         trace = fig.data[trace_index]
-        df_xy = pd.DataFrame({"x": trace.x, "y": trace.y}).dropna()
+        if len(trace.x) == len(trace.y):
+            df_xy = pd.DataFrame({"x": trace.x, "y": trace.y}).dropna()
+            trace_xs, trace_ys = df_xy.x, df_xy.y
+        else:  # grid traces like heatmaps have separate x and y coordinates
+            trace_xs = pd.Series(trace.x).dropna()
+            trace_ys = pd.Series(trace.y).dropna()
 
         # Determine ranges based on the type of axes
         if fig.layout.xaxis.type == "log":
-            x_range = (10 ** min(df_xy.x), 10 ** max(df_xy.x))
+            x_range = (10 ** min(trace_xs), 10 ** max(trace_xs))
         else:
-            x_range = (min(df_xy.x), max(df_xy.x))
+            x_range = (min(trace_xs), max(trace_xs))
 
         if fig.layout.yaxis.type == "log":
-            y_range = (10 ** min(df_xy.y), 10 ** max(df_xy.y))
+            y_range = (10 ** min(trace_ys), 10 ** max(trace_ys))
         else:
-            y_range = (min(df_xy.y), max(df_xy.y))
+            y_range = (min(trace_ys), max(trace_ys))
 
     return x_range, y_range
+
+
+def _to_typed_array_spec(arr: np.ndarray, *, float32: bool) -> dict[str, str] | None:
+    """Encode a numeric numpy array in plotly.js's {dtype, bdata, shape} format.
+
+    Floats are stored as float64 (or float32 if float32=True), integers as int32 or
+    uint32. Returns None for arrays plotly.js can't decode (e.g. int64 values
+    beyond the int32 range), which should then stay plain JSON lists.
+    """
+    if arr.dtype.kind == "f":
+        arr = arr.astype("<f4" if float32 or arr.dtype.itemsize <= 4 else "<f8")
+    elif arr.dtype.kind in "iu":
+        i32_info, u32_info = np.iinfo(np.int32), np.iinfo(np.uint32)
+        arr_min, arr_max = arr.min(), arr.max()
+        if arr_min >= i32_info.min and arr_max <= i32_info.max:
+            arr = arr.astype("<i4")
+        elif arr_min >= 0 and arr_max <= u32_info.max:
+            arr = arr.astype("<u4")
+        else:
+            return None
+    else:
+        return None
+
+    spec = {
+        "dtype": arr.dtype.str[1:],
+        "bdata": base64.b64encode(np.ascontiguousarray(arr)).decode("ascii"),
+    }
+    if arr.ndim > 1:
+        spec["shape"] = ", ".join(map(str, arr.shape))
+    return spec
+
+
+def _encode_arrays(obj: Any, *, float32: bool) -> Any:
+    """Recursively replace numeric lists in plotly JSON with typed array specs."""
+    if isinstance(obj, dict):
+        if "bdata" in obj and "dtype" in obj:  # already encoded by plotly
+            if not (float32 and obj["dtype"] == "f8"):
+                return obj
+            arr = np.frombuffer(base64.b64decode(obj["bdata"]), dtype="<f8")
+            if shape := obj.get("shape"):
+                arr = arr.reshape([int(dim) for dim in str(shape).split(",")])
+            return _to_typed_array_spec(arr, float32=True)
+        return {
+            key: val if key in INFO_ARRAY_KEYS else _encode_arrays(val, float32=float32)
+            for key, val in obj.items()
+        }
+    if isinstance(obj, list | tuple) and len(obj) > 0:
+        try:
+            arr = np.asarray(obj)
+        except ValueError:  # ragged nested lists
+            arr = np.asarray(obj, dtype=object)
+        if arr.dtype.kind in "fiu" and arr.size > 0:
+            return _to_typed_array_spec(arr, float32=float32) or obj
+        if arr.dtype.kind in "OU":  # lists of trace dicts, colorscales, ...
+            return [_encode_arrays(val, float32=float32) for val in obj]
+    return obj
+
+
+def to_typed_arrays(
+    fig_dict: dict[str, Any], *, float32: bool = False
+) -> dict[str, Any]:
+    """Encode all numeric arrays in a plotly figure dict as base64 typed arrays.
+
+    plotly.py only binary-encodes numpy arrays. Data passed as Python lists (or
+    float64 data that would do with single precision) is still serialized as
+    decimal text, which can add hundreds of MB to large scatter or mesh plots. Typed
+    arrays make saved HTML and notebook outputs much smaller and faster to parse.
+    Requires plotly.js >= 2.28 to render.
+
+    Args:
+        fig_dict (dict[str, Any]): Figure dict as returned by fig.to_dict() or
+            fig.to_plotly_json(). Not modified.
+        float32 (bool, optional): Whether to downcast float64 arrays to float32,
+            halving their size at ~7 significant digits. Defaults to False.
+
+    Returns:
+        dict[str, Any]: Copy of fig_dict with trace (and animation frame) arrays
+            replaced by {"dtype": ..., "bdata": ...} specs.
+    """
+    out_dict = dict(fig_dict)
+    out_dict["data"] = _encode_arrays(fig_dict.get("data", []), float32=float32)
+    if "frames" in fig_dict:
+        out_dict["frames"] = [
+            frame | {"data": _encode_arrays(frame.get("data", []), float32=float32)}
+            for frame in fig_dict["frames"]
+        ]
+    return out_dict
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Literal
 
+import numpy as np
 import pytest
 from pymatgen.analysis.local_env import CrystalNN, NearNeighbors, VoronoiNN
 from pymatgen.core import Lattice, Structure
@@ -9,8 +10,10 @@ from pymatgen.core import Lattice, Structure
 from pymatviz.coordination.helpers import (
     CnSplitMode,
     calculate_average_cn,
+    calculate_average_cn_vs_cutoff,
     coordination_nums_in_structure,
     normalize_get_neighbors,
+    site_coordination_nums,
 )
 from pymatviz.enums import LabelEnum
 
@@ -93,6 +96,50 @@ def test_calculate_average_cn_empty_element() -> None:
     assert avg_cn == 0  # No K atoms in structure
 
 
+@pytest.mark.parametrize("strategy", [3.0, 4.5, VoronoiNN(), CrystalNN])
+def test_site_coordination_nums(
+    strategy: float | NearNeighbors | type[NearNeighbors],
+) -> None:
+    """Batched per-site CNs must match per-site get_neighbors calls."""
+    struct = Structure(
+        Lattice.cubic(4.0),
+        ["Na", "Na", "Cl", "Cl"],
+        [[0, 0, 0], [0.5, 0, 0], [0.5, 0.5, 0.5], [0, 0.5, 0.5]],
+    )
+    get_neighbors = normalize_get_neighbors(strategy=strategy)
+    expected = [len(get_neighbors(site, struct)) for site in struct]
+
+    site_cns = site_coordination_nums(struct, strategy=strategy)
+    assert site_cns.tolist() == expected
+
+    with pytest.raises(TypeError, match="Invalid strategy="):
+        site_coordination_nums(struct, strategy="invalid")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("cutoffs", [np.linspace(1, 5, 50), np.linspace(0, 4, 5)])
+def test_calculate_average_cn_vs_cutoff(
+    cutoffs: np.ndarray, fe3co4_disordered: Structure
+) -> None:
+    """Single-search CN curves must match per-cutoff calculate_average_cn."""
+    nacl = Structure(
+        Lattice.cubic(4.0),
+        ["Na", "Na", "Cl", "Cl"],
+        [[0, 0, 0], [0.5, 0, 0], [0.5, 0.5, 0.5], [0, 0.5, 0.5]],
+    )
+    for struct in (nacl, fe3co4_disordered):
+        avg_cns = calculate_average_cn_vs_cutoff(struct, cutoffs)
+        assert list(avg_cns) == sorted(struct.chemical_system_set)
+        for elem, cn_curve in avg_cns.items():
+            expected = [
+                calculate_average_cn(struct, elem, normalize_get_neighbors(cutoff))
+                for cutoff in cutoffs
+            ]
+            np.testing.assert_array_equal(cn_curve, expected)
+
+    # cutoff of 4 Å lands exactly on a neighbor shell which must be included
+    assert calculate_average_cn_vs_cutoff(nacl, [3.0, 4.0])["Na"].tolist() == [6, 20]
+
+
 @pytest.mark.parametrize(
     ("group_by", "expected"),
     [
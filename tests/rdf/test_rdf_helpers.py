@@ -8,7 +8,11 @@ from numpy.testing import assert_allclose
 from pymatgen.core import IStructure, Lattice, Structure
 from pymatgen.core.composition import Composition
 
-from pymatviz.rdf.helpers import calculate_rdf
+from pymatviz.rdf.helpers import (
+    calculate_all_pair_rdfs,
+    calculate_rdf,
+    calculate_trajectory_rdfs,
+)
 from tests.conftest import SI_ATOMS, SI_STRUCTS
 
 
@@ -411,3 +415,67 @@ def test_calculate_rdf_invalid_structure_type() -> None:
         TypeError, match="Input must be a pymatgen Structure, IStructure, Molecule"
     ):
         calculate_rdf(42, cutoff=10, n_bins=10)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("pbc", [(1, 1, 1), (1, 0, 0)])
+def test_calculate_all_pair_rdfs_matches_calculate_rdf(
+    fe3co4_disordered: Structure, pbc: tuple[Literal[0, 1], ...]
+) -> None:
+    """All-pairs RDFs from a single neighbor search must exactly match per-pair
+    calculate_rdf results, for ordered and disordered structures.
+    """
+    elements = ["Fe", "Ni", "O"]
+    species = [elem for elem in elements for _ in range(20)]
+    coords = np.random.default_rng(seed=0).uniform(size=(len(species), 3))
+    ordered = Structure(Lattice.cubic(10), species, coords)
+
+    for struct in (ordered, fe3co4_disordered):
+        el_pairs = [
+            (el1, el2)
+            for el1 in [*sorted(struct.chemical_system_set), "Xe"]
+            for el2 in sorted(struct.chemical_system_set)
+        ]
+        radii, pair_rdfs = calculate_all_pair_rdfs(
+            struct, cutoff=8, n_bins=60, pbc=pbc, element_pairs=el_pairs
+        )
+        assert list(pair_rdfs) == el_pairs
+        for (el1, el2), rdf in pair_rdfs.items():
+            ref_radii, ref_rdf = calculate_rdf(struct, el1, el2, 8, 60, pbc=pbc)
+            np.testing.assert_array_equal(radii, ref_radii)
+            np.testing.assert_array_equal(rdf, ref_rdf, err_msg=f"{el1}-{el2}")
+        assert not pair_rdfs["Xe", next(iter(struct.chemical_system_set))].any()
+
+
+def test_calculate_all_pair_rdfs_default_pairs() -> None:
+    _radii, pair_rdfs = calculate_all_pair_rdfs(SI_STRUCTS[1], cutoff=6, n_bins=30)
+    elements = sorted(SI_STRUCTS[1].chemical_system_set)
+    assert list(pair_rdfs) == [
+        (el1, el2) for el1 in elements for el2 in elements if el1 <= el2
+    ]
+    for rdf in pair_rdfs.values():
+        check_basic_rdf_properties(_radii, rdf, 30)
+
+    with pytest.raises(ValueError, match="cutoff=0 must be positive"):
+        calculate_all_pair_rdfs(SI_STRUCTS[0], cutoff=0)
+    with pytest.raises(ValueError, match="n_bins=0 must be positive"):
+        calculate_all_pair_rdfs(SI_STRUCTS[0], n_bins=0)
+
+
+def test_pair_rdfs_no_neighbors_within_cutoff() -> None:
+    """Pairs with no neighbors within cutoff (or a single site of an element) give
+    all-zero RDFs instead of dividing by a zero count.
+    """
+    struct = Structure(Lattice.cubic(5), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+    cutoff = 1  # shorter than the shortest Na-Cl distance of 4.33 Å
+    assert cutoff < struct.distance_matrix[0, 1]
+
+    radii, pair_rdfs = calculate_all_pair_rdfs(struct, cutoff=cutoff, n_bins=10)
+    assert list(pair_rdfs) == [("Cl", "Cl"), ("Cl", "Na"), ("Na", "Na")]
+    for rdf in pair_rdfs.values():
+        assert rdf.shape == radii.shape
+        assert not rdf.any()
+
+    _radii, traj_rdfs = calculate_trajectory_rdfs([struct, struct], cutoff, n_bins=10)
+    for mean, std in traj_rdfs.values():
+        assert not mean.any()
+        assert not std.any()
@@ -8,7 +8,12 @@ import pytest
 from numpy.testing import assert_allclose
 from pymatgen.core import Lattice, Structure
 
-from pymatviz.rdf.figures import element_pair_rdfs, full_rdf
+from pymatviz.rdf.figures import element_pair_rdfs, full_rdf, trajectory_rdfs
+from pymatviz.rdf.helpers import (
+    calculate_all_pair_rdfs,
+    calculate_rdf,
+    calculate_trajectory_rdfs,
+)
 from tests.conftest import SI_ATOMS, SI_STRUCTS
 
 
@@ -421,3 +426,74 @@ def test_full_rdf_legend_position(structures: list[Structure]) -> None:
     assert len(fig_multiple.data) == len(structures)
     for idx, trace in enumerate(fig_multiple.data):
         assert trace.name == f"{idx + 1} {structures[idx].formula}"
+
+
+def test_trajectory_rdfs() -> None:
+    """Frame-averaged RDFs from a generator match the mean of per-frame RDFs."""
+    rng = np.random.default_rng(seed=0)
+    base = Structure(
+        Lattice.cubic(6), ["Si"] * 8 + ["O"] * 8, rng.uniform(size=(16, 3))
+    )
+    frames = [base.copy().perturb(0.2, min_distance=0.05) for _ in range(4)]
+
+    radii, pair_rdfs = calculate_trajectory_rdfs(
+        (frame for frame in frames), cutoff=5, n_bins=50
+    )
+    assert list(pair_rdfs) == [("O", "O"), ("O", "Si"), ("Si", "Si")]
+    per_frame = [calculate_all_pair_rdfs(frame, 5, 50)[1] for frame in frames]
+    for pair, (mean, std) in pair_rdfs.items():
+        stacked = np.array([rdfs[pair] for rdfs in per_frame])
+        assert_allclose(mean, stacked.mean(axis=0), atol=1e-12)
+        assert_allclose(std, stacked.std(axis=0), atol=1e-12)
+    assert len(radii) == 50
+
+    fig = trajectory_rdfs(iter(frames), cutoff=5, n_bins=50, reference_line={})
+    assert isinstance(fig, go.Figure)
+    # one mean line + one std band per element pair
+    assert len(fig.data) == 2 * len(pair_rdfs)
+    assert [anno.text for anno in fig.layout.annotations] == ["O-O", "O-Si", "Si-Si"]
+    assert_allclose(fig.data[1].y, pair_rdfs["O", "O"][0])
+
+    fig = trajectory_rdfs(frames, cutoff=5, element_pairs=[("Si", "O")], show_std=False)
+    assert len(fig.data) == 1
+
+    with pytest.raises(ValueError, match="frames must contain at least one structure"):
+        trajectory_rdfs([])
+
+
+@pytest.mark.parametrize("rdf_func", [element_pair_rdfs, full_rdf])
+@pytest.mark.parametrize(
+    ("kwargs", "err_msg"),
+    [
+        (dict(cutoff=0), "cutoff=0 must be positive"),
+        (dict(cutoff=5, n_bins=0), "n_bins=0 must be positive"),
+        (dict(cutoff=5, n_bins=-1), "n_bins=-1 must be positive"),
+        (dict(cutoff=5, bin_size=10), "n_bins=0 must be positive"),
+    ],
+)
+def test_rdfs_invalid_cutoff_and_n_bins(
+    rdf_func: Any, kwargs: dict[str, Any], err_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=err_msg):
+        rdf_func(SI_STRUCTS[0], **kwargs)
+
+
+def test_full_rdf_negative_cutoff() -> None:
+    # unlike element_pair_rdfs, full_rdf doesn't treat negative cutoffs as relative
+    with pytest.raises(ValueError, match="cutoff=-1 must be positive"):
+        full_rdf(SI_STRUCTS[0], cutoff=-1)
+
+
+@pytest.mark.parametrize("rdf_func", [element_pair_rdfs, full_rdf])
+def test_rdfs_n_jobs_matches_serial(rdf_func: Any) -> None:
+    """Process-pool RDFs must produce the same figure as the serial path."""
+    structs = {"Si2": SI_STRUCTS[0], "SiRuPr": SI_STRUCTS[1], "Si2 atoms": SI_ATOMS[0]}
+    fig_serial = rdf_func(structs, cutoff=6, n_bins=40)
+    fig_parallel = rdf_func(structs, cutoff=6, n_bins=40, n_jobs=2)
+
+    assert fig_serial.to_json() == fig_parallel.to_json()
+    # full RDF must match calculate_rdf without species filters
+    if rdf_func is full_rdf:
+        for trace, struct in zip(fig_serial.data, structs.values(), strict=True):
+            _radii, ref_rdf = calculate_rdf(struct, cutoff=6, n_bins=40)
+            np.testing.assert_array_equal(trace.y, ref_rdf)
@@ -21,6 +21,8 @@ from pymatviz.structure.helpers import (
     CELL_EDGES,
     NO_SYM_MSG,
     _angles_to_rotation_matrix,
+    _image_site_coords,
+    _prep_augmented_structure_for_bonding,
     draw_bonds,
     draw_cell,
     draw_disordered_site,
@@ -254,6 +256,37 @@ def test_get_image_sites_tolerance_ordering(tol1: float, tol2: float) -> None:
     )
 
 
+@pytest.mark.parametrize("cell_boundary_tol", [0.0, 0.1, 0.3])
+def test_image_site_coords_batched(cell_boundary_tol: float) -> None:
+    """Batched image search matches get_image_sites per site and the augmented
+    structure contains each image position only once.
+    """
+    lattice = Lattice.from_parameters(4, 5, 6, 80, 95, 110)
+    struct = Structure(
+        lattice, ["Si", "O", "O"], [[0, 0, 0], [0.5, 0.02, 0.98], [0.999, 0.5, 0]]
+    )
+
+    site_indices, image_coords = _image_site_coords(
+        struct.frac_coords, lattice, cell_boundary_tol=cell_boundary_tol
+    )
+    assert image_coords.shape == (len(site_indices), 3)
+    assert np.all(np.diff(site_indices) >= 0)
+    for site_idx, site in enumerate(struct):
+        expected = get_image_sites(site, lattice, cell_boundary_tol=cell_boundary_tol)
+        assert_allclose(image_coords[site_indices == site_idx], expected)
+
+    augmented = _prep_augmented_structure_for_bonding(
+        struct, show_image_sites=True, cell_boundary_tol=cell_boundary_tol
+    )
+    is_image = [site.properties["is_image"] for site in augmented]
+    assert is_image == [False] * len(struct) + [True] * (len(augmented) - len(struct))
+    unique_coords = np.unique(np.round(augmented.cart_coords[len(struct) :], 5), axis=0)
+    assert len(unique_coords) == len(augmented) - len(struct)
+    assert len(augmented) - len(struct) == len(
+        np.unique(np.round(image_coords, 5), axis=0)
+    )
+
+
 @pytest.mark.parametrize("is_3d", [True, False])
 @pytest.mark.parametrize("is_image", [True, False])
 @pytest.mark.parametrize(
@@ -932,6 +965,74 @@ def test_draw_bonds_advanced(
             assert max(trace.z) <= 3.1
 
 
+@pytest.mark.parametrize("is_3d", [True, False])
+@pytest.mark.parametrize(
+    "bond_kwargs", [None, {"color": "rgb(0, 128, 0)", "width": 1, "dash": "dot"}]
+)
+def test_draw_bonds_batched(
+    bond_test_structure: Structure,
+    is_3d: bool,
+    bond_kwargs: dict[str, Any] | None,
+) -> None:
+    """Batched bonds draw the same colored segments as one trace per bond segment,
+    but with one trace per segment color.
+    """
+    rotation_matrix = None if is_3d else np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+
+    def draw_segments(*, batch: bool) -> tuple[go.Figure, set[tuple[Any, ...]]]:
+        fig = go.Figure()
+        draw_bonds(
+            fig=fig,
+            structure=bond_test_structure,
+            nn=CrystalNN(),
+            is_3d=is_3d,
+            bond_kwargs=bond_kwargs,
+            rotation_matrix=rotation_matrix,
+            batch=batch,
+        )
+        segments = set()
+        for trace in fig.data:
+            coords = np.array([trace.x, trace.y, *([trace.z] if is_3d else [])]).T
+            step = 3 if batch else 2  # batched segments are separated by NaN rows
+            for idx in range(0, len(coords), step):
+                start, end = np.round(coords[idx : idx + 2], 6).tolist()
+                segments.add((tuple(start), tuple(end), trace.line.color))
+        return fig, segments
+
+    fig_legacy, legacy_segments = draw_segments(batch=False)
+    fig_batched, batched_segments = draw_segments(batch=True)
+
+    assert batched_segments == legacy_segments
+    n_colors = len({trace.line.color for trace in fig_legacy.data})
+    assert len(fig_batched.data) == n_colors < len(fig_legacy.data)
+    expected_trace_type = go.Scatter3d if is_3d else go.Scatter
+    for trace in fig_batched.data:
+        assert isinstance(trace, expected_trace_type)
+        assert np.isnan(trace.x[2::3]).all()
+        assert trace.mode == "lines"
+        assert trace.showlegend is False
+        assert trace.hoverinfo == "skip"
+        for key, value in (bond_kwargs or {}).items():
+            assert getattr(trace.line, key) == value
+
+
+@pytest.mark.parametrize(("min_sites", "name_prefix"), [(0, "bonds "), (200, "bond ")])
+def test_draw_bonds_batch_default(
+    bond_test_structure: Structure,
+    min_sites: int,
+    name_prefix: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """batch=None only batches bonds of structures above BATCH_BONDS_MIN_SITES."""
+    monkeypatch.setattr("pymatviz.structure.helpers.BATCH_BONDS_MIN_SITES", min_sites)
+    fig = go.Figure()
+    draw_bonds(fig=fig, structure=bond_test_structure, nn=CrystalNN())
+
+    assert 0 < len(bond_test_structure) <= 200
+    assert len(fig.data) > 0
+    assert all(trace.name.startswith(name_prefix) for trace in fig.data)
+
+
 def test_get_struct_prop(fe3co4_disordered: Structure) -> None:
     """Test the property precedence helper function."""
     struct = fe3co4_disordered
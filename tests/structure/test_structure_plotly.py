@@ -1867,3 +1867,83 @@ def test_disordered_site_legend_name_formatting() -> None:
     sorted_species = [(Species("Fe"), 0.5), (Species("Ni"), 0.5)]
     legend_name = get_disordered_site_legend_name(sorted_species, is_image=False)
     assert legend_name == "Fe₀.₅Ni₀.₅"
+
+
+@pytest.mark.parametrize("plot_func", [pmv.structure_2d, pmv.structure_3d])
+@pytest.mark.parametrize("site_labels", ["legend", "symbol"])
+def test_structure_batch_sites(
+    plot_func: Callable[..., go.Figure], site_labels: str
+) -> None:
+    """Batched sites give the same markers and legend entries with fewer traces."""
+    ordered = Structure(lattice_cubic, ["Na", "Cl"], COORDS)
+    disordered = Structure(lattice_cubic, [{"Fe": 0.75, "Ni": 0.25}, "O"], COORDS)
+    structs = {"ordered": ordered, "disordered": disordered}
+
+    def site_markers(fig: go.Figure) -> tuple[list[Any], set[tuple[Any, ...]]]:
+        legend = sorted(
+            (trace.name, trace.legendgroup, trace.legend)
+            for trace in fig.data
+            if trace.showlegend
+        )
+        markers = set()
+        for trace in fig.data:
+            if trace.type not in ("scatter", "scatter3d") or trace.mode not in (
+                "markers",
+                "markers+text",
+            ):
+                continue
+            n_pts = len(trace.x)
+            z_vals = trace.z if trace.type == "scatter3d" else [0] * n_pts
+            sizes = np.broadcast_to(trace.marker.size, n_pts)
+            hover = np.broadcast_to(np.array(trace.hovertext, dtype=object), n_pts)
+            text = np.broadcast_to(np.array(trace.text or "", dtype=object), n_pts)
+            for x, y, z, size, hover_txt, txt in zip(
+                trace.x, trace.y, z_vals, sizes, hover, text, strict=True
+            ):
+                markers.add(
+                    (
+                        *np.round([x, y, z, size], 6).tolist(),
+                        trace.marker.color,
+                        trace.marker.opacity,
+                        trace.legendgroup,
+                        hover_txt,
+                        txt,
+                    )
+                )
+        return legend, markers
+
+    fig_per_site = plot_func(structs, batch_sites=False, site_labels=site_labels)
+    fig_batched = plot_func(structs, batch_sites=True, site_labels=site_labels)
+
+    assert site_markers(fig_batched) == site_markers(fig_per_site)
+    assert len(fig_batched.data) < len(fig_per_site.data)
+    # disordered sites are still drawn individually in batched mode
+    n_disordered_traces = sum(
+        "Fe₀.₇₅Ni₀.₂₅" in (trace.name or "") for trace in fig_batched.data
+    )
+    assert n_disordered_traces == sum(
+        "Fe₀.₇₅Ni₀.₂₅" in (trace.name or "") for trace in fig_per_site.data
+    )
+    assert n_disordered_traces > 0
+
+
+@pytest.mark.parametrize("plot_func", [pmv.structure_2d, pmv.structure_3d])
+@pytest.mark.parametrize("batch_bonds", [True, False, None])
+def test_structure_batch_bonds(
+    plot_func: Callable[..., go.Figure], batch_bonds: bool | None
+) -> None:
+    """batch_bonds toggles between one trace per bond color and per bond segment."""
+    struct = Structure(Lattice.cubic(3), ["Na", "Cl"], COORDS)
+    fig = plot_func(struct, show_bonds=True, batch_bonds=batch_bonds)
+
+    bond_names = [
+        trace.name for trace in fig.data if (trace.name or "").startswith("bond")
+    ]
+    assert len(bond_names) > 0
+    # None only batches structures with more than BATCH_BONDS_MIN_SITES sites
+    if batch_bonds:
+        assert all(name.startswith("bonds ") for name in bond_names)
+        assert len(bond_names) == len(set(bond_names))  # one trace per color
+    else:
+        assert all(name.startswith("bond ") for name in bond_names)
+        assert any(name.endswith("segment 0") for name in bond_names)
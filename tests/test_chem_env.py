@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
 import pytest
 from pymatgen.core import Lattice, Structure
 
+import pymatviz as pmv
 from pymatviz import chem_env
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
 @pytest.mark.parametrize(
     ("symbol", "symbol_cn_mapping", "expected_cn"),
     [
@@ -310,3 +322,195 @@ def test_classify_local_env_structure_robustness(
             assert len(result) > 0
             # Should handle gracefully - either return specific geometry or generic CN
             assert ":" in result or result.startswith("CN")
+
+
+def test_classify_local_env_reuses_nn_info_and_order_params(
+    structures: tuple[Structure, Structure],
+) -> None:
+    """Precomputed nn_info skips CrystalNN and order params are cached per CN."""
+    from pymatgen.analysis.local_env import CrystalNN
+
+    structure = structures[1]
+    nn_info = CrystalNN().get_nn_info(structure, 0)
+    cn_val = len(nn_info)
+    expected = chem_env.classify_local_env_with_order_params(structure, 0, cn_val)
+
+    with patch.object(chem_env, "_get_crystal_nn") as mock_get_crystal_nn:
+        result = chem_env.classify_local_env_with_order_params(
+            structure, 0, cn_val, nn_info=nn_info
+        )
+    mock_get_crystal_nn.assert_not_called()
+    assert result == expected
+
+    names, local_ops = chem_env._get_local_struct_order_params(6)
+    assert chem_env._get_local_struct_order_params(6)[1] is local_ops
+    assert "octahedral" in names
+
+
+def test_get_crystal_nn_info_cache(
+    structures: tuple[Structure, Structure], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Neighbors are computed once per structure and site and shared by the
+    classifier and the CrystalNN-based sunburst and treemap.
+    """
+    monkeypatch.setattr(chem_env, "_nn_info_cache", OrderedDict())
+    structure = structures[0]
+    crystal_nn = chem_env._get_crystal_nn()
+
+    with patch.object(
+        crystal_nn, "get_nn_info", wraps=crystal_nn.get_nn_info
+    ) as mock_get_nn_info:
+        nn_info = chem_env.get_crystal_nn_info(structure, 0)
+        # equal copies are cache hits, other sites and modified structures misses
+        assert chem_env.get_crystal_nn_info(structure.copy(), 0) is nn_info
+        assert mock_get_nn_info.call_count == 1
+        chem_env.get_crystal_nn_info(structure, 1)
+        perturbed = structure.copy().perturb(0.1)
+        assert chem_env.get_crystal_nn_info(perturbed, 0) is not nn_info
+        assert mock_get_nn_info.call_count == 3
+
+        chem_env.classify_local_env_with_order_params(structure, 0, len(nn_info))
+        pmv.chem_env_sunburst(structure, chem_env_settings="crystal_nn")
+        pmv.chem_env_treemap(structure, chem_env_settings="crystal_nn")
+        assert mock_get_nn_info.call_count == 3
+
+        # least recently used structures are evicted beyond NN_INFO_CACHE_SIZE
+        monkeypatch.setattr(chem_env, "NN_INFO_CACHE_SIZE", 1)
+        chem_env.get_crystal_nn_info(perturbed, 0)
+        assert len(chem_env._nn_info_cache) == 1
+        chem_env.get_crystal_nn_info(structure, 0)
+        assert mock_get_nn_info.call_count == 4
+
+
+def test_compute_coord_envs_parallel_and_cache(
+    structures: tuple[Structure, Structure], tmp_path: Path
+) -> None:
+    """Parallel runs match serial ones and cached results skip ChemEnv."""
+    structs = [structures[0], structures[1], structures[0]]
+    serial = chem_env.compute_coord_envs(structs)
+    assert all(isinstance(counts, dict) and counts for counts in serial)
+    assert serial[0] == serial[2]
+
+    assert chem_env.compute_coord_envs(structs, n_jobs=2) == serial
+
+    assert chem_env.compute_coord_envs(structs, cache_dir=tmp_path) == serial
+    assert len(list(tmp_path.glob("*.json"))) == 2  # duplicate structure shares file
+
+    with patch.object(chem_env, "_coord_envs_for_structure") as mock_compute:
+        assert chem_env.compute_coord_envs(structs, cache_dir=tmp_path) == serial
+    mock_compute.assert_not_called()
+
+
+def test_compute_coord_envs_timeout(structures: tuple[Structure, Structure]) -> None:
+    """Structures exceeding the timeout are skipped with a warning."""
+    with pytest.warns(UserWarning, match="ChemEnv analysis timed out"):
+        results = chem_env.compute_coord_envs(structures, timeout=1e-3)
+    assert results == [None, None]
+
+
+def _fail_on_sodium(structure: Structure, *_args: object) -> dict[tuple[int, str], int]:
+    """Stand-in for _coord_envs_for_structure that fails for Na structures with
+    the error type given by the structure's "error" property.
+    """
+    if "Na" in structure.symbol_set:
+        raise structure.properties["error"]("unsupported structure")
+    return {(len(structure), "X"): len(structure)}
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("error", [RuntimeError, ImportError, ValueError, KeyError])
+def test_compute_coord_envs_failures(
+    structures: tuple[Structure, Structure],
+    n_jobs: int,
+    error: type[Exception],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Serial and parallel runs both skip structures failing with ChemEnv errors
+    with a warning and raise any other error.
+    """
+    monkeypatch.setattr(chem_env, "_coord_envs_for_structure", _fail_on_sodium)
+    na_cl = Structure(Lattice.cubic(5), ["Na", "Cl"], [[0] * 3, [0.5] * 3])
+    na_cl.properties["error"] = error
+    structs = [na_cl, structures[0]]
+
+    if error in (ValueError, KeyError):
+        with pytest.raises(error, match="unsupported structure"):
+            chem_env.compute_coord_envs(structs, n_jobs=n_jobs)
+        return
+
+    with pytest.warns(UserWarning, match="ChemEnv analysis failed.*unsupported"):
+        results = chem_env.compute_coord_envs(structs, n_jobs=n_jobs)
+    n_sites = len(structures[0])
+    assert results == [None, {(n_sites, "X"): n_sites}]
+
+
+def _pid_initializer() -> tuple[int]:
+    return (os.getpid(),)
+
+
+def _task_with_pid(delay: float, worker_pid: int) -> tuple[float, int]:
+    if delay < 0:
+        os._exit(1)  # simulate a worker crash (e.g. segfault in a C extension)
+    time.sleep(delay)
+    return delay, worker_pid
+
+
+def _crashing_initializer() -> tuple[int]:
+    os._exit(1)
+
+
+def test_map_in_subprocesses_reuses_workers() -> None:
+    """Tasks share a pool of n_jobs workers that each run the initializer once."""
+    delays = [0.0, 0.01, 0.02, 0.0, 0.03, 0.01]
+    results = chem_env._map_in_subprocesses(
+        _task_with_pid,
+        [(delay,) for delay in delays],
+        n_jobs=2,
+        initializer=_pid_initializer,
+    )
+    assert [delay for delay, _ in results] == delays
+    worker_pids = {pid for _, pid in results}
+    assert os.getpid() not in worker_pids
+    assert len(worker_pids) <= 2
+
+
+def test_map_in_subprocesses_timeout_and_crash() -> None:
+    """Timed out and crashing tasks are reported per task while all other tasks
+    finish in replacement pools.
+    """
+    delays = [0.0, 5, 0.01, -1, 0.02, 0.0]
+    start = time.perf_counter()
+    results = chem_env._map_in_subprocesses(
+        _task_with_pid,
+        [(delay,) for delay in delays],
+        n_jobs=2,
+        timeout=1,
+        initializer=_pid_initializer,
+    )
+    assert time.perf_counter() - start < 5
+    assert isinstance(results[1], TimeoutError)
+    assert isinstance(results[3], BrokenProcessPool)
+    finished = [res for idx, res in enumerate(results) if idx not in (1, 3)]
+    assert [delay for delay, _ in finished] == [0.0, 0.01, 0.02, 0.0]
+
+
+def test_map_in_subprocesses_startup_failures() -> None:
+    """Workers crashing during setup raise instead of being restarted forever."""
+    with pytest.raises(BrokenProcessPool, match="crashed 3 times in a row"):
+        chem_env._map_in_subprocesses(
+            _task_with_pid,
+            [(0.0,)] * 4,
+            n_jobs=2,
+            initializer=_crashing_initializer,
+        )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_compute_coord_envs_invalid_settings(
+    structures: tuple[Structure, Structure], n_jobs: int
+) -> None:
+    """Invalid ChemEnv settings raise in both serial and parallel runs."""
+    with pytest.raises(TypeError, match="unexpected keyword argument"):
+        chem_env.compute_coord_envs(
+            structures, chem_env_settings={"bad_key": 1}, n_jobs=n_jobs
+        )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
 import urllib.request
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 import pytest
 
 import pymatviz as pmv
@@ -15,7 +18,7 @@ import pymatviz as pmv
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
-    from typing import Any
+    from typing import Any, Self
 
     import pandas as pd
 
@@ -63,9 +66,241 @@ def test_save_fig(
             assert '"scrollZoom": true' in html
 
         if ext == "svelte":
-            assert html.startswith("<div {...$$props}>")
+            assert html.startswith("<div {...$$props} style=")
         else:
-            assert html.startswith("<div>")
+            assert html.startswith("<div style=")
+
+
+def test_save_fig_prec(tmp_path: Path) -> None:
+    """Test prec rounds all float arrays in fig.data without modifying the figure."""
+    xs = np.array([1.23456, 2.34567])
+    fig = go.Figure(go.Scatter(x=xs, y=[0.98765, None], marker_color=xs))
+    fig.add_heatmap(z=np.array([[0.111111, 0.222222]]), customdata=[[["a", 1.2345]]])
+    fig.add_scatter(x=[1, 2], y=[3, 4], opacity=0.123456)
+
+    path = f"{tmp_path}/fig.html"
+    pmv.save_fig(fig, path, prec=2, env_disable=[])
+    with open(path) as file:
+        html = file.read()
+
+    for expected in (
+        '"x":[1.23,2.35]',
+        '"y":[0.99,null]',
+        '"color":[1.23,2.35]',
+        '"z":[[0.11,0.22]]',
+        '"customdata":[[["a",1.23]]]',
+        '"opacity":0.123456',  # scalar properties aren't rounded
+    ):
+        assert expected in html.replace(" ", "")
+    # original figure is unchanged
+    assert list(fig.data[0].x) == list(xs)
+    assert fig.data[1].z[0][0] == 0.111111
+
+
+@pytest.mark.parametrize("ext", ["html", "svelte"])
+def test_save_fig_style(tmp_path: Path, ext: str) -> None:
+    """Test style and svelte props are injected in a single clean write."""
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+    path = f"{tmp_path}/fig.{ext}"
+    # pre-existing longer file must be fully replaced, not partially overwritten
+    with open(path, mode="w") as file:
+        file.write("stale content " * 10_000)
+
+    pmv.save_fig(fig, path, style="width: 50%", env_disable=[])
+    with open(path) as file:
+        html = file.read()
+
+    assert "stale content" not in html
+    assert html.count("Plotly.newPlot") == 1
+    assert html.count("style='width: 50%'") == 1
+    first_tag = html.split(">", 1)[0]
+    assert first_tag.startswith("<div ")
+    assert ("{...$$props}" in first_tag) == (ext == "svelte")
+    assert html.endswith("\n") == (ext == "svelte")
+    assert os.listdir(tmp_path) == [f"fig.{ext}"]  # no leftover temp files
+
+
+def test_save_fig_html_write_error(tmp_path: Path) -> None:
+    """Test failed HTML writes leave neither the target nor a temp file behind and
+    auto_open (a fig.write_html() kwarg) is ignored instead of passed to to_html().
+    """
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+    path = f"{tmp_path}/fig.html"
+
+    with (
+        patch("os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        pmv.save_fig(fig, path, env_disable=[], auto_open=True)
+    assert os.listdir(tmp_path) == []
+
+    pmv.save_fig(fig, path, env_disable=[], auto_open=True)
+    assert os.listdir(tmp_path) == ["fig.html"]
+
+
+@pytest.mark.parametrize(("typed_arrays", "dtype"), [(True, "f8"), ("float32", "f4")])
+def test_save_fig_typed_arrays(
+    tmp_path: Path, typed_arrays: bool | str, dtype: str
+) -> None:
+    """Test typed_arrays embeds list data as base64 typed arrays in HTML."""
+    fig = go.Figure(go.Scatter(x=[0.1, 0.2, 0.3], y=[1, 2, 3], text=["a", "b", "c"]))
+
+    path = f"{tmp_path}/fig.html"
+    pmv.save_fig(fig, path, typed_arrays=typed_arrays, env_disable=[])  # type: ignore[arg-type]
+    with open(path) as file:
+        html = file.read().replace(" ", "")
+
+    assert f'"x":{{"dtype":"{dtype}","bdata":' in html
+    assert '"y":{"dtype":"i4","bdata":' in html
+    assert '"text":["a","b","c"]' in html
+    assert fig.data[0].x == (0.1, 0.2, 0.3)  # figure is unchanged
+
+
+def test_save_fig_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test cache skips exports of unchanged figures and tracks hits/misses."""
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+    path = f"{tmp_path}/fig.html"
+    fig_cache = pmv.io.FigCache()
+
+    def save_and_mark(**kwargs: Any) -> str:
+        """Save fig, then return the file's content and append a marker to detect
+        whether the next save_fig call rewrites the file.
+        """
+        pmv.save_fig(fig, path, env_disable=[], cache=fig_cache, **kwargs)
+        with open(path, mode="r+") as file:
+            html = file.read()
+            file.write("<!-- not rewritten -->")
+        return html
+
+    save_and_mark()
+    assert (fig_cache.hits, fig_cache.misses) == (0, 1)
+    with open(f"{tmp_path}/{fig_cache.index_name}") as file:
+        assert list(json.load(file)) == ["fig.html"]
+
+    assert save_and_mark().endswith("<!-- not rewritten -->")  # unchanged -> hit
+    assert (fig_cache.hits, fig_cache.misses) == (1, 1)
+
+    # changed export options, figure content and deleted files are all misses
+    assert "not rewritten" not in save_and_mark(style="width: 50%")
+    fig.layout.title = "new title"
+    assert "not rewritten" not in save_and_mark(style="width: 50%")
+    os.remove(path)
+    save_and_mark(style="width: 50%")
+    assert (fig_cache.hits, fig_cache.misses) == (1, 4)
+
+    # a new cache (e.g. in the next build run) picks up the index from disk
+    fresh_cache = pmv.io.FigCache()
+    pmv.save_fig(fig, path, env_disable=[], cache=fresh_cache, style="width: 50%")
+    assert (fresh_cache.hits, fresh_cache.misses) == (1, 0)
+
+    # cache=True uses the module-level default cache
+    monkeypatch.setattr(pmv.io, "DEFAULT_FIG_CACHE", fresh_cache)
+    pmv.save_fig(fig, path, env_disable=[], cache=True, style="width: 50%")
+    assert fresh_cache.hits == 2
+
+
+def test_save_and_compress_svg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test SVGs are compressed with svgo after export but not on cache hits."""
+    monkeypatch.delenv("CI", raising=False)
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+    path = f"{tmp_path}/fig.svg"
+    fig_cache = pmv.io.FigCache()
+
+    def fake_write_image(self: go.Figure, file: str, **_kwargs: Any) -> None:
+        with open(file, mode="w") as svg_file:  # no Kaleido/Chrome needed
+            svg_file.write(f"<svg>{self.layout.title.text}</svg>")
+
+    monkeypatch.setattr(go.Figure, "write_image", fake_write_image)
+    with (
+        patch("pymatviz.io.which", return_value="/usr/bin/svgo") as mock_which,
+        patch("subprocess.run") as mock_run,
+    ):
+        pmv.io.save_and_compress_svg(fig, path, cache=fig_cache)
+        mock_which.assert_called_once_with("svgo")
+        mock_run.assert_called_once_with(
+            ["/usr/bin/svgo", "--multipass", "--final-newline", path], check=True
+        )
+        assert os.path.isfile(path)
+
+        # unchanged figure is a cache hit: neither re-exported nor re-compressed
+        pmv.io.save_and_compress_svg(fig, path, cache=fig_cache)
+        assert (fig_cache.hits, fig_cache.misses) == (1, 1)
+        assert mock_run.call_count == 1
+
+        fig.layout.title = "changed"
+        pmv.io.save_and_compress_svg(fig, path, cache=fig_cache)
+        assert mock_run.call_count == 2
+    with open(path) as file:
+        assert file.read() == "<svg>changed</svg>"
+
+    # without svgo in PATH the SVG is written uncompressed
+    with (
+        patch("pymatviz.io.which", return_value=None),
+        patch("subprocess.run") as mock_run,
+    ):
+        pmv.io.save_and_compress_svg(fig, f"{tmp_path}/no-svgo.svg")
+    mock_run.assert_not_called()
+    assert os.path.isfile(f"{tmp_path}/no-svgo.svg")
+
+
+def test_save_figs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test save_figs renders images in one Kaleido session and reports failures."""
+    sessions: list[dict[str, Any]] = []
+
+    class FakeKaleido:
+        """Records calls instead of rendering (no Chrome needed)."""
+
+        def __init__(self, n: int, timeout: float | None) -> None:
+            self.session = dict(n=n, timeout=timeout, warmups=0, figs={})
+            sessions.append(self.session)
+
+        async def __aenter__(self) -> Self:
+            return self
+
+        async def __aexit__(self, *_: object) -> None:
+            pass
+
+        async def calc_fig(self, *_: Any, **__: Any) -> bytes:
+            self.session["warmups"] += 1
+            return b""
+
+        async def write_fig(
+            self, fig: dict[str, Any], path: str, opts: dict[str, Any], **_: Any
+        ) -> None:
+            if "bad" in path:
+                raise RuntimeError(f"failed to render {path}")
+            self.session["figs"][path] = (fig, opts)
+
+    monkeypatch.setitem(sys.modules, "kaleido", type(sys)("kaleido"))
+    monkeypatch.setattr(sys.modules["kaleido"], "Kaleido", FakeKaleido, raising=False)
+
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4], visible="legendonly"))
+    paths = [f"{tmp_path}/{name}" for name in ("a.png", "b.pdf", "bad.svg", "c.html")]
+    results = pmv.io.save_figs(
+        [(fig, path) for path in paths], n_workers=2, env_disable=[], scale=2
+    )
+
+    assert [res.path for res in results] == paths
+    assert [res.error is None for res in results] == [True, True, False, True]
+    assert "failed to render" in str(results[2].error)
+    assert all(res.duration >= 0 for res in results)
+    assert os.path.isfile(paths[3])  # HTML is written by save_fig()
+
+    # one warm session for all images, MathJax loaded once per worker
+    (session,) = sessions
+    assert set(session["figs"]) == set(paths[:2])
+    assert session["n"] == session["warmups"] == 2
+    png_dict, png_opts = session["figs"][paths[0]]
+    assert png_opts == dict(format="png", scale=2)
+    assert png_dict["data"][0]["visible"] is False  # legendonly traces are hidden
+    pdf_dict, _ = session["figs"][paths[1]]
+    assert pdf_dict["layout"]["template"] == (
+        pio.templates["pymatviz_white"].to_plotly_json()
+    )
+    assert fig.data[0].visible == "legendonly"  # input figure is not modified
+
+    with patch.dict(os.environ, {"CI": "1"}):
+        assert pmv.io.save_figs([(fig, paths[0])]) == []
 
 
 def test_plotly_pdf_no_mathjax_loading(tmp_path: Path) -> None:
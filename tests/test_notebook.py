@@ -323,6 +323,35 @@ def test_object_repr_mimebundle(
         pmv.notebook_mode(on=False)
 
 
+@pytest.mark.parametrize(("typed_arrays", "dtype"), [(True, "f8"), ("float32", "f4")])
+def test_render_mime_typed_arrays(
+    structures: tuple[Structure, Structure],
+    monkeypatch: pytest.MonkeyPatch,
+    typed_arrays: bool | str,
+    dtype: str,
+) -> None:
+    """Test notebook_mode(typed_arrays=...) base64-encodes plotly MIME trace data."""
+    import plotly.graph_objects as go
+
+    def list_data_renderer(_struct: Structure) -> go.Figure:
+        return go.Figure(go.Scatter(x=[0.5, 1.5], y=[1.0, 2.0]))
+
+    monkeypatch.setitem(notebook._RENDERER_REGISTRY, Structure, list_data_renderer)
+    try:
+        pmv.notebook_mode(on=True)
+        trace = notebook._render_mime(structures[0])["application/vnd.plotly.v1+json"]
+        assert trace["data"][0]["x"] == [0.5, 1.5]  # off by default
+
+        pmv.notebook_mode(on=True, typed_arrays=typed_arrays)  # type: ignore[arg-type]
+        plotly_json = notebook._render_mime(structures[0])[
+            "application/vnd.plotly.v1+json"
+        ]
+        assert plotly_json["data"][0]["x"]["dtype"] == dtype
+        assert plotly_json["data"][0]["y"]["dtype"] == dtype
+    finally:
+        pmv.notebook_mode(on=False)
+
+
 def test_structure_toolbar_hiding(structures: tuple[Structure, Structure]) -> None:
     """Test that plotly toolbar is properly hidden in structure display."""
     pmv.notebook_mode(on=True)
@@ -483,3 +483,67 @@ def test_add_ecdf_line_annotation_positioning() -> None:
     assert fig.data[5].name == "Cumulative"
     assert fig.data[5].legendgroup == "4"  # Should match the index of the trace (4)
     assert fig.data[5].text == "Annotation 3"
+
+
+def test_parity_stats() -> None:
+    """Test ParityStats matches sklearn metrics and np.polyfit when built in chunks."""
+    from sklearn.metrics import mean_absolute_percentage_error, r2_score
+
+    xs = np_rng.normal(loc=1e3, size=1_000)
+    ys = 0.9 * xs + np_rng.normal(scale=0.5, size=1_000)
+    xs[3], ys[7] = np.nan, np.nan  # NaN pairs are skipped
+    finite = ~np.isnan(xs) & ~np.isnan(ys)
+    x_fin, y_fin = xs[finite], ys[finite]
+
+    stats = powerups.ParityStats()
+    for x_chunk, y_chunk in zip(
+        np.array_split(xs, 7), np.array_split(ys, 7), strict=True
+    ):
+        stats.update(x_chunk, y_chunk)
+    # chunks from different workers can be merged in any order
+    merged = powerups.ParityStats.from_arrays(xs[500:], ys[500:]) + (
+        powerups.ParityStats.from_arrays(xs[:500], ys[:500])
+    )
+
+    slope, intercept = np.polyfit(x_fin, y_fin, 1)
+    for acc in (stats, merged):
+        assert acc.n == finite.sum()
+        assert acc.mae == pytest.approx(np.abs(x_fin - y_fin).mean())
+        assert acc.rmse == pytest.approx(((x_fin - y_fin) ** 2).mean() ** 0.5)
+        assert acc.r2 == pytest.approx(r2_score(x_fin, y_fin))
+        assert acc.mape == pytest.approx(mean_absolute_percentage_error(x_fin, y_fin))
+        assert acc.slope == pytest.approx(slope)
+        assert acc.intercept == pytest.approx(intercept)
+        assert (acc.x_min, acc.x_max) == (x_fin.min(), x_fin.max())
+
+    empty = powerups.ParityStats()
+    assert np.isnan(empty.mae)
+    assert np.isnan(empty.r2)
+    with pytest.raises(ValueError, match="xs and ys must have the same shape"):
+        empty.update([1, 2], [1])
+
+
+def test_powerups_accept_parity_stats() -> None:
+    """Test annotation and best-fit line from ParityStats match raw arrays."""
+    xs = np_rng.random(100)
+    ys = xs + np_rng.normal(scale=0.1, size=100)
+    stats = powerups.ParityStats.from_arrays(xs, ys)
+
+    metrics = ("MAE", "RMSE", "R2")
+    fig_stats = powerups.annotate_metrics(stats, fig=go.Figure(), metrics=metrics)
+    fig_arrays = powerups.annotate_metrics(xs, ys, fig=go.Figure(), metrics=metrics)
+    assert fig_stats.layout.annotations[0].text == fig_arrays.layout.annotations[0].text
+
+    fig_stats = powerups.add_best_fit_line(go.Figure(), xs=stats)
+    fig_arrays = powerups.add_best_fit_line(go.Figure(), xs=xs, ys=ys)
+    line_stats, line_arrays = fig_stats.layout.shapes[0], fig_arrays.layout.shapes[0]
+    for key in ("x0", "x1", "y0", "y1"):
+        assert line_stats[key] == pytest.approx(line_arrays[key])
+    assert fig_stats.layout.annotations[0].text.startswith("LS fit: y = ")
+
+    fig = powerups.enhance_parity_plot(go.Figure(), xs=stats, identity_line=False)
+    assert len(fig.layout.shapes) == 1  # best-fit line added since R2 > 0.3
+    assert any("MAE" in anno.text for anno in fig.layout.annotations)
+
+    with pytest.raises(ValueError, match="can't be computed from ParityStats"):
+        powerups.annotate_metrics(stats, fig=go.Figure(), metrics=["max_error"])
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import copy
+import io
 import re
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 import pytest
+import scipy.stats
 from pymatgen.core import (
     Composition,
     IMolecule,
@@ -93,6 +96,68 @@ def test_count_elements_mixed_input() -> None:
     pd.testing.assert_series_equal(series, expected, check_dtype=False)
 
 
+@pytest.mark.parametrize(
+    "formula",
+    ["Fe2O3", "Fe2 O3", " Li0.5CoO2 ", "Na.5Cl", "FeFe2O4", "Fe0O2", "C60", "K2O1.5"],
+)
+def test_parse_simple_formula(formula: str) -> None:
+    elem_amounts = pmv_pd.parse_simple_formula(formula)
+    assert elem_amounts == Composition(formula).as_dict()
+
+
+@pytest.mark.parametrize("formula", ["Ca(OH)2", "Fe2+O", "D2O", "Fe1e-3", "Uuo", ""])
+def test_parse_simple_formula_falls_back(formula: str) -> None:
+    assert pmv_pd.parse_simple_formula(formula) is None
+
+
+@pytest.mark.parametrize("count_mode", ElemCountMode)
+def test_count_elements_fast_path_matches_pymatgen(count_mode: ElemCountMode) -> None:
+    """Plain formula strings skip pymatgen but must count the same as Compositions."""
+    formulas = ["Fe2O3", "Li0.5CoO2", "O2", "H2O2", "Ca(OH)2", "D2O", "Fe2O3"] * 3
+    series = pmv_pd.count_elements(formulas, count_mode=count_mode)
+    expected = pmv_pd.count_elements(
+        [*map(Composition, formulas)], count_mode=count_mode
+    )
+    pd.testing.assert_series_equal(series, expected)
+
+
+@pytest.mark.parametrize("count_mode", ElemCountMode)
+def test_count_elements_chunked(count_mode: ElemCountMode) -> None:
+    formulas = ["Fe2O3", "Li0.5CoO2", Composition("Fe4P4O16"), "NaCl", "Fe2O3"] * 7
+    expected = pmv_pd.count_elements(formulas, count_mode=count_mode)
+
+    list_chunks = (formulas[idx : idx + 4] for idx in range(0, len(formulas), 4))
+    df_chunks = iter(
+        [pd.DataFrame({"formula": formulas[:20], "id": range(20)}), formulas[20:]]
+    )
+    for chunks in (list_chunks, df_chunks, iter(formulas)):
+        series = pmv_pd.count_elements(chunks, count_mode=count_mode)
+        pd.testing.assert_series_equal(series, expected)
+
+    # small chunk_size to check single formulas get batched correctly
+    counts = pmv_pd._count_elements_in_chunks(iter(formulas), count_mode, chunk_size=3)
+    pd.testing.assert_series_equal(
+        counts, expected.dropna(), check_names=False, check_dtype=False
+    )
+
+
+def test_count_elements_chunked_read_csv() -> None:
+    csv_file = io.StringIO("formula,energy\n" + "Fe2O3,1\nNaCl,2\n" * 50)
+    chunks = pd.read_csv(csv_file, chunksize=7)
+    series = pmv_pd.count_elements(chunks, fill_value=0)
+    assert series[["Fe", "O", "Na", "Cl"]].to_list() == [100, 150, 50, 50]
+    assert series.sum() == 350
+
+
+def test_count_elements_chunked_bad_chunks() -> None:
+    with pytest.raises(ValueError, match="DataFrame chunks must have a single column"):
+        pmv_pd.count_elements(iter([pd.DataFrame({"a": ["Fe"], "b": ["O"]})]))
+    with pytest.raises(ValueError, match="Expected chunks of compositions"):
+        pmv_pd.count_elements(iter([[1.0, 2.0]]))
+    empty = pmv_pd.count_elements(iter([]), fill_value=0)
+    assert (empty == 0).all()
+
+
 def test_count_elements_exclude_elements() -> None:
     compositions = [Composition("Fe2O3")] * 5 + [Composition("Fe4P4O16")] * 3
     series = pmv_pd.count_elements(
@@ -219,6 +284,23 @@ def test_count_formulas_grouping_modes(
     assert list(df_out["count"]) == expected_counts
 
 
+@pytest.mark.parametrize("group_by", ["formula", "reduced_formula", "chem_sys"])
+def test_count_formulas_duplicates(group_by: FormulaGroupBy) -> None:
+    """Duplicated items are parsed once but must still be counted individually."""
+    struct = Structure(Lattice.cubic(3), ["Si"] * 2, [[0, 0, 0], [0.5, 0.5, 0.5]])
+    data = ["Fe2O3", "O-Fe", "Fe4O6", struct, Composition("Fe2O3")] * 4 + [struct]
+    df_out = pmv_pd.count_formulas(data, group_by=group_by)
+
+    assert df_out["count"].sum() == len(data)
+    expected = {
+        "formula": {"Fe2O3": 4, "Fe2 O3": 4, "O-Fe": 4, "Fe4O6": 4, "Si2": 5},
+        "reduced_formula": {"Fe2O3": 12, "O-Fe": 4, "Si": 5},
+        "chem_sys": {"Fe-O": 16, "Si": 5},
+    }[group_by]
+    key_col = "chem_sys" if group_by == "chem_sys" else "formula"
+    assert dict(zip(df_out[key_col], df_out["count"], strict=True)) == expected
+
+
 def test_count_formulas_mixed_input() -> None:
     """Test handling of mixed input types."""
     data = [
@@ -540,6 +622,46 @@ def test_df_to_arrays() -> None:
     assert "not-real-col-name" in str(exc.value)
 
 
+@pytest.mark.parametrize(
+    "backend", ["pandas", "interchange", "polars", "pyarrow", "pyarrow_batch"]
+)
+def test_df_to_arrays_dataframe_like(backend: str) -> None:
+    """Test df_to_arrays reads only requested columns of pandas, Polars, Arrow and
+    interchange protocol dataframes, dropping rows with missing values.
+    """
+    df_pd = pd.DataFrame(
+        {"x": [1.0, np.nan, 3.0, 4.0], "y": [1, 2, 3, 4], "z": ["a", "b", None, "d"]}
+    )
+    df_in = {
+        "pandas": lambda: df_pd,
+        "interchange": df_pd.__dataframe__,
+        "polars": lambda: pytest.importorskip("polars").from_pandas(df_pd),
+        "pyarrow": lambda: pytest.importorskip("pyarrow").Table.from_pandas(df_pd),
+        # RecordBatch columns are pa.Arrays (not ChunkedArrays) with nulls in x and z
+        "pyarrow_batch": lambda: pytest.importorskip("pyarrow").RecordBatch.from_pandas(
+            df_pd
+        ),
+    }[backend]()
+
+    xs, ys = pmv_pd.df_to_arrays(df_in, "x", "y")
+    assert list(xs) == [1, 3, 4]
+    assert list(ys) == [1, 3, 4]
+
+    xs, yz = pmv_pd.df_to_arrays(df_in, "x", ["y", "z"])
+    assert list(xs) == [1, 4]
+    assert {key: list(vals) for key, vals in yz.items()} == {  # type: ignore[union-attr]
+        "y": [1, 4],
+        "z": ["a", "d"],
+    }
+
+    with pytest.raises(KeyError, match="not-real-col-name"):
+        pmv_pd.df_to_arrays(df_in, "x", "not-real-col-name")
+
+    if backend == "pandas":  # columns without missing values aren't copied
+        (ys,) = pmv_pd.df_to_arrays(df_pd, "y")
+        assert np.shares_memory(ys, df_pd["y"].to_numpy())
+
+
 def test_df_to_arrays_strict() -> None:
     args = pmv_pd.df_to_arrays(42, "foo", "bar", strict=False)  # type: ignore[arg-type]
     assert args == ["foo", "bar"]
@@ -626,6 +748,98 @@ def test_bin_df_cols(
         assert density_col not in df_binned
 
 
+@pytest.mark.parametrize("group_by_cols", [[], ["group"]])
+def test_bin_df_cols_matches_pd_cut_groupby(group_by_cols: list[str]) -> None:
+    """Integer bin engine must give the same rows and counts as pd.cut + groupby."""
+    rng = np.random.default_rng(seed=0)
+    n_rows = 2_000
+    df_in = pd.DataFrame(
+        {
+            "x": np.r_[np.linspace(0, 1, 101), rng.normal(size=n_rows - 101)],
+            "y": rng.integers(0, 5, n_rows).astype(float),
+            "label": rng.choice(["a", "b", None], n_rows),
+            "group": rng.choice(["g1", "g2"], n_rows),
+        }
+    )
+    df_in.loc[::13, "x"] = np.nan
+    df_in.loc[::7, "y"] = np.nan
+
+    df_binned = pmv_pd.bin_df_cols(
+        df_in, ["x", "y"], group_by_cols=group_by_cols, n_bins=[10, 4], verbose=False
+    )
+
+    df_ref = df_in.reset_index()
+    cut_cols = ["x_bins", "y_bins"]
+    for col, cut_col, n_bins in zip(["x", "y"], cut_cols, [10, 4], strict=True):
+        df_ref[cut_col] = pd.cut(df_ref[col].values, bins=n_bins)
+    group = df_ref.groupby([*cut_cols, *group_by_cols], observed=True)
+    df_expected = group.first().dropna()
+    df_expected["bin_counts"] = group.size()
+    df_expected = df_expected.reset_index().set_index("index")
+
+    pd.testing.assert_frame_equal(df_binned, df_expected)
+
+
+@pytest.mark.parametrize("corr", [0, 0.5, 0.98])
+def test_binned_kde(corr: float) -> None:
+    """Grid KDE must match the exact gaussian_kde to 0.1% of the peak density."""
+    rng = np.random.default_rng(seed=0)
+    xs = rng.normal(size=2_000)
+    ys = corr * xs + (1 - corr**2) ** 0.5 * rng.normal(size=2_000)
+    values = np.stack([xs, ys])
+    eval_points = np.c_[values[:, :500], [[0.1, np.nan, 8], [0.2, 0, -8]]]
+
+    density = pmv_pd.binned_kde(values, eval_points)
+    assert np.isnan(density[-2])
+    is_num = ~np.isnan(eval_points).any(axis=0)
+    expected = scipy.stats.gaussian_kde(values)(eval_points[:, is_num])
+    assert np.abs(density[is_num] - expected).max() < 1e-3 * expected.max()
+
+    # 1D and custom bandwidth
+    density_1d = pmv_pd.binned_kde(xs, xs[:100], bw_method=0.3, grid_size=1024)
+    expected_1d = scipy.stats.gaussian_kde(xs, bw_method=0.3)(xs[:100])
+    assert density_1d == pytest.approx(expected_1d, rel=1e-3)
+
+
+@pytest.mark.parametrize("grid_size", [512, 1024])
+def test_binned_kde_multimodal_with_outliers(grid_size: int) -> None:
+    """Error stays within the documented 0.15 * h**2 of the peak density when far
+    outliers stretch the grid (h = grid spacing in kernel bandwidths).
+    """
+    rng = np.random.default_rng(seed=0)
+    values = np.hstack(
+        [
+            rng.normal(size=(2, 1_000)),
+            rng.normal(loc=6, size=(2, 1_000)),
+            rng.uniform(-40, 40, size=(2, 10)),
+        ]
+    )
+    eval_points = values[:, ::2]
+
+    kde = scipy.stats.gaussian_kde(values)
+    z_values = np.linalg.solve(np.linalg.cholesky(kde.covariance), values)
+    spacing = ((np.ptp(z_values, axis=1) + 8) / (grid_size - 1)).max()
+    assert spacing > 0.1  # outliers make the grid much coarser than for normal data
+
+    expected = kde(eval_points)
+    density = pmv_pd.binned_kde(values, eval_points, grid_size=grid_size)
+    max_err = np.abs(density - expected).max() / expected.max()
+    assert max_err < 0.15 * spacing**2
+
+
+def test_bin_df_cols_binned_kde(df_float: pd.DataFrame) -> None:
+    kwargs = dict(n_bins=20, density_col="kde", verbose=False)
+    df_exact = pmv_pd.bin_df_cols(df_float, ["A", "B"], **kwargs)
+    df_binned = pmv_pd.bin_df_cols(
+        df_float, ["A", "B"], density_method="binned_kde", **kwargs
+    )
+    rel_err = (df_binned["kde"] - df_exact["kde"]).abs() / df_exact["kde"].max()
+    assert rel_err.max() < 1e-3
+
+    with pytest.raises(ValueError, match="Unknown density_method='foo'"):
+        pmv_pd.bin_df_cols(df_float, ["A", "B"], density_method="foo", **kwargs)
+
+
 def test_bin_df_cols_raises() -> None:
     df_dummy = pd.DataFrame({"col1": [1, 2, 3, 4], "col2": [2, 3, 4, 5]})
     bin_by_cols = ["col1", "col2"]
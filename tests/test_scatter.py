@@ -13,6 +13,7 @@ from tests.conftest import df_regr, np_rng
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any, Literal
 
     from tests.conftest import DfOrArrays
@@ -28,13 +29,13 @@ DF_TIPS = px.data.tips()
     "stats",
     [False, True, dict(prefix="test", font=dict(size=10))],
 )
-@pytest.mark.parametrize("density", ["kde", "empirical", None])
+@pytest.mark.parametrize("density", ["kde", "binned_kde", "empirical", None])
 def test_density_scatter(
     df_or_arrays: DfOrArrays,
     log_density: bool | None,
     n_bins: int | None | bool,
     stats: bool | dict[str, Any],
-    density: Literal["kde", "empirical"] | None,
+    density: Literal["kde", "binned_kde", "empirical"] | None,
 ) -> None:
     """Test density_scatter function with Plotly backend."""
     df, x, y = df_or_arrays
@@ -86,6 +87,38 @@ def test_density_scatter_uses_series_name_as_label() -> None:
     assert fig.layout.yaxis.title.text == "y"
 
 
+@pytest.mark.parametrize("log_density", [True, False])
+def test_density_scatter_raster(log_density: bool) -> None:
+    xs = np_rng.normal(size=5_000)
+    ys = xs + np_rng.normal(scale=0.2, size=5_000)
+    fig = pmv.density_scatter(xs, ys, raster=True, n_bins=40, log_density=log_density)
+
+    # single image trace with one pixel per bin and counts of all points
+    assert [trace.type for trace in fig.data] == ["heatmap"]
+    image = fig.data[0]
+    counts = np.asarray(image.customdata)[..., 0]
+    assert counts.shape == (40, 40)
+    assert np.nansum(counts) == len(xs)
+    expected_z = np.log10(counts + 1) if log_density else counts
+    np.testing.assert_allclose(image.z, expected_z, rtol=1e-6)
+    assert (fig.layout.coloraxis.colorbar.ticktext is not None) == log_density
+    assert "customdata[0]" in image.hovertemplate
+
+    # identity line drawn above the image, stats computed on raw data
+    assert {shape.layer for shape in fig.layout.shapes} == {"above"}
+    assert any("MAE" in anno.text for anno in fig.layout.annotations)
+
+    # figure size doesn't grow with number of points
+    xs_big = np_rng.normal(size=50_000)
+    fig_big = pmv.density_scatter(xs_big, xs_big, raster=True, n_bins=40)
+    assert len(fig_big.to_json()) < 1.1 * len(fig.to_json())
+
+    with pytest.raises(ValueError, match="raster=True is not supported with facet_col"):
+        pmv.density_scatter(
+            df=DF_TIPS, x="total_bill", y="tip", raster=True, facet_col="day"
+        )
+
+
 def test_density_scatter_with_hist(df_or_arrays: DfOrArrays) -> None:
     """Test density_scatter_with_hist function."""
     df, x, y = df_or_arrays
@@ -122,6 +155,73 @@ def test_density_hexbin(
     assert len(scatter_traces) > 0
 
 
+@pytest.mark.parametrize(
+    ("reduce_func", "np_func"),
+    [
+        ("sum", np.sum),
+        ("mean", np.mean),
+        ("median", np.median),
+        ("min", np.min),
+        ("max", np.max),
+        (np.std, np.std),
+    ],
+)
+def test_hex_bin(reduce_func: str | Callable[..., float], np_func: Callable) -> None:
+    """Test hex_bin assigns points to the nearest hexagon and reduces weights."""
+    xs, ys = np_rng.normal(size=(2, 500))
+    weights = np_rng.random(500)
+    xs[0], ys[1] = np.nan, np.inf  # non-finite points are dropped
+
+    hex_x, hex_y, values = pmv.scatter.hex_bin(
+        xs, ys, gridsize=8, weights=weights, reduce_func=reduce_func
+    )
+    assert len(hex_x) == len(hex_y) == len(values)
+
+    # brute force: every point belongs to its nearest center in regular-hexagon units
+    finite = np.isfinite(xs) & np.isfinite(ys)
+    x_scale = (xs[finite].max() - xs[finite].min()) / 8
+    y_scale = (ys[finite].max() - ys[finite].min()) / int(8 / np.sqrt(3))
+    dists = ((xs[finite, None] - hex_x) / x_scale) ** 2 + 3 * (
+        (ys[finite, None] - hex_y) / y_scale
+    ) ** 2
+    nearest = dists.argmin(axis=1)
+    expected = [np_func(weights[finite][nearest == idx]) for idx in range(len(values))]
+    np.testing.assert_allclose(values, expected)
+
+    counts = pmv.scatter.hex_bin(xs, ys, gridsize=8)[2]
+    assert counts.sum() == finite.sum()
+
+
+def test_hex_bin_edge_cases() -> None:
+    with pytest.raises(ValueError, match="Unknown reduce_func='mode'"):
+        pmv.scatter.hex_bin([0, 1], [0, 1], reduce_func="mode")  # type: ignore[arg-type]
+
+    # no finite points gives empty arrays
+    assert all(len(arr) == 0 for arr in pmv.scatter.hex_bin([np.nan], [0]))
+
+
+@pytest.mark.parametrize("gridsize", [3, 8])
+def test_hex_bin_matches_matplotlib_at_edges(gridsize: int) -> None:
+    """Test points on the data range edges are counted in the same hexagons as
+    plt.hexbin.
+    """
+    plt = pytest.importorskip("matplotlib.pyplot")
+
+    grid = np.linspace(0, 1, 7)
+    xs = np.r_[np.repeat(grid, len(grid)), np_rng.random(200)]
+    ys = np.r_[np.tile(grid, len(grid)), np_rng.random(200)]
+
+    hex_x, hex_y, counts = pmv.scatter.hex_bin(xs, ys, gridsize=gridsize)
+    fig, ax = plt.subplots()
+    poly_coll = ax.hexbin(xs, ys, gridsize=gridsize, mincnt=1)
+    plt.close(fig)
+
+    mpl_offsets, mpl_counts = poly_coll.get_offsets(), poly_coll.get_array()
+    actual = sorted(zip(hex_x.round(9), hex_y.round(9), counts, strict=True))
+    expected = sorted(zip(*mpl_offsets.round(9).T, np.asarray(mpl_counts), strict=True))
+    assert actual == expected
+
+
 def test_density_hexbin_with_hist(df_or_arrays: DfOrArrays) -> None:
     """Test density_hexbin_with_hist function."""
     df, x, y = df_or_arrays
@@ -129,6 +229,24 @@ def test_density_hexbin_with_hist(df_or_arrays: DfOrArrays) -> None:
     assert isinstance(fig, go.Figure)
 
 
+def test_density_hexbin_with_hist_binned_marginals() -> None:
+    """Test marginals are pre-binned bars that skip NaNs and don't grow with N."""
+    xs, ys = np_rng.normal(size=(2, 2_000))
+    xs[0] = np.nan
+    fig = pmv.density_hexbin_with_hist(xs, ys, bins=20)
+
+    hist_x, hist_y = (trace for trace in fig.data if trace.type == "bar")
+    assert len(hist_x.x) == len(hist_y.y) == 20
+    assert hist_x.y.sum() == len(xs) - 1
+    assert hist_y.x.sum() == len(ys)
+    assert fig.layout.bargap == 0
+
+    xs_big, ys_big = np_rng.normal(size=(2, 20_000))
+    fig_big = pmv.density_hexbin_with_hist(xs_big, ys_big, bins=20)
+    marginals_big = [trace for trace in fig_big.data if trace.type == "bar"]
+    assert len(str(marginals_big)) < 1.1 * len(str([hist_x, hist_y]))
+
+
 @pytest.mark.parametrize(
     ("log_density", "stats", "bin_counts_col", "n_bins", "kwargs"),
     [
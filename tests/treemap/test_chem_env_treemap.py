@@ -112,18 +112,16 @@ def test_chem_env_treemap_crystal_nn_analysis_error() -> None:
 
     with (
         patch("pymatviz.treemap.chem_env.normalize_structures") as mock_norm,
-        patch("pymatgen.analysis.local_env.CrystalNN") as mock_crystal_nn,
+        patch("pymatviz.chem_env.get_crystal_nn_info") as mock_get_nn_info,
         patch(
             "pymatviz.chem_env.classify_local_env_with_order_params"
         ) as mock_classify,
     ):
         mock_norm.return_value.values.return_value = [mock_structure]
-        mock_crystal_nn_instance = MagicMock()
-        mock_crystal_nn.return_value = mock_crystal_nn_instance
 
         # Make classify_local_env_with_order_params raise ImportError
         mock_classify.side_effect = ImportError("Order parameters not available")
-        mock_crystal_nn_instance.get_nn_info.return_value = [{"site": MagicMock()}]
+        mock_get_nn_info.return_value = [{"site": MagicMock()}]
 
         # The function should catch the ImportError and return an empty figure
         with pytest.warns(UserWarning, match="CrystalNN analysis failed"):
@@ -140,16 +138,12 @@ def test_chem_env_treemap_crystal_nn_outer_try_catch() -> None:
 
     with (
         patch("pymatviz.treemap.chem_env.normalize_structures") as mock_norm,
-        patch("pymatgen.analysis.local_env.CrystalNN") as mock_crystal_nn,
+        patch("pymatviz.chem_env.get_crystal_nn_info") as mock_get_nn_info,
     ):
         mock_norm.return_value.values.return_value = [mock_structure]
-        mock_crystal_nn_instance = MagicMock()
-        mock_crystal_nn.return_value = mock_crystal_nn_instance
 
         # Make get_nn_info raise RuntimeError (inner try-catch coverage)
-        mock_crystal_nn_instance.get_nn_info.side_effect = RuntimeError(
-            "CrystalNN analysis failed"
-        )
+        mock_get_nn_info.side_effect = RuntimeError("CrystalNN analysis failed")
 
         # The function should catch the RuntimeError and return an empty figure
         with pytest.warns(UserWarning, match="CrystalNN analysis failed for structure"):
@@ -447,21 +441,19 @@ def test_chem_env_treemap_crystal_nn_alias(mock_structure: MagicMock) -> None:
 
     with (
         patch("pymatviz.treemap.chem_env.normalize_structures") as mock_norm,
-        patch("pymatgen.analysis.local_env.CrystalNN") as mock_crystal_nn,
+        patch("pymatviz.chem_env.get_crystal_nn_info") as mock_get_nn_info,
         patch(
             "pymatviz.chem_env.classify_local_env_with_order_params"
         ) as mock_classify,
     ):
         mock_norm.return_value.values.return_value = [mock_structure]
-        mock_crystal_nn_instance = MagicMock()
-        mock_crystal_nn.return_value = mock_crystal_nn_instance
         mock_neighbor = MagicMock()
-        mock_crystal_nn_instance.get_nn_info.return_value = [{"site": mock_neighbor}]
+        mock_get_nn_info.return_value = [{"site": mock_neighbor}]
         mock_classify.return_value = "CN:1"
 
         fig = chem_env_treemap(mock_structure, chem_env_settings="crystal_nn")
         assert isinstance(fig, go.Figure)
-        mock_crystal_nn.assert_called_once()
+        mock_get_nn_info.assert_called_once_with(mock_structure, 0)
 
 
 def test_chem_env_treemap_invalid_show_counts(mock_structure: MagicMock) -> None:
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import base64
 from typing import TYPE_CHECKING
 
+import numpy as np
+import plotly.graph_objects as go
 import pytest
 
 import pymatviz as pmv
@@ -180,3 +183,42 @@ def test_contrast_ratio() -> None:
 
     # Test that order doesn't matter
     assert abs(contrast_ratio("red", "white") - contrast_ratio("white", "red")) < 0.1
+
+
+def test_to_typed_arrays() -> None:
+    """Test numeric trace arrays get base64-encoded while info arrays, strings and
+    the input dict are left alone.
+    """
+    fig = go.Figure(go.Scatter(x=[0.5, 1.5], y=np.array([1, 2]), text=["a", "b"]))
+    fig.add_heatmap(z=[[1.5, 2], [3, 4]], colorscale=[[0, "red"], [1, "blue"]])
+    fig.add_pie(values=[1, 2**40], domain=dict(x=[0, 0.3]))
+    fig.frames = [go.Frame(data=[go.Scatter(y=[1.0, 2.0])])]
+    fig_dict = fig.to_dict()
+
+    def decode(spec: dict[str, str]) -> np.ndarray:
+        arr = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=spec["dtype"])
+        if shape := spec.get("shape"):
+            arr = arr.reshape([int(dim) for dim in shape.split(",")])
+        return arr
+
+    for float32 in (False, True):
+        encoded = pmv.utils.to_typed_arrays(fig_dict, float32=float32)
+        scatter, heatmap, pie = encoded["data"]
+        float_dtype = "f4" if float32 else "f8"
+
+        assert scatter["x"]["dtype"] == float_dtype
+        assert decode(scatter["x"]).tolist() == [0.5, 1.5]
+        assert decode(scatter["y"]).tolist() == [1, 2]
+        assert scatter["text"] == ["a", "b"]
+        assert heatmap["z"]["dtype"] == float_dtype
+        assert heatmap["z"]["shape"] == "2, 2"
+        assert decode(heatmap["z"]).tolist() == [[1.5, 2], [3, 4]]
+        assert heatmap["colorscale"] == [[0, "red"], [1, "blue"]]
+        # int64 beyond int32/uint32 range stays a list, info arrays are never encoded
+        assert pie["values"] == [1, 2**40]
+        assert pie["domain"] == {"x": [0, 0.3]}
+        assert decode(encoded["frames"][0]["data"][0]["y"]).tolist() == [1, 2]
+
+    # input dict is unchanged
+    assert fig_dict["data"][0]["x"] == [0.5, 1.5]
+    assert fig_dict["frames"][0]["data"][0]["y"] == [1.0, 2.0]